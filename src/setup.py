@@ -34,7 +34,11 @@ setup(
         'spaceone-core',
         'spaceone-api',
         'spaceone-tester',
-        'schematics'
+        'schematics',
+        'cryptography'
     ],
+    extras_require={
+        'fast': ['orjson', 'ijson']
+    },
     zip_safe=False,
 )
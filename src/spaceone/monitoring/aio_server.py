@@ -0,0 +1,76 @@
+"""
+asyncio (grpc.aio) server for the Event and Webhook plugin APIs
+
+    python -m spaceone.monitoring.aio_server -p 50051 [-c config.yml]
+
+One event loop holds the connections and the parse work runs in a thread pool of AIO_SERVER.max_workers,
+so the number of concurrent streams is no longer bound by the number of threads.
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+from concurrent.futures import ThreadPoolExecutor
+
+import grpc
+from spaceone.api.monitoring.plugin import event_pb2_grpc, webhook_pb2_grpc
+from spaceone.core import config
+from spaceone.monitoring.api.plugin.aio import AsyncEvent, AsyncWebhook
+from spaceone.monitoring.libs.service_config import load_service_config
+
+# Named after the module, not __name__, so that LOG of the config also applies under python -m
+_LOGGER = logging.getLogger('spaceone.monitoring.aio_server')
+
+_DEFAULT_CONFIG = {
+    'max_workers': 10,
+    'max_concurrent_rpcs': 1000,
+    'shutdown_grace': 10
+}
+
+
+async def serve(port, **overrides):
+    conf = dict(_DEFAULT_CONFIG, **config.get_global('AIO_SERVER', {}))
+    conf.update({key: value for key, value in overrides.items() if value is not None})
+
+    executor = ThreadPoolExecutor(max_workers=conf['max_workers'], thread_name_prefix='aio-parse')
+    server = grpc.aio.server(maximum_concurrent_rpcs=conf['max_concurrent_rpcs'])
+
+    event_pb2_grpc.add_EventServicer_to_server(AsyncEvent(executor), server)
+    webhook_pb2_grpc.add_WebhookServicer_to_server(AsyncWebhook(executor), server)
+    server.add_insecure_port(f'[::]:{port}')
+
+    await server.start()
+    _LOGGER.info(f'[aio_server] listening on {port} (max_workers = {conf["max_workers"]}, '
+                 f'max_concurrent_rpcs = {conf["max_concurrent_rpcs"]})')
+
+    stopped = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stopped.set)
+
+    await stopped.wait()
+    _LOGGER.info(f'[aio_server] shutting down (grace = {conf["shutdown_grace"]}s)')
+    await server.stop(conf['shutdown_grace'])
+    executor.shutdown(wait=True)
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(description='asyncio gRPC server of spaceone.monitoring')
+    parser.add_argument('-p', '--port', type=int, default=50051)
+    parser.add_argument('-c', '--config-file', help='config file, its GLOBAL section overrides global_conf')
+    parser.add_argument('--max-workers', type=int, help='threads that run the parse work')
+    parser.add_argument('--max-concurrent-rpcs', type=int, help='RPCs in flight before new ones are rejected')
+    return parser
+
+
+def main():
+    args = get_parser().parse_args()
+
+    load_service_config(args.config_file, port=args.port)
+
+    asyncio.run(serve(args.port, max_workers=args.max_workers, max_concurrent_rpcs=args.max_concurrent_rpcs))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+import asyncio
+
+from spaceone.api.monitoring.plugin import event_pb2_grpc, webhook_pb2_grpc
+from spaceone.monitoring.api.plugin.event import Event
+from spaceone.monitoring.api.plugin.webhook import Webhook
+
+__all__ = ['AsyncEvent', 'AsyncWebhook']
+
+
+class _ExecutorAbort(Exception):
+    pass
+
+
+class _ExecutorContext(object):
+    """
+    Synchronous view of a grpc.aio context for handlers running in the executor.
+    abort() is recorded and replayed on the event loop, every other call goes to the aio context.
+    """
+
+    def __init__(self, context):
+        self._context = context
+        self._metadata = context.invocation_metadata()
+        self.aborted = None
+
+    def invocation_metadata(self):
+        return self._metadata
+
+    def abort(self, code, details):
+        self.aborted = (code, details)
+        raise _ExecutorAbort(details)
+
+    def __getattr__(self, name):
+        return getattr(self._context, name)
+
+
+class _AsyncServicer(object):
+    """
+    Run the synchronous servicer methods (BaseAPI -> Service -> Manager) in the executor,
+    so the event loop only holds the streams and never parses.
+    """
+
+    def __init__(self, servicer, executor):
+        self._servicer = servicer
+        self._executor = executor
+
+    async def _run(self, method_name, request, context):
+        loop = asyncio.get_running_loop()
+        executor_context = _ExecutorContext(context)
+
+        try:
+            return await loop.run_in_executor(self._executor, getattr(self._servicer, method_name),
+                                              request, executor_context)
+        except _ExecutorAbort:
+            await context.abort(*executor_context.aborted)
+
+
+class AsyncEvent(_AsyncServicer, event_pb2_grpc.EventServicer):
+
+    def __init__(self, executor):
+        super().__init__(Event(), executor)
+
+    async def parse(self, request, context):
+        return await self._run('parse', request, context)
+
+
+class AsyncWebhook(_AsyncServicer, webhook_pb2_grpc.WebhookServicer):
+
+    def __init__(self, executor):
+        super().__init__(Webhook(), executor)
+
+    async def init(self, request, context):
+        return await self._run('init', request, context)
+
+    async def verify(self, request, context):
+        return await self._run('verify', request, context)
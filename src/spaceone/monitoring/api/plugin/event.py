@@ -1,5 +1,6 @@
 from spaceone.api.monitoring.plugin import event_pb2, event_pb2_grpc
 from spaceone.core.pygrpc import BaseAPI
+from spaceone.monitoring.libs import batch_envelope, metrics
 
 
 class Event(BaseAPI, event_pb2_grpc.EventServicer):
@@ -11,4 +12,10 @@ class Event(BaseAPI, event_pb2_grpc.EventServicer):
         params, metadata = self.parse_request(request, context)
 
         with self.locator.get_service('EventService', metadata) as event_service:
-            return self.locator.get_info('EventsInfo', event_service.parse(params))
\ No newline at end of file
+            if batch_envelope.is_batch(params.get('data')):
+                # The records are parsed while they are encoded, the stages of each record are measured inside
+                return self.locator.get_info('BatchEventsInfo', event_service.parse_batch(params))
+
+            events = event_service.parse(params)
+            with metrics.stage('encode'):
+                return self.locator.get_info('EventsInfo', events)
@@ -1,5 +1,113 @@
 CONNECTORS = {
-    'GoogleCloudConnector': {}
+    'GoogleCloudConnector': {},
+    'SNSConnector': {
+        'connect_timeout': 3,
+        'read_timeout': 5,
+        'retries': 3,
+        'backoff_factor': 0.5,
+        'pool_maxsize': 10
+    }
+}
+
+SUBSCRIPTION_CONFIRM = {
+    'max_workers': 4,
+    'max_pending': 100,
+    'dedup_ttl': 3600,
+    'dedup_max_size': 1024
+}
+
+# Verify Signature (SignatureVersion 1 and 2) of every SNS envelope before parsing it
+# Public keys of SigningCertURL are cached up to cert_cache_size for cert_ttl seconds,
+# SigningCertURL must match one of allowed_schemes and allowed_hosts (regular expressions)
+SIGNATURE_VERIFICATION = {
+    'enabled': False,
+    'allowed_schemes': ['https'],
+    'allowed_hosts': [r'^sns\.[a-z0-9-]+\.amazonaws\.com(\.cn)?$'],
+    'cert_cache_size': 64,
+    'cert_ttl': 86400
+}
+
+# Idempotency cache keyed by SNS MessageId
+# replay: 'cached' returns the previous result again, 'empty' returns no events for a redelivered message
+MESSAGE_CACHE = {
+    'enabled': True,
+    'max_size': 10000,
+    'ttl': 3600,
+    'replay': 'cached'
+}
+
+# Hard limits of the SNS Message, a message over a limit fails with ERROR_MESSAGE_LIMIT_EXCEEDED
+# Messages over incremental_threshold bytes are read incrementally (requires ijson),
+# keeping only the top-level fields the managers read
+MESSAGE_LIMITS = {
+    'max_bytes': 1048576,
+    'max_array_length': 10000,
+    'incremental_threshold': 65536
+}
+
+# Drop CloudWatch events whose event_key and state were already emitted within the window (seconds)
+# Off by default, enabling it changes which events a deployment receives
+EVENT_SUPPRESSION = {
+    'enabled': False,
+    'window': 300,
+    'max_size': 10000
+}
+
+# Webhook options (filters, severity_mapping, title_template, field_overrides, ...) are compiled once per distinct content
+# and kept up to cache_size for ttl seconds
+EVENT_RULES = {
+    'cache_size': 256,
+    'ttl': 3600
+}
+
+# Defaults for CloudWatch alarms, webhook options with the same keys override them
+#   aggregate_dimensions: emit one event per alarm transition with every dimension listed in additional_info
+CLOUDWATCH_EVENT = {
+    'aggregate_dimensions': False
+}
+
+# Defaults for AWS Health events, webhook options with the same keys override them
+#   affected_entities_limit: max number of affected entities kept in the description / additional_info / events
+#   split_affected_entities: emit one event per affected entity instead of one event per Health event
+HEALTH_EVENT = {
+    'affected_entities_limit': 100,
+    'split_affected_entities': False
+}
+
+# asyncio gRPC server (python -m spaceone.monitoring.aio_server), parse work runs in max_workers threads
+AIO_SERVER = {
+    'max_workers': 10,
+    'max_concurrent_rpcs': 1000,
+    'shutdown_grace': 10
+}
+
+# Pre-fork server (python -m spaceone.monitoring.prefork_server), workers: 0 uses one worker per CPU
+# A worker that dies within ready_delay seconds of its start is restarted with an exponential delay
+PREFORK_SERVER = {
+    'workers': 0,
+    'restart_delay': 1,
+    'max_restart_delay': 30,
+    'ready_delay': 5,
+    'shutdown_grace': 15
+}
+
+# Per-stage parse metrics, served in Prometheus text format on <port>/metrics
+# and/or logged every log_interval seconds. Pre-fork workers serve them on <port + worker id>
+METRICS = {
+    'enabled': False,
+    'port': 9102,
+    'log_interval': 0
+}
+
+# cProfile one parse in every sample_rate into rotating files under output_dir, with slowest.json of recent requests
+# AWS_SNS_WEBHOOK_PROFILE_RATE / AWS_SNS_WEBHOOK_PROFILE_DIR environment variables override it without redeploying
+PROFILER = {
+    'enabled': False,
+    'sample_rate': 1000,
+    'output_dir': '/tmp/aws-sns-webhook-profile',
+    'max_files': 50,
+    'slowest_size': 20,
+    'slowest_window': 3600
 }
 
 LOG = {
@@ -0,0 +1,6 @@
+from spaceone.monitoring.libs.lazy_import import lazy_exports
+
+__all__ = ['SNSConnector']
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'SNSConnector': 'spaceone.monitoring.connector.sns_connector'
+})
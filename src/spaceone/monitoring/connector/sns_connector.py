@@ -0,0 +1,73 @@
+import logging
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from spaceone.core.connector import BaseConnector
+from spaceone.monitoring.error.event import ERROR_SUBSCRIPTION_CONFIRM, ERROR_SIGNING_CERTIFICATE
+
+__all__ = ['SNSConnector']
+
+_LOGGER = logging.getLogger(__name__)
+
+_DEFAULT_CONFIG = {
+    'connect_timeout': 3,
+    'read_timeout': 5,
+    'retries': 3,
+    'backoff_factor': 0.5,
+    'pool_maxsize': 10
+}
+
+_SESSIONS = {}
+_SESSION_LOCK = threading.Lock()
+
+
+class SNSConnector(BaseConnector):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sns_config = dict(_DEFAULT_CONFIG, **(self.config or {}))
+        self.timeout = (self.sns_config['connect_timeout'], self.sns_config['read_timeout'])
+        self.session = _get_session(self.sns_config)
+
+    def confirm_subscription(self, subscribe_url):
+        response = self.session.get(subscribe_url, timeout=self.timeout)
+        _LOGGER.debug(f'[Confirm_URL: SubscribeURL] {subscribe_url}')
+        _LOGGER.debug(f'[AWS SNS: Status]: {response.status_code}, {response.content}')
+
+        if response.status_code != 200:
+            raise ERROR_SUBSCRIPTION_CONFIRM(status_code=response.status_code)
+
+        return response.status_code
+
+    def get_signing_certificate(self, cert_url):
+        response = self.session.get(cert_url, timeout=self.timeout)
+        _LOGGER.debug(f'[SigningCertURL] {cert_url} ({response.status_code})')
+
+        if response.status_code != 200:
+            raise ERROR_SIGNING_CERTIFICATE(status_code=response.status_code)
+
+        return response.content
+
+
+def _get_session(sns_config):
+    """ Keep-alive session shared by every connector instance with the same config in the process """
+    session_key = tuple(sorted(sns_config.items()))
+
+    if session_key not in _SESSIONS:
+        with _SESSION_LOCK:
+            if session_key not in _SESSIONS:
+                retry = Retry(total=sns_config['retries'],
+                              backoff_factor=sns_config['backoff_factor'],
+                              status_forcelist=[429, 500, 502, 503, 504],
+                              raise_on_status=False)
+                adapter = HTTPAdapter(pool_maxsize=sns_config['pool_maxsize'], max_retries=retry)
+
+                session = requests.Session()
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _SESSIONS[session_key] = session
+
+    return _SESSIONS[session_key]
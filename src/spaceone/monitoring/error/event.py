@@ -6,12 +6,32 @@ class ERROR_NOT_TITLE(ERROR_INVALID_ARGUMENT):
 
 
 class ERROR_PARSE_EVENT(ERROR_BASE):
-    _message = 'Failed to parse event (field)'
+    _message = 'Failed to parse event (field = {field})'
 
 
 class ERROR_GET_JSON_MESSAGE(ERROR_BASE):
     _message = 'Failed to get json (raw_json)'
 
 
-class ERROR_NOT_DECISION_MANAGER(ERROR_BASE):
+class ERROR_NOT_DECISION_MANAGER(ERROR_INVALID_ARGUMENT):
     _message = 'The received data type is a data type that is not currently supported.'
+
+
+class ERROR_INVALID_EVENT_FIELD(ERROR_INVALID_ARGUMENT):
+    _message = 'Invalid event field (key = {key}, reason = {reason})'
+
+
+class ERROR_SUBSCRIPTION_CONFIRM(ERROR_BASE):
+    _message = 'Failed to confirm SNS subscription (status_code = {status_code})'
+
+
+class ERROR_SIGNING_CERTIFICATE(ERROR_BASE):
+    _message = 'Failed to get SNS signing certificate (status_code = {status_code})'
+
+
+class ERROR_INVALID_SNS_SIGNATURE(ERROR_INVALID_ARGUMENT):
+    _message = 'Invalid SNS message signature (reason = {reason})'
+
+
+class ERROR_MESSAGE_LIMIT_EXCEEDED(ERROR_INVALID_ARGUMENT):
+    _message = 'SNS message exceeds the MESSAGE_LIMITS (reason = {reason})'
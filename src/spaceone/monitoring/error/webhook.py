@@ -1,2 +1,5 @@
 from spaceone.core.error import *
 
+
+class ERROR_INVALID_WEBHOOK_OPTIONS(ERROR_INVALID_ARGUMENT):
+    _message = 'Invalid webhook options (key = {key}, reason = {reason})'
@@ -1,3 +1,10 @@
-from spaceone.monitoring.info.common_info import *
-from spaceone.monitoring.info.webhook_info import *
-from spaceone.monitoring.info.event_info import *
\ No newline at end of file
+from spaceone.monitoring.libs.lazy_import import lazy_exports
+
+__all__ = ['EmptyInfo', 'WebhookPluginInfo', 'EventInfo', 'EventsInfo', 'BatchEventsInfo']
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'EmptyInfo': 'spaceone.monitoring.info.common_info',
+    'WebhookPluginInfo': 'spaceone.monitoring.info.webhook_info',
+    'EventInfo': 'spaceone.monitoring.info.event_info',
+    'EventsInfo': 'spaceone.monitoring.info.event_info',
+    'BatchEventsInfo': 'spaceone.monitoring.info.event_info'
+})
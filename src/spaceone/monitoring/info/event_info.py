@@ -1,28 +1,46 @@
 import functools
+import itertools
+
 from spaceone.core import utils
 from spaceone.api.monitoring.plugin import event_pb2
-from spaceone.monitoring.model.cloudwatch_event_response_model import EventModel
-from spaceone.core.pygrpc.message_type import *
 
-__all__ = ['EventInfo', 'EventsInfo']
+__all__ = ['EventInfo', 'EventsInfo', 'BatchEventsInfo']
+
+
+def EventInfo(event_Info_data: dict):
+    """ Encode an event straight into event_pb2.EventInfo """
+
+    info = event_pb2.EventInfo(
+        event_key=event_Info_data['event_key'],
+        event_type=event_Info_data['event_type'],
+        description=event_Info_data.get('description'),
+        title=event_Info_data['title'],
+        severity=event_Info_data['severity'],
+        rule=event_Info_data.get('rule'),
+        occurred_at=utils.datetime_to_iso8601(event_Info_data.get('occurred_at')),
+        provider=event_Info_data.get('provider'),
+        account=event_Info_data.get('account')
+    )
+
+    if resource := event_Info_data['resource']:
+        info.resource.update(resource)
 
+    if additional_info := event_Info_data.get('additional_info'):
+        info.additional_info.update(additional_info)
 
-def EventInfo(event_Info_data: EventModel):
-    info = {
-        'event_key': event_Info_data['event_key'],
-        'event_type': event_Info_data['event_type'],
-        'description': event_Info_data.get('description'),
-        'title': event_Info_data['title'],
-        'severity': event_Info_data['severity'],
-        'resource': change_struct_type(event_Info_data['resource']),
-        'rule': event_Info_data.get('rule'),
-        'occurred_at': utils.datetime_to_iso8601(event_Info_data.get('occurred_at')),
-        'provider': event_Info_data.get('provider'),
-        'account': event_Info_data.get('account'),
-        'additional_info': change_struct_type(event_Info_data.get('additional_info'))
-    }
-    return event_pb2.EventInfo(**info)
+    return info
 
 
 def EventsInfo(event_Info_vos, **kwargs):
     return event_pb2.EventsInfo(results=list(map(functools.partial(EventInfo, **kwargs), event_Info_vos)))
+
+
+def BatchEventsInfo(batch_results, **kwargs):
+    """
+    Events of every record in order, with an ERROR event for every failed record.
+    batch_results is consumed as it is encoded, no list of the records is built.
+    """
+
+    return EventsInfo(itertools.chain.from_iterable(batch_result.get('events', []) for batch_result in batch_results),
+                      **kwargs)
+
@@ -0,0 +1,96 @@
+"""
+Batched envelope shapes that carry many SNS messages in one request
+
+    {"Batch": [<SNS envelope>, ...]}
+        plain list of SNS envelopes
+
+    {"Records": [{"eventSource": "aws:sqs", "messageId": ..., "body": "<SNS envelope or raw message>"}, ...]}
+        SQS batch, the body is an SNS envelope or the message itself with raw message delivery
+
+    {"Records": [{"EventSource": "aws:sns", "Sns": <SNS envelope>}, ...]}
+        SNS batch in the Lambda event format
+
+    {"Records": [<EventBridge event>, ...]}
+        EventBridge pipe batch, every record is the message itself.
+        The data of a request is a Struct, so a pipe that sends a bare array must wrap it under "Records".
+
+Records are converted one at a time, so a large batch never exists twice in memory.
+"""
+
+from spaceone.monitoring.libs import json_codec
+
+__all__ = ['is_batch', 'iter_envelopes']
+
+_BATCH_KEYS = ('Batch', 'Records')
+
+# Lambda spells the URLs of the SNS envelope differently from the HTTP(S) delivery
+_SNS_RECORD_KEYS = {
+    'SigningCertUrl': 'SigningCertURL',
+    'UnsubscribeUrl': 'UnsubscribeURL'
+}
+
+
+def is_batch(data):
+    return isinstance(data, dict) and any(isinstance(data.get(key), list) for key in _BATCH_KEYS)
+
+
+def iter_envelopes(data):
+    """
+    Yields:
+        (index, message_id, envelope or the exception that prevented to read the record)
+    """
+
+    for index, record in enumerate(_get_records(data)):
+        try:
+            envelope = _to_envelope(record)
+        except Exception as e:
+            yield index, _get_record_id(record), e
+        else:
+            yield index, envelope.get('MessageId', '') or _get_record_id(record), envelope
+
+
+def _get_records(data):
+    for key in _BATCH_KEYS:
+        if isinstance(records := data.get(key), list):
+            return records
+
+    return []
+
+
+def _to_envelope(record):
+    if not isinstance(record, dict):
+        raise ValueError(f'record must be an object: {type(record).__name__}')
+
+    if 'body' in record and record.get('eventSource', 'aws:sqs') == 'aws:sqs':
+        return _sqs_to_envelope(record)
+
+    if isinstance(sns := record.get('Sns'), dict):
+        return {_SNS_RECORD_KEYS.get(key, key): value for key, value in sns.items()}
+
+    # SNS envelopes of a "Batch" and EventBridge events are passed as they are
+    return record
+
+
+def _sqs_to_envelope(record):
+    body = record['body']
+    envelope = json_codec.loads(body) if isinstance(body, str) else body
+
+    if not isinstance(envelope, dict):
+        raise ValueError('SQS body must be a JSON object')
+
+    if 'Type' in envelope and 'Message' in envelope:
+        return envelope
+
+    # Raw message delivery, keep the body as a string so that the route can be sniffed before decoding
+    return {
+        'Type': 'Notification',
+        'MessageId': record.get('messageId', ''),
+        'Message': body if isinstance(body, str) else json_codec.dumps(body)
+    }
+
+
+def _get_record_id(record):
+    if not isinstance(record, dict):
+        return ''
+
+    return record.get('messageId') or record.get('MessageId') or record.get('id') or ''
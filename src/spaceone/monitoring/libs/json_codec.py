@@ -0,0 +1,34 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+__all__ = ['loads', 'dumps', 'BACKEND']
+
+BACKEND = 'orjson' if orjson else 'json'
+
+
+def loads(data):
+    """ Decode with orjson when it is installed, stdlib json otherwise """
+
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than stdlib (e.g. integers over 64 bits), let stdlib decide
+            pass
+
+    return json.loads(data)
+
+
+def dumps(obj, sort_keys=False):
+    if orjson is not None:
+        option = orjson.OPT_SORT_KEYS if sort_keys else None
+        try:
+            return orjson.dumps(obj, option=option).decode('utf-8')
+        except TypeError:
+            pass
+
+    return json.dumps(obj, sort_keys=sort_keys)
@@ -0,0 +1,31 @@
+import importlib
+import sys
+
+__all__ = ['lazy_exports']
+
+
+def lazy_exports(package_name, exports):
+    """
+    Module level __getattr__ and __dir__ (PEP 562) for a package whose exports are imported on first access.
+
+    Args:
+        package_name: __name__ of the package
+        exports: {exported name: module that defines it}
+
+    Usage:
+        __getattr__, __dir__ = lazy_exports(__name__, {'EventManager': '...cloudwatch_event_manager'})
+    """
+
+    def __getattr__(name):
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f'module {package_name!r} has no attribute {name!r}')
+
+        value = getattr(importlib.import_module(module_name), name)
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package_name])) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,157 @@
+"""
+Decode the SNS Message with bounded memory
+
+Messages up to incremental_threshold bytes are decoded at once with json_codec. Their arrays are only walked
+for max_array_length when the message has enough commas to hold an array that long.
+Larger messages are read with ijson event by event:
+    - only the top-level fields in `fields` are built, the others (e.g. "resources" of a Health event) are skipped
+    - an array longer than max_array_length fails before the rest of it is built
+
+Without ijson every message is decoded at once and the same limits are checked on the result.
+"""
+
+import importlib.util
+import re
+
+from spaceone.monitoring.libs import json_codec
+
+__all__ = ['MessageLimitExceeded', 'read_message', 'get_size', 'INCREMENTAL']
+
+# ijson itself is imported on the first large message, it is not needed at startup
+INCREMENTAL = importlib.util.find_spec('ijson') is not None
+
+_OBJECT_START = re.compile(rb'\s*\{')
+_VALUE_EVENTS = frozenset(['null', 'boolean', 'integer', 'double', 'number', 'string', 'start_map', 'start_array'])
+
+
+class MessageLimitExceeded(ValueError):
+
+    def __init__(self, limit, reason):
+        super().__init__(reason)
+        self.limit = limit
+
+
+def get_size(raw_message):
+    """ Size in UTF-8 bytes, without encoding ASCII strings """
+
+    if isinstance(raw_message, str) and not raw_message.isascii():
+        return len(raw_message.encode('utf-8'))
+
+    return len(raw_message)
+
+
+def read_message(raw_message, fields=None, max_bytes=0, max_array_length=0, incremental_threshold=0):
+    """
+    Args:
+        raw_message (str or bytes): JSON message
+        fields (frozenset or None): top-level fields to keep on the incremental path, None keeps all
+        max_bytes / max_array_length: hard limits, 0 disables the limit
+        incremental_threshold: size from which the message is read incrementally, 0 disables it
+
+    Raises:
+        MessageLimitExceeded
+    """
+
+    size = get_size(raw_message)
+    if max_bytes and size > max_bytes:
+        raise MessageLimitExceeded('max_bytes', f'message has {size} bytes, max_bytes is {max_bytes}')
+
+    if incremental_threshold and size > incremental_threshold:
+        if INCREMENTAL:
+            data = raw_message.encode('utf-8') if isinstance(raw_message, str) else raw_message
+            import ijson
+
+            try:
+                return _read_incremental(ijson, data, fields, max_array_length)
+            except ijson.JSONError as e:
+                # Same exception type as a failed json_codec.loads
+                raise ValueError(f'Invalid JSON message: {e}') from e
+
+        return _read_all(raw_message, fields, max_array_length)
+
+    # An array of more than max_array_length items needs as many commas, most messages cannot hold one
+    if max_array_length and _count_commas(raw_message) < max_array_length:
+        max_array_length = 0
+
+    return _read_all(raw_message, None, max_array_length)
+
+
+def _count_commas(raw_message):
+    return raw_message.count(b',' if isinstance(raw_message, bytes) else ',')
+
+
+def _read_all(raw_message, fields, max_array_length):
+    message = json_codec.loads(raw_message)
+
+    if max_array_length:
+        _check_array_lengths(message, max_array_length)
+
+    if fields is not None and isinstance(message, dict):
+        message = {key: value for key, value in message.items() if key in fields}
+
+    return message
+
+
+def _read_incremental(ijson, data, fields, max_array_length):
+    if not _OBJECT_START.match(data):
+        # Not an object, there are no fields to select and no manager will accept it
+        return _read_all(data, None, max_array_length)
+
+    events = ijson.parse(data, use_float=True)
+    next(events)
+
+    message = {}
+    key = builder = None
+    # Element counts of the open arrays of the current field, None for the open objects
+    containers = []
+
+    for prefix, event, value in events:
+        if not containers:
+            if event == 'map_key':
+                key = value
+                builder = ijson.ObjectBuilder() if fields is None or key in fields else None
+                continue
+            if event == 'end_map':
+                break
+
+        if builder is None:
+            _track_depth(containers, event)
+            continue
+
+        if containers and containers[-1] is not None and event in _VALUE_EVENTS:
+            containers[-1] += 1
+            if max_array_length and containers[-1] > max_array_length:
+                raise MessageLimitExceeded('max_array_length', f'{prefix.rsplit(".item", 1)[0]} has more than '
+                                                               f'{max_array_length} items')
+
+        _track_depth(containers, event)
+        builder.event(event, value)
+
+        if not containers:
+            message[key] = builder.value
+            builder = None
+
+    return message
+
+
+def _track_depth(containers, event):
+    if event == 'start_array':
+        containers.append(0)
+    elif event == 'start_map':
+        containers.append(None)
+    elif event in ('end_array', 'end_map'):
+        containers.pop()
+
+
+def _check_array_lengths(value, max_array_length):
+    stack = [value]
+
+    while stack:
+        value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list):
+            if len(value) > max_array_length:
+                raise MessageLimitExceeded('max_array_length', f'array has {len(value)} items, '
+                                                               f'max_array_length is {max_array_length}')
+            stack.extend(value)
@@ -0,0 +1,236 @@
+import logging
+import threading
+import time
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from spaceone.monitoring.libs.worker import get_worker_id
+
+__all__ = ['configure', 'is_enabled', 'stage', 'inc', 'observe', 'add_collector', 'render']
+
+_LOGGER = logging.getLogger(__name__)
+
+_PREFIX = 'aws_sns_webhook_'
+
+LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 5000)
+
+_configured = False
+_enabled = False
+_lock = threading.Lock()
+_counters = {}
+_histograms = {}
+_collectors = []
+
+
+def configure(enabled=False, port=None, log_interval=0, **kwargs):
+    """
+    Args:
+        enabled: record metrics, all calls are no-ops otherwise
+        port: serve Prometheus text format on http://0.0.0.0:<port>/metrics (<port + worker id> under pre-fork)
+        log_interval: dump the metrics to the log every <log_interval> seconds
+    """
+
+    with _lock:
+        _configure(enabled, port, log_interval)
+
+
+def is_enabled():
+    if not _configured:
+        from spaceone.core import config
+        conf = config.get_global('METRICS', {})
+
+        # Concurrent first requests must not start the HTTP server and the log dump twice
+        with _lock:
+            if not _configured:
+                _configure(**conf)
+
+    return _enabled
+
+
+def stage(name, **labels):
+    """ Context manager that observes the elapsed seconds of a parse stage """
+
+    if not is_enabled():
+        return _NULL_STAGE
+
+    return _Stage(name, labels)
+
+
+def inc(name, value=1, **labels):
+    if not is_enabled():
+        return
+
+    key = (name, tuple(sorted(labels.items())))
+    with _lock:
+        _counters[key] = _counters.get(key, 0) + value
+
+
+def observe(name, value, buckets=COUNT_BUCKETS, **labels):
+    if not is_enabled():
+        return
+
+    key = (name, tuple(sorted(labels.items())))
+    with _lock:
+        if (histogram := _histograms.get(key)) is None:
+            histogram = _histograms[key] = _Histogram(buckets)
+        histogram.observe(value)
+
+
+def add_collector(collector):
+    """ collector() returns {metric_name: value} gauges, evaluated on every render """
+
+    if collector not in _collectors:
+        _collectors.append(collector)
+
+
+def render():
+    """ Prometheus text exposition format """
+
+    lines = []
+
+    with _lock:
+        counters = sorted(_counters.items())
+        histograms = [(key, histogram.snapshot()) for key, histogram in sorted(_histograms.items(),
+                                                                              key=lambda item: item[0])]
+
+    family = None
+    for (name, labels), value in counters:
+        if name != family:
+            family = name
+            lines.append(f'# TYPE {_PREFIX}{name} counter')
+        lines.append(f'{_PREFIX}{name}{_render_labels(labels)} {value}')
+
+    for (name, labels), (buckets, counts, total, count) in histograms:
+        if name != family:
+            family = name
+            lines.append(f'# TYPE {_PREFIX}{name} histogram')
+
+        cumulative = 0
+        for bucket, bucket_count in zip(buckets, counts):
+            cumulative += bucket_count
+            lines.append(f'{_PREFIX}{name}_bucket{_render_labels(labels + (("le", bucket),))} {cumulative}')
+        lines.append(f'{_PREFIX}{name}_bucket{_render_labels(labels + (("le", "+Inf"),))} {count}')
+        lines.append(f'{_PREFIX}{name}_sum{_render_labels(labels)} {total}')
+        lines.append(f'{_PREFIX}{name}_count{_render_labels(labels)} {count}')
+
+    for collector in _collectors:
+        for name, value in collector().items():
+            lines.append(f'# TYPE {_PREFIX}{name} gauge')
+            lines.append(f'{_PREFIX}{name} {value}')
+
+    return '\n'.join(lines) + '\n'
+
+
+class _Histogram(object):
+    __slots__ = ['buckets', 'counts', 'total', 'count']
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.total = 0
+        self.count = 0
+
+    def observe(self, value):
+        index = bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            self.counts[index] += 1
+        self.total += value
+        self.count += 1
+
+    def snapshot(self):
+        return self.buckets, list(self.counts), self.total, self.count
+
+
+class _Stage(object):
+    __slots__ = ['name', 'labels', 'started']
+
+    def __init__(self, name, labels):
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        observe('parse_stage_seconds', time.perf_counter() - self.started, buckets=LATENCY_BUCKETS,
+                stage=self.name, **self.labels)
+
+
+class _NullStage(object):
+    __slots__ = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+def _configure(enabled=False, port=None, log_interval=0, **kwargs):
+    """ Called with _lock held """
+
+    global _configured, _enabled
+
+    _enabled = enabled
+
+    if enabled and port:
+        # Workers of the pre-fork server share the gRPC port, but each serves its own metrics
+        _start_http_server(port + (get_worker_id() or 0))
+
+    if enabled and log_interval:
+        _start_log_dump(log_interval)
+
+    _configured = True
+
+
+def _render_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape_label_value(value)}"' for key, value in labels) + '}'
+
+
+def _escape_label_value(value):
+    """ Backslash, double quote and line feed are escaped in the text format """
+
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _start_http_server(port):
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.rstrip('/') != '/metrics':
+                self.send_error(404)
+                return
+
+            body = render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    try:
+        server = ThreadingHTTPServer(('0.0.0.0', port), MetricsHandler)
+    except OSError as e:
+        _LOGGER.error(f'[metrics] failed to listen on port {port}: {e}')
+        return
+
+    threading.Thread(target=server.serve_forever, name='metrics-http', daemon=True).start()
+    _LOGGER.info(f'[metrics] serving on http://0.0.0.0:{port}/metrics')
+
+
+def _start_log_dump(log_interval):
+    def dump():
+        while True:
+            time.sleep(log_interval)
+            _LOGGER.info(f'[metrics]\n{render()}')
+
+    threading.Thread(target=dump, name='metrics-log', daemon=True).start()
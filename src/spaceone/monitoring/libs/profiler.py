@@ -0,0 +1,192 @@
+import cProfile
+import glob
+import itertools
+import json
+import logging
+import os
+import re
+import threading
+import time
+from datetime import datetime, timezone
+
+from spaceone.monitoring.libs.worker import get_worker_id
+
+__all__ = ['configure', 'sample', 'get_slowest_requests']
+
+_LOGGER = logging.getLogger(__name__)
+
+_ENV_SAMPLE_RATE = 'AWS_SNS_WEBHOOK_PROFILE_RATE'
+_ENV_OUTPUT_DIR = 'AWS_SNS_WEBHOOK_PROFILE_DIR'
+
+_DEFAULT_CONFIG = {
+    'enabled': False,
+    'sample_rate': 1000,
+    'output_dir': '/tmp/aws-sns-webhook-profile',
+    'max_files': 50,
+    'slowest_size': 20,
+    'slowest_window': 3600
+}
+
+_conf = None
+_counter = itertools.count()
+_profile_lock = threading.Lock()
+_slowest_lock = threading.Lock()
+_slowest = []
+
+
+def configure(**kwargs):
+    """
+    Profile one request in every <sample_rate> with cProfile.
+    Environment variables override the config:
+        AWS_SNS_WEBHOOK_PROFILE_RATE=<sample_rate>  (enables profiling, 0 disables it)
+        AWS_SNS_WEBHOOK_PROFILE_DIR=<output_dir>
+    """
+
+    global _conf
+
+    conf = dict(_DEFAULT_CONFIG, **kwargs)
+
+    if (sample_rate := os.environ.get(_ENV_SAMPLE_RATE)) is not None:
+        conf['sample_rate'] = sample_rate
+        conf['enabled'] = True
+
+    # A sample rate below 1 disables profiling, as with the environment variable
+    conf['sample_rate'] = _to_sample_rate(conf['sample_rate'])
+    conf['enabled'] = bool(conf['enabled']) and conf['sample_rate'] > 0
+
+    if output_dir := os.environ.get(_ENV_OUTPUT_DIR):
+        conf['output_dir'] = output_dir
+
+    if (worker_id := get_worker_id()) is not None:
+        conf['output_dir'] = os.path.join(conf['output_dir'], f'worker-{worker_id}')
+
+    if conf['enabled']:
+        os.makedirs(conf['output_dir'], exist_ok=True)
+        _LOGGER.info(f'[profiler] profile 1/{conf["sample_rate"]} requests into {conf["output_dir"]}')
+
+    _conf = conf
+
+
+def sample(raw_data):
+    """
+    Context manager around the parse of one envelope.
+    Set .manager inside the block so that the profile file is tagged with it.
+    """
+
+    if _conf is None:
+        from spaceone.core import config
+        configure(**config.get_global('PROFILER', {}))
+
+    if not _conf['enabled']:
+        return _NULL_SAMPLE
+
+    profile = None
+    if next(_counter) % _conf['sample_rate'] == 0 and _profile_lock.acquire(blocking=False):
+        # Only one cProfile may be active in the process at a time
+        profile = cProfile.Profile()
+
+    return _Sample(raw_data, profile)
+
+
+def get_slowest_requests():
+    """
+    Returns:
+        slowest requests of the last slowest_window seconds, slowest first
+    """
+
+    with _slowest_lock:
+        _prune_slowest(time.time())
+        return [dict(request) for request in _slowest]
+
+
+class _Sample(object):
+    __slots__ = ['message_id', 'size', 'manager', 'profile', 'started']
+
+    def __init__(self, raw_data, profile):
+        raw_message = raw_data.get('Message')
+        self.message_id = raw_data.get('MessageId', '')
+        self.size = len(raw_message) if isinstance(raw_message, str) else 0
+        self.manager = 'unknown'
+        self.profile = profile
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        if self.profile:
+            self.profile.enable()
+        return self
+
+    def __exit__(self, *args):
+        duration = time.perf_counter() - self.started
+
+        if self.profile:
+            try:
+                self.profile.disable()
+                _dump_profile(self, duration)
+            except Exception as e:
+                _LOGGER.error(f'[profiler] failed to write profile: {e}')
+            finally:
+                _profile_lock.release()
+
+        _record_slowest(self, duration)
+
+
+class _NullSample(object):
+    __slots__ = ['manager']
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+_NULL_SAMPLE = _NullSample()
+
+
+def _to_sample_rate(sample_rate):
+    try:
+        return int(sample_rate)
+    except (TypeError, ValueError):
+        # configure() runs on the first parse, an invalid rate must not fail the request
+        _LOGGER.warning(f'[profiler] invalid sample_rate {sample_rate!r}, profiling is disabled')
+        return 0
+
+
+def _dump_profile(request_sample, duration):
+    output_dir = _conf['output_dir']
+    created_at = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%f')
+    message_id = re.sub(r'[^0-9A-Za-z-]', '', request_sample.message_id)[:64] or 'none'
+
+    file_name = f'{created_at}_{request_sample.manager}_{request_sample.size}B_{int(duration * 1e6)}us_{message_id}.prof'
+    request_sample.profile.dump_stats(os.path.join(output_dir, file_name))
+
+    profile_files = sorted(glob.glob(os.path.join(output_dir, '*.prof')))
+    for profile_file in profile_files[:-_conf['max_files']]:
+        os.remove(profile_file)
+
+    with open(os.path.join(output_dir, 'slowest.json'), 'w') as f:
+        json.dump(get_slowest_requests(), f, indent=2)
+
+
+def _record_slowest(request_sample, duration):
+    now = time.time()
+
+    with _slowest_lock:
+        _prune_slowest(now)
+
+        if len(_slowest) >= _conf['slowest_size'] and duration <= _slowest[-1]['duration']:
+            return
+
+        _slowest.append({
+            'message_id': request_sample.message_id,
+            'manager': request_sample.manager,
+            'size': request_sample.size,
+            'duration': duration,
+            'recorded_at': now
+        })
+        _slowest.sort(key=lambda request: request['duration'], reverse=True)
+        del _slowest[_conf['slowest_size']:]
+
+
+def _prune_slowest(now):
+    _slowest[:] = [request for request in _slowest if now - request['recorded_at'] < _conf['slowest_window']]
@@ -0,0 +1,24 @@
+import os
+
+from spaceone.core import config
+from spaceone.core.logger import set_logger
+
+__all__ = ['CONFIG_FILE_ENV', 'load_service_config']
+
+# Same variable as `spaceone grpc -c`
+CONFIG_FILE_ENV = 'SPACEONE_CONFIG_FILE'
+
+
+def load_service_config(config_file=None, port=None):
+    """
+    Configure the process the way `spaceone grpc spaceone.monitoring` does for the entry points of this package:
+    global_conf of the package, then the GLOBAL section of the config file, then LOG.
+    """
+
+    config.init_conf(package='spaceone.monitoring', port=port)
+    config.set_service_config()
+
+    if config_file := config_file or os.environ.get(CONFIG_FILE_ENV):
+        config.set_file_conf(config_file)
+
+    set_logger()
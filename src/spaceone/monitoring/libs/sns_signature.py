@@ -0,0 +1,95 @@
+import base64
+import binascii
+import re
+from urllib.parse import urlsplit
+
+from cryptography import x509
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding
+
+__all__ = ['build_string_to_sign', 'compile_host_patterns', 'is_allowed_cert_url', 'load_public_key',
+           'verify_signature']
+
+# SignatureVersion 1 signs with SHA1withRSA, SignatureVersion 2 with SHA256withRSA
+_HASH_ALGORITHMS = {
+    '1': hashes.SHA1,
+    '2': hashes.SHA256
+}
+
+# Keys of the envelope that are signed, in the order AWS concatenates them
+_CONFIRMATION_KEYS = ('Message', 'MessageId', 'SubscribeURL', 'Timestamp', 'Token', 'TopicArn', 'Type')
+_SIGNED_KEYS = {
+    'Notification': ('Message', 'MessageId', 'Subject', 'Timestamp', 'TopicArn', 'Type'),
+    'SubscriptionConfirmation': _CONFIRMATION_KEYS,
+    'UnsubscribeConfirmation': _CONFIRMATION_KEYS
+}
+_OPTIONAL_KEYS = frozenset(['Subject'])
+
+
+def build_string_to_sign(raw_data):
+    """
+    Build the canonical "key\\nvalue\\n" string SNS signs for the envelope type.
+
+    Raises:
+        ValueError: unsupported Type or a signed key is missing
+    """
+
+    signed_keys = _SIGNED_KEYS.get(raw_data.get('Type'))
+    if signed_keys is None:
+        raise ValueError(f'unsupported message type: {raw_data.get("Type")}')
+
+    lines = []
+    for key in signed_keys:
+        value = raw_data.get(key)
+        if value is None:
+            if key in _OPTIONAL_KEYS:
+                continue
+            raise ValueError(f'{key} is missing')
+
+        lines.append(f'{key}\n{value}\n')
+
+    return ''.join(lines).encode('utf-8')
+
+
+def compile_host_patterns(allowed_hosts):
+    return tuple(re.compile(allowed_host) for allowed_host in allowed_hosts)
+
+
+def is_allowed_cert_url(cert_url, allowed_schemes, host_patterns):
+    """ SigningCertURL must be a .pem served by one of the allowed hosts, otherwise anyone could sign messages """
+
+    try:
+        url = urlsplit(cert_url)
+    except ValueError:
+        return False
+
+    if url.scheme not in allowed_schemes or not url.path.endswith('.pem'):
+        return False
+
+    hostname = url.hostname or ''
+    return any(host_pattern.match(hostname) for host_pattern in host_patterns)
+
+
+def load_public_key(pem):
+    return x509.load_pem_x509_certificate(pem).public_key()
+
+
+def verify_signature(public_key, signature, string_to_sign, signature_version):
+    """
+    Returns:
+        True if the base64 signature matches string_to_sign
+
+    Raises:
+        ValueError: unsupported SignatureVersion
+    """
+
+    algorithm = _HASH_ALGORITHMS.get(str(signature_version))
+    if algorithm is None:
+        raise ValueError(f'unsupported SignatureVersion: {signature_version}')
+
+    try:
+        public_key.verify(base64.b64decode(signature, validate=True), string_to_sign, padding.PKCS1v15(), algorithm())
+        return True
+    except (InvalidSignature, binascii.Error, TypeError):
+        return False
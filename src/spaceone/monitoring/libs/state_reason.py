@@ -0,0 +1,73 @@
+import functools
+import re
+
+__all__ = ['parse_state_reason']
+
+_CACHE_SIZE = 1024
+
+_NUMBER = r'[-+]?(?:\d+(?:\.\d*)?(?:[eE][-+]?\d+)?|NaN|Infinity)'
+
+# 2 out of the last 3 datapoints [17.2 (23/06/21 08:31:00), 16.1 (23/06/21 08:26:00)]
+_DATAPOINTS = re.compile(r'(\d+) out of the last (\d+) datapoints? \[([^\]]*)\]')
+_DATAPOINT = re.compile(rf'({_NUMBER}) \((\d\d)/(\d\d)/(\d\d) (\d\d:\d\d:\d\d)\)')
+
+# was greater than or equal to the threshold (15.0)
+_THRESHOLD = re.compile(rf'(?:was|were) ((?:not )?(?:greater|less) than(?: or equal to)?) the threshold \(({_NUMBER})\)')
+
+# was not less than the lower thresholds [0.41] or not greater than the upper thresholds [0.47]
+_BAND = re.compile(r'(?:was|were) ((?:not )?less than) the lower thresholds? \[([^\]]*)\] '
+                   r'or ((?:not )?greater than) the upper thresholds? \[([^\]]*)\]')
+
+# no datapoints were received for 1 period and 1 missing datapoint was treated as [Breaching]
+_MISSING_DATA = re.compile(r'(\d+) missing datapoints? (?:was|were) treated as \[(\w+)\]')
+
+_NUMBERS = re.compile(_NUMBER)
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def parse_state_reason(reason):
+    """
+    Structured fields of a CloudWatch alarm NewStateReason
+        Threshold Crossed: 1 out of the last 1 datapoints [17.25 (23/06/21 08:31:00)] was greater than
+        the threshold (15.0) (minimum 1 datapoint for OK -> ALARM transition).
+
+    Returns:
+        {
+            'Datapoints': [{'value': 17.25, 'timestamp': '2021-06-23T08:31:00Z'}],
+            'BreachingDatapoints': 1,
+            'EvaluatedDatapoints': 1,
+            'Comparison': 'greater than',
+            'Threshold': 15.0
+        }
+        Anomaly detection bands give LowerThresholds / UpperThresholds instead of Threshold,
+        missing data gives MissingDatapoints / MissingDataTreatedAs.
+        Parts of the text in an unknown format are left out, {} when nothing is recognized.
+        The result is cached, it must not be modified.
+    """
+
+    state_reason = {}
+
+    if not isinstance(reason, str):
+        return state_reason
+
+    if matched := _DATAPOINTS.search(reason):
+        breaching, evaluated, datapoints = matched.groups()
+        state_reason['Datapoints'] = [{'value': float(value), 'timestamp': f'20{year}-{month}-{day}T{clock}Z'}
+                                      for value, day, month, year, clock in _DATAPOINT.findall(datapoints)]
+        state_reason['BreachingDatapoints'] = int(breaching)
+        state_reason['EvaluatedDatapoints'] = int(evaluated)
+
+    if matched := _THRESHOLD.search(reason):
+        state_reason['Comparison'] = matched.group(1)
+        state_reason['Threshold'] = float(matched.group(2))
+    elif matched := _BAND.search(reason):
+        lower_comparison, lower_thresholds, upper_comparison, upper_thresholds = matched.groups()
+        state_reason['Comparison'] = f'{lower_comparison} the lower or {upper_comparison} the upper thresholds'
+        state_reason['LowerThresholds'] = [float(value) for value in _NUMBERS.findall(lower_thresholds)]
+        state_reason['UpperThresholds'] = [float(value) for value in _NUMBERS.findall(upper_thresholds)]
+
+    if matched := _MISSING_DATA.search(reason):
+        state_reason['MissingDatapoints'] = int(matched.group(1))
+        state_reason['MissingDataTreatedAs'] = matched.group(2)
+
+    return state_reason
@@ -0,0 +1,60 @@
+import threading
+import time
+from collections import OrderedDict
+
+__all__ = ['SuppressionIndex']
+
+
+class SuppressionIndex(object):
+    """
+    Remembers which keys were emitted within the last window seconds.
+    Repeats inside the window are counted instead of emitted, and the count is handed back
+    with the first emission after the window closes.
+    Memory is bounded by max_size (least recently emitted keys are evicted first).
+    """
+
+    def __init__(self, window=300, max_size=10000, timer=time.monotonic):
+        self.window = window
+        self.max_size = max_size
+        self.suppressed_total = 0
+        self._timer = timer
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key):
+        """
+        Returns:
+            None if the key must be suppressed,
+            otherwise the number of repeats suppressed since the previous emission
+        """
+
+        now = self._timer()
+
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > now:
+                entry[1] += 1
+                self.suppressed_total += 1
+                return None
+
+            suppressed_count = entry[1] if entry is not None else 0
+            self._data[key] = [now + self.window, 0]
+            self._data.move_to_end(key)
+            self._evict(now)
+
+            return suppressed_count
+
+    def __len__(self):
+        return len(self._data)
+
+    def _evict(self, now):
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+        # Keys are ordered by emission time, so expired keys are always at the front.
+        # They are kept one more window to report their suppressed count.
+        while self._data:
+            key, (window_end, _) = next(iter(self._data.items()))
+            if window_end + self.window > now:
+                break
+            del self._data[key]
@@ -0,0 +1,91 @@
+import functools
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+__all__ = ['parse_iso8601', 'parse_health_time', 'utc_now']
+
+_CACHE_SIZE = 4096
+
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+_UTC_NAMES = ('GMT', 'UTC', 'UT', 'Z')
+
+
+def utc_now():
+    return datetime.now(timezone.utc)
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def parse_iso8601(value):
+    """
+    SNS Timestamp, EventBridge time and CloudWatch StateChangeTime
+        2021-06-27T13:53:39.389Z
+        2016-06-05T06:27:57Z
+        2021-06-10T04:28:46.868+0000
+
+    Returns:
+        timezone-aware datetime in UTC
+    """
+
+    text = value.strip()
+
+    if text[-1] in 'Zz':
+        text = text[:-1] + '+00:00'
+    elif len(text) > 5 and text[-5] in '+-' and text[-3] != ':':
+        text = f'{text[:-2]}:{text[-2:]}'
+
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        parsed = datetime.fromisoformat(_pad_fraction(text))
+
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+
+    return parsed.astimezone(timezone.utc)
+
+
+@functools.lru_cache(maxsize=_CACHE_SIZE)
+def parse_health_time(value):
+    """
+    AWS Health startTime / endTime (RFC 1123)
+        Sat, 04 Jun 2016 05:01:10 GMT
+
+    Returns:
+        timezone-aware datetime in UTC
+    """
+
+    try:
+        _, day, month, year, clock, zone = value.split()
+        if zone in _UTC_NAMES:
+            hour, minute, second = clock.split(':')
+            return datetime(int(year), _MONTHS[month], int(day), int(hour), int(minute), int(second),
+                            tzinfo=timezone.utc)
+    except (ValueError, KeyError):
+        pass
+
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'Invalid date format: {value}')
+
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+
+    return parsed.astimezone(timezone.utc)
+
+
+def _pad_fraction(text):
+    """ datetime.fromisoformat() before python 3.11 accepts only 3 or 6 fractional digits """
+
+    if '.' not in text:
+        raise ValueError(f'Invalid date format: {text}')
+
+    head, tail = text.split('.', 1)
+    digits = len(tail) - len(tail.lstrip('0123456789'))
+    fraction, offset = tail[:digits], tail[digits:]
+
+    return f'{head}.{fraction[:6].ljust(6, "0")}{offset}'
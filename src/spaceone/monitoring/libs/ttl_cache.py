@@ -0,0 +1,94 @@
+import threading
+import time
+from collections import OrderedDict
+
+__all__ = ['TTLCache']
+
+_MISSING = object()
+
+
+class TTLCache(object):
+    """
+    Thread-safe LRU cache whose entries also expire ttl seconds after they were set.
+    The least recently used entry is evicted once max_size is reached.
+    """
+
+    def __init__(self, max_size=1024, ttl=300, timer=time.monotonic):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._timer = timer
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._get(key)
+            if value is _MISSING:
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._set(key, value)
+
+    def add(self, key, value):
+        """ Set the value only if the key is absent or expired, return True when it was set """
+        with self._lock:
+            if self._get(key) is not _MISSING:
+                return False
+
+            self._set(key, value)
+            return True
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._data.pop(key, None)
+            if entry is None or entry[0] <= self._timer():
+                return default
+            return entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._data),
+                'max_size': self.max_size
+            }
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        with self._lock:
+            return self._get(key) is not _MISSING
+
+    def _get(self, key):
+        entry = self._data.get(key)
+        if entry is None:
+            return _MISSING
+
+        if entry[0] <= self._timer():
+            del self._data[key]
+            return _MISSING
+
+        self._data.move_to_end(key)
+        return entry[1]
+
+    def _set(self, key, value):
+        self._data[key] = (self._timer() + self.ttl, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
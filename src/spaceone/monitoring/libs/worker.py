@@ -0,0 +1,16 @@
+import os
+
+__all__ = ['WORKER_ID_ENV', 'get_worker_id']
+
+# Set by the pre-fork server (spaceone.monitoring.prefork_server) for each worker process
+WORKER_ID_ENV = 'AWS_SNS_WEBHOOK_WORKER_ID'
+
+
+def get_worker_id():
+    """
+    Returns:
+        index of this worker process (0..N-1) under the pre-fork server, None when it runs alone
+    """
+
+    worker_id = os.environ.get(WORKER_ID_ENV)
+    return int(worker_id) if worker_id else None
@@ -1,2 +1,10 @@
-from spaceone.monitoring.manager.cloudwatch_event_manager import EventManager
-from spaceone.monitoring.manager.phd_event_manager import PersonalHealthDashboardManager
+from spaceone.monitoring.libs.lazy_import import lazy_exports
+
+# Managers (and their models) are imported when the locator asks for them the first time
+__all__ = ['EventManager', 'PersonalHealthDashboardManager', 'SignatureManager', 'SubscriptionManager']
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'EventManager': 'spaceone.monitoring.manager.cloudwatch_event_manager',
+    'PersonalHealthDashboardManager': 'spaceone.monitoring.manager.phd_event_manager',
+    'SignatureManager': 'spaceone.monitoring.manager.signature_manager',
+    'SubscriptionManager': 'spaceone.monitoring.manager.subscription_manager'
+})
@@ -1,22 +1,41 @@
 import logging
 import hashlib
+import itertools
 import json
-from datetime import datetime
+import threading
 
+from spaceone.core import config
 from spaceone.core.manager import BaseManager
+from spaceone.monitoring.manager.event_router import register_route
+from spaceone.monitoring.manager.event_rules import get_event_rules
+from spaceone.monitoring.libs.suppression_index import SuppressionIndex
+from spaceone.monitoring.libs import metrics
+from spaceone.monitoring.libs.state_reason import parse_state_reason
+from spaceone.monitoring.libs.time_parser import parse_iso8601, utc_now
 from spaceone.monitoring.model.cloudwatch_event_response_model import EventModel
+from spaceone.monitoring.model.compiled_model import compile_model
 
 _LOGGER = logging.getLogger(__name__)
 
+_build_event = compile_model(EventModel)
 
+_SUPPRESSION_INDEX = None
+_SUPPRESSION_LOCK = threading.Lock()
+
+
+@register_route(('arn', 'cloudwatch'))
 class EventManager(BaseManager):
+
+    MESSAGE_FIELDS = frozenset(['AlarmName', 'AlarmDescription', 'AWSAccountId', 'NewStateValue', 'NewStateReason',
+                                'StateChangeTime', 'Region', 'AlarmArn', 'OldStateValue', 'Trigger', 'Subject'])
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
     def parse(self, options, message):
-        return self._generate_events(message)
+        return self._generate_events(message, options)
 
-    def _generate_events(self, message):
+    def _generate_events(self, message, options=None):
         events = []
 
         """ MESSAGE Sample1
@@ -103,34 +122,134 @@ class EventManager(BaseManager):
         namespace = self._get_namespace(message)
         account_id = message.get('AWSAccountId', '')
 
-        for dimension in triggered_data.get('Dimensions', []):
-            event_dict = self._generate_event_dict(message, dimension, namespace, region, occurred_at, account_id)
-            _LOGGER.debug(f'[EventManager] parse Event : {event_dict}')
-            events.append(self._evaluate_parsing_data(event_dict))
+        suppression_index = _get_suppression_index()
+        if metrics.is_enabled():
+            metrics.observe('message_dimensions', self._count_dimensions(triggered_data), manager='EventManager')
 
-        for metric in triggered_data.get('Metrics', []):
-            metric_data = metric.get('MetricStat', {}).get('Metric', {})
-            for dimension in metric_data.get('Dimensions', []):
-                event_dict = self._generate_event_dict(message, dimension, namespace, region,
-                                                       occurred_at, account_id)
-                _LOGGER.debug(f'[EventManager] parse Event : {event_dict}')
+        event_rules = get_event_rules(options)
+        rule_attributes = self.get_rule_attributes(message, namespace)
+
+        # Message level fields are shared by every dimension, so they are computed only once
+        shared_event_dict = self._generate_shared_event_dict(message, occurred_at, account_id, event_rules,
+                                                             rule_attributes)
+
+        if event_rules.aggregate_dimensions:
+            dimensions = list(self._iter_unique_dimensions(triggered_data))
+            event_dicts = [self._generate_aggregated_event_dict(shared_event_dict, message, dimensions, namespace,
+                                                                region, occurred_at)] if dimensions else []
+        else:
+            event_dicts = (self._generate_event_dict(shared_event_dict, message, dimension, namespace, region,
+                                                     occurred_at)
+                           for dimension in self._iter_unique_dimensions(triggered_data))
+
+        for event_dict in event_dicts:
+            _LOGGER.debug(f'[EventManager] parse Event : {event_dict}')
+            if self._check_suppression(suppression_index, message, event_dict):
                 events.append(self._evaluate_parsing_data(event_dict))
 
         return events
 
-    def _generate_event_dict(self, message, dimension, namespace, region, occurred_at, account_id):
+    def get_rule_attributes(self, message, namespace=None):
+        """ Attributes that filters, severity_mapping and title_template of the webhook options can refer to """
+
         return {
-            'event_key': self._get_event_key(message, dimension.get('value'), occurred_at),
-            'event_type': self._get_event_type(message),
-            'severity': self._get_severity(message),
-            'resource': self._get_resource_for_event(dimension, namespace, region),
+            'account': message.get('AWSAccountId', ''),
+            'region': message.get('Region', ''),
+            'namespace': self._get_namespace(message) if namespace is None else namespace,
+            'alarm_name': message.get('AlarmName', ''),
+            'metric_name': message.get('Trigger', {}).get('MetricName', ''),
+            'state': message.get('NewStateValue', '')
+        }
+
+    @staticmethod
+    def _iter_unique_dimensions(triggered_data):
+        """
+        Yield dimensions of Trigger.Dimensions and Trigger.Metrics[].MetricStat.Metric.Dimensions
+        in order, skipping the ones already seen with the same (name, value)
+        """
+
+        metric_dimensions = (metric.get('MetricStat', {}).get('Metric', {}).get('Dimensions', [])
+                             for metric in triggered_data.get('Metrics', []))
+
+        seen_dimensions = set()
+        for dimension in itertools.chain(triggered_data.get('Dimensions', []),
+                                         itertools.chain.from_iterable(metric_dimensions)):
+            dimension_key = (dimension.get('name'), dimension.get('value'))
+            if dimension_key not in seen_dimensions:
+                seen_dimensions.add(dimension_key)
+                yield dimension
+
+    @staticmethod
+    def _count_dimensions(triggered_data):
+        dimension_count = len(triggered_data.get('Dimensions', []))
+        for metric in triggered_data.get('Metrics', []):
+            dimension_count += len(metric.get('MetricStat', {}).get('Metric', {}).get('Dimensions', []))
+
+        return dimension_count
+
+    @staticmethod
+    def _check_suppression(suppression_index, message, event_dict):
+        """
+        Drop an event whose event_key and state were already emitted within the suppression window.
+        The number of dropped repeats is reported in additional_info.SuppressedCount of the next emitted one.
+        """
+
+        if suppression_index is None:
+            return True
+
+        suppressed_count = suppression_index.hit(f'{event_dict["event_key"]}:{message.get("NewStateValue")}')
+        if suppressed_count is None:
+            _LOGGER.debug(f'[EventManager] suppress duplicated event : {event_dict["event_key"]}')
+            return False
+
+        if suppressed_count:
+            # additional_info is shared by every dimension of the message
+            event_dict['additional_info'] = dict(event_dict['additional_info'], SuppressedCount=suppressed_count)
+
+        return True
+
+    def _generate_shared_event_dict(self, message, occurred_at, account_id, event_rules, rule_attributes):
+        event_type = self._get_event_type(message)
+        severity = self._get_severity(message)
+        if event_type == 'ALERT':
+            # severity_mapping of the webhook options applies to alerts, recoveries stay INFO
+            severity = event_rules.get_severity(rule_attributes, severity)
+
+        return event_rules.apply_overrides({
+            'event_type': event_type,
+            'severity': severity,
             'description': message.get('NewStateReason', ''),
-            'title': self._remove_code_in_title(message.get('Subject', '')),
+            'title': event_rules.render_title(rule_attributes, self._remove_code_in_title(message.get('Subject', ''))),
             'rule': self._get_rule_for_event(message),
             'occurred_at': occurred_at,
             'account': account_id,
             'additional_info': self._get_additional_info(message)
-        }
+        })
+
+    def _generate_event_dict(self, shared_event_dict, message, dimension, namespace, region, occurred_at):
+        return dict(shared_event_dict, **{
+            'event_key': self._get_event_key(message, dimension.get('value'), occurred_at),
+            'resource': self._get_resource_for_event(dimension, namespace, region)
+        })
+
+    def _generate_aggregated_event_dict(self, shared_event_dict, message, dimensions, namespace, region,
+                                        occurred_at):
+        alarm_arn = message.get('AlarmArn', '')
+        additional_info = dict(shared_event_dict['additional_info'], **{
+            'Dimensions': [{'name': dimension.get('name', ''), 'value': dimension.get('value', '')}
+                           for dimension in dimensions],
+            'DimensionCount': len(dimensions)
+        })
+
+        return dict(shared_event_dict, **{
+            'event_key': self._get_event_key(message, alarm_arn, occurred_at),
+            'resource': {
+                'resource_id': alarm_arn,
+                'resource_type': namespace,
+                'name': f'[{namespace}] {message.get("AlarmName", "")} ({region})'
+            },
+            'additional_info': additional_info
+        })
 
     @staticmethod
     def _get_namespace(message):
@@ -147,9 +266,10 @@ class EventManager(BaseManager):
     @staticmethod
     def _get_occurred_at(message):
         if t := message.get('StateChangeTime'):
-            return datetime.strptime(t, '%Y-%m-%dT%H:%M:%S.%f+0000')
+            return parse_iso8601(t)
         else:
-            return datetime.now()
+            _LOGGER.debug('[EventManager] StateChangeTime is missing, use current UTC time')
+            return utc_now()
 
     @staticmethod
     def _remove_code_in_title(title):
@@ -235,6 +355,9 @@ class EventManager(BaseManager):
             if _key in additional_info_key and message.get(_key):
                 additional_info.update({_key: message.get(_key)})
 
+        # Datapoints, thresholds and comparison of the free text reason, parsed once per distinct text
+        additional_info.update(parse_state_reason(message.get('NewStateReason')))
+
         return additional_info
 
     @staticmethod
@@ -265,6 +388,21 @@ class EventManager(BaseManager):
 
     @staticmethod
     def _evaluate_parsing_data(event_data):
-        event_result_model = EventModel(event_data, strict=False)
-        event_result_model.validate()
-        return event_result_model.to_native()
+        with metrics.stage('validate', manager='EventManager'):
+            return _build_event(event_data)
+
+
+def _get_suppression_index():
+    global _SUPPRESSION_INDEX
+
+    conf = config.get_global('EVENT_SUPPRESSION', {})
+    if not conf.get('enabled', False):
+        return None
+
+    if _SUPPRESSION_INDEX is None:
+        with _SUPPRESSION_LOCK:
+            if _SUPPRESSION_INDEX is None:
+                _SUPPRESSION_INDEX = SuppressionIndex(window=conf.get('window', 300),
+                                                      max_size=conf.get('max_size', 10000))
+
+    return _SUPPRESSION_INDEX
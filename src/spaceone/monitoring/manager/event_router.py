@@ -0,0 +1,130 @@
+import importlib
+import re
+import threading
+
+from spaceone.monitoring.error.event import ERROR_NOT_DECISION_MANAGER
+
+__all__ = ['register_route', 'route_message', 'sniff_route', 'get_message_fields']
+
+_ROUTES = {}
+
+# Modules of the @register_route managers, imported on the first routing instead of at startup.
+# Not every export of spaceone.monitoring.manager is routed, so a new routed manager must be added here.
+_ROUTE_MODULES = (
+    'spaceone.monitoring.manager.cloudwatch_event_manager',
+    'spaceone.monitoring.manager.phd_event_manager'
+)
+_routes_loaded = False
+
+# Top-level message fields read by the router and by the MESSAGE_FIELDS of the registered managers.
+# None when a manager does not declare MESSAGE_FIELDS and needs the whole message.
+_message_fields = {'AlarmArn', 'detail-type', 'source'}
+_routes_lock = threading.Lock()
+
+_SNIFF_PREFIX_SIZE = 4096
+_SNIFF_PATTERNS = (
+    ('arn', re.compile(r'"AlarmArn"\s*:\s*"arn:[^:"]*:([^:"]+):')),
+    ('detail-type', re.compile(r'"detail-type"\s*:\s*"([^"]+)"')),
+    ('source', re.compile(r'"source"\s*:\s*"([^"]+)"')),
+)
+
+
+def register_route(*route_keys):
+    """
+    Class decorator that routes messages to the decorated manager.
+
+    Route keys:
+        ('arn', <service>)          - service part of AlarmArn (arn:aws:<service>:...)
+        ('detail-type', <value>)    - EventBridge detail-type
+        ('source', <value>)         - EventBridge source
+
+    MESSAGE_FIELDS of the manager lists the top-level fields it reads, see get_message_fields.
+
+    The decorator only runs when the module of the manager is imported: add that module to _ROUTE_MODULES,
+    otherwise its routes are unknown until something else imports it.
+    """
+
+    def wrapper(manager_cls):
+        global _message_fields
+
+        if (message_fields := getattr(manager_cls, 'MESSAGE_FIELDS', None)) is None:
+            _message_fields = None
+        elif _message_fields is not None:
+            _message_fields.update(message_fields)
+
+        for route_key in route_keys:
+            registered = _ROUTES.get(route_key)
+            if registered and registered != manager_cls.__name__:
+                raise ValueError(f'Route {route_key} is already registered by {registered}')
+
+            _ROUTES[route_key] = manager_cls.__name__
+
+        return manager_cls
+
+    return wrapper
+
+
+def route_message(message):
+    """
+    Returns:
+        name of the manager for the message
+    """
+
+    if not isinstance(message, dict):
+        raise ERROR_NOT_DECISION_MANAGER()
+
+    _load_routes()
+
+    if alarm_arn := message.get('AlarmArn'):
+        arn = alarm_arn.split(':', 3)
+        if len(arn) > 2 and (manager_name := _ROUTES.get(('arn', arn[2]))):
+            return manager_name
+
+    if (detail_type := message.get('detail-type')) and (manager_name := _ROUTES.get(('detail-type', detail_type))):
+        return manager_name
+
+    if (source := message.get('source')) and (manager_name := _ROUTES.get(('source', source))):
+        return manager_name
+
+    raise ERROR_NOT_DECISION_MANAGER()
+
+
+def sniff_route(raw_message, prefix_size=_SNIFF_PREFIX_SIZE):
+    """
+    Find the manager from the head of an undecoded JSON message.
+
+    Returns:
+        name of the manager, or None when the prefix is not conclusive
+    """
+
+    _load_routes()
+    prefix = raw_message[:prefix_size]
+
+    for key_type, pattern in _SNIFF_PATTERNS:
+        if (matched := pattern.search(prefix)) and (manager_name := _ROUTES.get((key_type, matched.group(1)))):
+            return manager_name
+
+    return None
+
+
+def get_message_fields():
+    """
+    Returns:
+        frozenset of the top-level message fields any route reads, None when the whole message is needed
+    """
+
+    _load_routes()
+    return frozenset(_message_fields) if _message_fields is not None else None
+
+
+def _load_routes():
+    global _routes_loaded
+
+    if _routes_loaded:
+        return
+
+    with _routes_lock:
+        if not _routes_loaded:
+            for module_name in _ROUTE_MODULES:
+                importlib.import_module(module_name)
+            _routes_loaded = True
@@ -0,0 +1,252 @@
+import fnmatch
+import hashlib
+import re
+import string
+import threading
+from types import MappingProxyType
+from typing import NamedTuple, Optional, Tuple
+
+from spaceone.core import config
+from spaceone.monitoring.error.webhook import ERROR_INVALID_WEBHOOK_OPTIONS
+from spaceone.monitoring.libs import json_codec
+from spaceone.monitoring.libs.ttl_cache import TTLCache
+
+__all__ = ['EventRules', 'get_event_rules', 'compile_event_rules']
+
+_DEFAULT_CONFIG = {
+    'cache_size': 256,
+    'ttl': 3600
+}
+
+_SEVERITIES = frozenset(['CRITICAL', 'ERROR', 'WARNING', 'INFO', 'NOT_AVAILABLE'])
+
+# Message attributes a severity_mapping can match, the more specific ones win
+_SEVERITY_ATTRIBUTES = ('alarm_name', 'namespace', 'metric_name', 'event_type_code', 'service',
+                        'event_type_category', 'state', 'account', 'region')
+
+# Message attributes a filter can match, values are exact strings or glob patterns (e.g. "test-*")
+_FILTER_ATTRIBUTES = frozenset(['account', 'region', 'namespace', 'alarm_name', 'metric_name', 'state', 'service',
+                                'event_type_code', 'event_type_category'])
+_GLOB_CHARS = re.compile(r'[*?\[]')
+
+_OVERRIDE_FIELDS = frozenset(['title', 'description', 'severity', 'rule', 'event_type', 'provider', 'account'])
+
+_RULES_CACHE = None
+_RULES_CACHE_LOCK = threading.Lock()
+
+
+class EventRules(NamedTuple):
+    """
+    Webhook options compiled once per distinct payload.
+
+    Options:
+        severity_mapping: {attribute: {value: severity}} - e.g. {"namespace": {"AWS/RDS": "CRITICAL"}}
+        title_template: str.format template over the message attributes and {title}
+        field_overrides: {event field: value} set on every event
+        filters: [{attribute: value or [values]}] - a message matching every attribute of any filter is dropped
+        aggregate_dimensions / affected_entities_limit / split_affected_entities: see CLOUDWATCH_EVENT, HEALTH_EVENT
+    """
+
+    digest: str
+    severity_tables: Tuple[Tuple[str, MappingProxyType], ...]
+    title_template: Optional[str]
+    field_overrides: MappingProxyType
+    aggregate_dimensions: bool
+    affected_entities_limit: int
+    split_affected_entities: bool
+    filters: Tuple[Tuple[Tuple[str, frozenset, Optional[re.Pattern]], ...], ...] = ()
+
+    def is_filtered(self, attributes):
+        for conditions in self.filters:
+            for attribute, values, pattern in conditions:
+                # Attributes of the message can be None or numbers, the filter values are strings
+                value = attributes.get(attribute)
+                value = '' if value is None else str(value)
+                if value not in values and (pattern is None or not pattern.match(value)):
+                    break
+            else:
+                return True
+
+        return False
+
+    def get_severity(self, attributes, default):
+        for attribute, severity_table in self.severity_tables:
+            if (severity := severity_table.get(attributes.get(attribute))) is not None:
+                return severity
+
+        return default
+
+    def render_title(self, attributes, default):
+        if self.title_template is None:
+            return default
+
+        return self.title_template.format_map(_TemplateValues(attributes, title=default))
+
+    def apply_overrides(self, event_dict):
+        if self.field_overrides:
+            event_dict.update(self.field_overrides)
+
+        return event_dict
+
+
+class _TemplateValues(dict):
+    """ Attributes that are missing in the message render as an empty string """
+
+    def __missing__(self, key):
+        return ''
+
+
+def get_event_rules(options):
+    """
+    Returns:
+        EventRules of the options, compiled on the first call for the same content and served from the cache after
+    """
+
+    if isinstance(options, EventRules):
+        return options
+
+    defaults = {
+        'CLOUDWATCH_EVENT': config.get_global('CLOUDWATCH_EVENT', {}),
+        'HEALTH_EVENT': config.get_global('HEALTH_EVENT', {})
+    }
+    content = json_codec.dumps({'options': options or {}, 'defaults': defaults}, sort_keys=True)
+
+    # Keyed by the serialized options, the digest is only computed for options that are not cached yet
+    rules_cache = _get_rules_cache()
+    if (event_rules := rules_cache.get(content)) is None:
+        digest = hashlib.sha1(content.encode('utf-8')).hexdigest()
+        event_rules = compile_event_rules(options or {}, defaults, digest)
+        rules_cache.set(content, event_rules)
+
+    return event_rules
+
+
+def compile_event_rules(options, defaults=None, digest=''):
+    """
+    Raises:
+        ERROR_INVALID_WEBHOOK_OPTIONS
+    """
+
+    defaults = defaults or {}
+    cloudwatch_options = dict({'aggregate_dimensions': False}, **defaults.get('CLOUDWATCH_EVENT', {}))
+    health_options = dict({'affected_entities_limit': 100, 'split_affected_entities': False},
+                          **defaults.get('HEALTH_EVENT', {}))
+
+    for key in list(cloudwatch_options) + list(health_options):
+        if key in options:
+            (cloudwatch_options if key in cloudwatch_options else health_options)[key] = options[key]
+
+    return EventRules(
+        digest=digest,
+        severity_tables=_compile_severity_mapping(options.get('severity_mapping') or {}),
+        title_template=_compile_title_template(options.get('title_template')),
+        field_overrides=_compile_field_overrides(options.get('field_overrides') or {}),
+        aggregate_dimensions=bool(cloudwatch_options['aggregate_dimensions']),
+        affected_entities_limit=_to_int('affected_entities_limit', health_options['affected_entities_limit']),
+        split_affected_entities=bool(health_options['split_affected_entities']),
+        filters=_compile_filters(options.get('filters') or [])
+    )
+
+
+def _compile_severity_mapping(severity_mapping):
+    if not isinstance(severity_mapping, dict):
+        raise ERROR_INVALID_WEBHOOK_OPTIONS(key='severity_mapping', reason='must be an object')
+
+    for attribute, severity_table in severity_mapping.items():
+        if attribute not in _SEVERITY_ATTRIBUTES:
+            raise ERROR_INVALID_WEBHOOK_OPTIONS(key=f'severity_mapping.{attribute}',
+                                                reason=f'attribute must be one of {list(_SEVERITY_ATTRIBUTES)}')
+        if not isinstance(severity_table, dict):
+            raise ERROR_INVALID_WEBHOOK_OPTIONS(key=f'severity_mapping.{attribute}', reason='must be an object')
+
+        for value, severity in severity_table.items():
+            if severity not in _SEVERITIES:
+                raise ERROR_INVALID_WEBHOOK_OPTIONS(key=f'severity_mapping.{attribute}.{value}',
+                                                    reason=f'severity must be one of {sorted(_SEVERITIES)}')
+
+    return tuple((attribute, MappingProxyType(dict(severity_mapping[attribute])))
+                 for attribute in _SEVERITY_ATTRIBUTES if severity_mapping.get(attribute))
+
+
+def _compile_filters(filters):
+    """
+    Every filter becomes a tuple of (attribute, exact values, glob patterns joined in one regex or None)
+    """
+
+    if not isinstance(filters, list):
+        raise ERROR_INVALID_WEBHOOK_OPTIONS(key='filters', reason='must be a list')
+
+    compiled_filters = []
+    for index, conditions in enumerate(filters):
+        if not isinstance(conditions, dict) or not conditions:
+            raise ERROR_INVALID_WEBHOOK_OPTIONS(key=f'filters[{index}]', reason='must be a non-empty object')
+
+        compiled_conditions = []
+        for attribute, values in conditions.items():
+            if attribute not in _FILTER_ATTRIBUTES:
+                raise ERROR_INVALID_WEBHOOK_OPTIONS(key=f'filters[{index}].{attribute}',
+                                                    reason=f'attribute must be one of {sorted(_FILTER_ATTRIBUTES)}')
+
+            values = values if isinstance(values, list) else [values]
+            if not values or not all(isinstance(value, str) for value in values):
+                raise ERROR_INVALID_WEBHOOK_OPTIONS(key=f'filters[{index}].{attribute}',
+                                                    reason='must be a string or a list of strings')
+
+            globs = [value for value in values if _GLOB_CHARS.search(value)]
+            pattern = re.compile('|'.join(fnmatch.translate(value) for value in globs)) if globs else None
+            compiled_conditions.append((attribute, frozenset(values) - frozenset(globs), pattern))
+
+        compiled_filters.append(tuple(compiled_conditions))
+
+    return tuple(compiled_filters)
+
+
+def _compile_title_template(title_template):
+    if title_template is None:
+        return None
+
+    if not isinstance(title_template, str):
+        raise ERROR_INVALID_WEBHOOK_OPTIONS(key='title_template', reason='must be a string')
+
+    try:
+        for _, field_name, _, _ in string.Formatter().parse(title_template):
+            if field_name is not None and not field_name.isidentifier():
+                raise ValueError(f'field must be an attribute name: {{{field_name}}}')
+    except ValueError as e:
+        raise ERROR_INVALID_WEBHOOK_OPTIONS(key='title_template', reason=str(e))
+
+    return title_template
+
+
+def _compile_field_overrides(field_overrides):
+    if not isinstance(field_overrides, dict):
+        raise ERROR_INVALID_WEBHOOK_OPTIONS(key='field_overrides', reason='must be an object')
+
+    for field_name, value in field_overrides.items():
+        if field_name not in _OVERRIDE_FIELDS:
+            raise ERROR_INVALID_WEBHOOK_OPTIONS(key=f'field_overrides.{field_name}',
+                                                reason=f'field must be one of {sorted(_OVERRIDE_FIELDS)}')
+        if field_name == 'severity' and value not in _SEVERITIES:
+            raise ERROR_INVALID_WEBHOOK_OPTIONS(key='field_overrides.severity',
+                                                reason=f'severity must be one of {sorted(_SEVERITIES)}')
+
+    return MappingProxyType(dict(field_overrides))
+
+
+def _to_int(key, value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ERROR_INVALID_WEBHOOK_OPTIONS(key=key, reason='must be a number')
+
+
+def _get_rules_cache():
+    global _RULES_CACHE
+
+    if _RULES_CACHE is None:
+        with _RULES_CACHE_LOCK:
+            if _RULES_CACHE is None:
+                conf = dict(_DEFAULT_CONFIG, **config.get_global('EVENT_RULES', {}))
+                _RULES_CACHE = TTLCache(max_size=conf['cache_size'], ttl=conf['ttl'])
+
+    return _RULES_CACHE
@@ -1,22 +1,32 @@
+import itertools
 import logging
-import requests
-import json
-from datetime import datetime
 
 from spaceone.core.manager import BaseManager
+from spaceone.monitoring.manager.event_router import register_route
+from spaceone.monitoring.manager.event_rules import get_event_rules
+from spaceone.monitoring.libs import json_codec, metrics
+from spaceone.monitoring.libs.time_parser import parse_health_time, parse_iso8601, utc_now
 from spaceone.monitoring.model.phd_event_response_model import EventModel
+from spaceone.monitoring.model.compiled_model import compile_model
 
 _LOGGER = logging.getLogger(__name__)
 
+_build_event = compile_model(EventModel)
 
+
+@register_route(('source', 'aws.health'))
 class PersonalHealthDashboardManager(BaseManager):
+
+    # "resources" is left out, the affected resources are read from detail.affectedEntities
+    MESSAGE_FIELDS = frozenset(['id', 'detail-type', 'source', 'account', 'time', 'region', 'detail'])
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
     def parse(self, options, message):
-        return self._generate_events(message)
+        return self._generate_events(message, options)
 
-    def _generate_events(self, message):
+    def _generate_events(self, message, options=None):
         events = []
 
         """ MESSAGE Sample1
@@ -139,80 +149,146 @@ class PersonalHealthDashboardManager(BaseManager):
         event_arn = detail_event.get('eventArn', '')
         event_type_code = detail_event.get('eventTypeCode', '')
         event_type_category = detail_event.get('eventTypeCategory', '')
-        occurred_at = self._get_occurred_at(detail_event)
-        event_description = self._generate_description(detail_event, account_id)
-        event_dict = self._generate_event_dict(event_arn, event_type_category, resource_type, event_description,
-                                               event_type_code, occurred_at, message, account_id)
-        events.append(self._evaluate_parsing_data(event_dict))
+        occurred_at = self._get_occurred_at(message, detail_event)
+
+        event_rules = get_event_rules(options)
+        rule_attributes = self.get_rule_attributes(message)
+
+        affected_entities, affected_entity_count = self._extract_affected_entities(
+            detail_event, event_rules.affected_entities_limit)
+        additional_info = self._get_additional_info(message, affected_entities, affected_entity_count)
+
+        if event_rules.split_affected_entities and affected_entities:
+            # Fields shared by every entity are computed once
+            shared_event_dict = self._generate_event_dict(event_arn, event_type_category, resource_type, '',
+                                                          event_type_code, occurred_at, additional_info, account_id,
+                                                          event_rules, rule_attributes)
+            description_text = self._generate_description_text(detail_event, account_id)
+
+            for affected_entity in affected_entities:
+                event_dict = self._generate_entity_event_dict(shared_event_dict, affected_entity, event_arn,
+                                                              resource_type, description_text, additional_info)
+                events.append(self._evaluate_parsing_data(event_dict))
+        else:
+            event_description = self._generate_description(detail_event, account_id, affected_entities,
+                                                            affected_entity_count)
+            event_dict = self._generate_event_dict(event_arn, event_type_category, resource_type, event_description,
+                                                   event_type_code, occurred_at, additional_info, account_id,
+                                                   event_rules, rule_attributes)
+            events.append(self._evaluate_parsing_data(event_dict))
 
         return events
 
     def _generate_event_dict(self, event_arn, event_type_category, resource_type, event_description, event_type_code,
-                             occurred_at, message, account_id):
-        return {
+                             occurred_at, additional_info, account_id, event_rules, rule_attributes):
+        return event_rules.apply_overrides({
             'event_key': event_arn,
             'event_type': self._get_event_type(),
-            'severity': self._get_severity(event_type_category),
+            'severity': event_rules.get_severity(rule_attributes, self._get_severity(event_type_category)),
             'resource': self._get_resource_for_event(event_arn, resource_type),
             'description': event_description,
-            'title': self._change_string_format(event_type_code),
+            'title': event_rules.render_title(rule_attributes, self._change_string_format(event_type_code)),
             'rule': event_type_category,
             'occurred_at': occurred_at,
             'account': account_id,
-            'additional_info': self._get_additional_info(message)
+            'additional_info': additional_info
+        })
+
+    @staticmethod
+    def _generate_entity_event_dict(shared_event_dict, affected_entity, event_arn, resource_type, description_text,
+                                    additional_info):
+        return dict(shared_event_dict, **{
+            'event_key': f'{event_arn}:{affected_entity}',
+            'resource': {
+                'resource_id': affected_entity,
+                'resource_type': resource_type
+            },
+            'description': f'{description_text}\n\nAffected Entity: {affected_entity}',
+            'additional_info': dict(additional_info, affectedEntities=[affected_entity])
+        })
+
+    @staticmethod
+    def get_rule_attributes(message):
+        """ Attributes that filters, severity_mapping and title_template of the webhook options can refer to """
+
+        detail_event = message.get('detail', {})
+        return {
+            'account': message.get('account', ''),
+            'region': message.get('region', ''),
+            'service': detail_event.get('service', ''),
+            'event_type_code': detail_event.get('eventTypeCode', ''),
+            'event_type_category': detail_event.get('eventTypeCategory', '')
         }
 
+    @staticmethod
+    def _extract_affected_entities(detail_event, entity_limit):
+        """
+        Returns:
+            (values of the first <entity_limit> affected entities, total number of affected entities)
+        """
+
+        affected_entities = detail_event.get('affectedEntities') or []
+        entity_values = [affected_entity.get('entityValue', '')
+                         for affected_entity in itertools.islice(affected_entities, max(entity_limit, 0))]
+
+        return entity_values, len(affected_entities)
+
     @staticmethod
     def _change_string_format(event_type_code):
         title = event_type_code.replace('_', ' ').title()
         return title
 
     @staticmethod
-    def _generate_description(detail_event, account_id):
+    def _generate_description_text(detail_event, account_id):
         text = [description.get('latestDescription', '').replace('\\\\n', '\n').replace('\\n', '\n')
                 for description in detail_event.get('eventDescription', '')]
         full_text = ' '.join(text)
 
-        affected_entities = [affected_entity.get("entityValue", "")
-                             for affected_entity in detail_event.get("affectedEntities", [])]
-        if affected_entities:
-            affected_entities_names_str = '\n - '.join(affected_entities)
-            description = f'{full_text} (Account:{account_id})\n\nAffected Entities:\n - {affected_entities_names_str}'
+        return f'{full_text} (Account:{account_id})'
+
+    def _generate_description(self, detail_event, account_id, affected_entities, affected_entity_count):
+        description_text = self._generate_description_text(detail_event, account_id)
+
+        if affected_entity_count:
+            affected_entities_lines = [f'\n - {affected_entity}' for affected_entity in affected_entities]
+            if (remaining_count := affected_entity_count - len(affected_entities)) > 0:
+                affected_entities_lines.append(f'\n - ... and {remaining_count} more')
+
+            description = f'{description_text}\n\nAffected Entities:{"".join(affected_entities_lines)}'
         else:
-            description = f'{full_text} (Account:{account_id})\n\nAffected Entities: None'
+            description = f'{description_text}\n\nAffected Entities: None'
 
         return description
 
     @staticmethod
-    def request_subscription_confirm(confirm_url):
-        r = requests.get(confirm_url)
-        _LOGGER.debug(f'[Confirm_URL: SubscribeURL] {confirm_url}')
-        _LOGGER.debug(f'[AWS SNS: Status]: {r.status_code}, {r.content}')
-
-    @staticmethod
-    def _get_occurred_at(detail_event):
+    def _get_occurred_at(message, detail_event):
         if t := detail_event.get('startTime'):
-            return datetime.strptime(t, '%a, %d %b %Y %H:%M:%S %Z')
+            return parse_health_time(t)
+        elif t := message.get('time'):
+            return parse_iso8601(t)
         else:
-            return datetime.now()
+            _LOGGER.debug('[PersonalHealthDashboardManager] startTime is missing, use current UTC time')
+            return utc_now()
 
     @staticmethod
-    def _get_additional_info(message):
+    def _get_additional_info(message, affected_entities, affected_entity_count):
         additional_info = {}
-        additional_info_key = ['id', 'account', 'region', 'service', 'eventTypeCode', 'affectedEntities']
-        for _key in message:
-            if _key in additional_info_key and message.get(_key):
-                additional_info.update({_key: message.get(_key)})
-            if _key == "detail":
-                detail_event = message.get(_key)
-                for detail_key in detail_event:
-                    if detail_key in additional_info_key:
-                        if detail_key == "affectedEntities":
-                            affected_entities = [affected_entity.get("entityValue", "")
-                                                 for affected_entity in detail_event.get(detail_key)]
-                            additional_info.update({detail_key: affected_entities})
-                        else:
-                            additional_info.update({detail_key: detail_event.get(detail_key)})
+
+        for _key in ['id', 'account', 'region']:
+            if value := message.get(_key):
+                additional_info[_key] = value
+
+        detail_event = message.get('detail', {})
+        for detail_key in ['service', 'eventTypeCode']:
+            if detail_key in detail_event:
+                additional_info[detail_key] = detail_event[detail_key]
+
+        if 'affectedEntities' in detail_event:
+            additional_info['affectedEntities'] = affected_entities
+            additional_info['affectedEntitiesCount'] = affected_entity_count
+            if (truncated_count := affected_entity_count - len(affected_entities)) > 0:
+                # Entities over affected_entities_limit, in split mode no event is emitted for them
+                additional_info['affectedEntitiesTruncatedCount'] = truncated_count
 
         return additional_info
 
@@ -234,7 +310,7 @@ class PersonalHealthDashboardManager(BaseManager):
     @staticmethod
     def _get_resource_for_event(event_arn, resource_type):
         return {
-            'resouce_id': event_arn,
+            'resource_id': event_arn,
             'resource_type': resource_type
         }
 
@@ -244,10 +320,9 @@ class PersonalHealthDashboardManager(BaseManager):
 
     @staticmethod
     def _get_json_message(json_raw_data):
-        return json.loads(json_raw_data)
+        return json_codec.loads(json_raw_data)
 
     @staticmethod
     def _evaluate_parsing_data(event_data):
-        event_result_model = EventModel(event_data, strict=False)
-        event_result_model.validate()
-        return event_result_model.to_native()
+        with metrics.stage('validate', manager='PersonalHealthDashboardManager'):
+            return _build_event(event_data)
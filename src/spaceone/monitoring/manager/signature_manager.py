@@ -0,0 +1,88 @@
+import logging
+import threading
+
+from spaceone.core import config
+from spaceone.core.manager import BaseManager
+from spaceone.monitoring.error.event import ERROR_INVALID_SNS_SIGNATURE
+from spaceone.monitoring.libs import metrics
+from spaceone.monitoring.libs.sns_signature import build_string_to_sign, compile_host_patterns, \
+    is_allowed_cert_url, load_public_key, verify_signature
+from spaceone.monitoring.libs.ttl_cache import TTLCache
+
+_LOGGER = logging.getLogger(__name__)
+
+_DEFAULT_CONFIG = {
+    'allowed_schemes': ['https'],
+    'allowed_hosts': [r'^sns\.[a-z0-9-]+\.amazonaws\.com(\.cn)?$'],
+    'cert_cache_size': 64,
+    'cert_ttl': 86400
+}
+
+_CERT_CACHE = None
+_VERIFY_CONFIG = None
+_LOCK = threading.Lock()
+
+
+class SignatureManager(BaseManager):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sns_connector = self.locator.get_connector('SNSConnector')
+
+    def verify(self, raw_data):
+        """
+        Verify Signature of the SNS envelope (SignatureVersion 1 and 2) against its SigningCertURL.
+        Public keys are cached per SigningCertURL, so only the first message of a certificate fetches it.
+
+        Raises:
+            ERROR_INVALID_SNS_SIGNATURE
+        """
+
+        cert_cache, verify_config = _get_cert_cache()
+
+        cert_url = raw_data.get('SigningCertURL', '')
+        if not is_allowed_cert_url(cert_url, verify_config['allowed_schemes'], verify_config['host_patterns']):
+            self._raise_invalid_signature(f'SigningCertURL is not allowed: {cert_url}')
+
+        try:
+            string_to_sign = build_string_to_sign(raw_data)
+            public_key = self._get_public_key(cert_cache, cert_url)
+            verified = verify_signature(public_key, raw_data.get('Signature', ''), string_to_sign,
+                                        raw_data.get('SignatureVersion'))
+        except ValueError as e:
+            self._raise_invalid_signature(str(e))
+        else:
+            if not verified:
+                self._raise_invalid_signature(f'signature mismatch (MessageId = {raw_data.get("MessageId")})')
+
+    def _get_public_key(self, cert_cache, cert_url):
+        public_key = cert_cache.get(cert_url)
+
+        if public_key is None:
+            _LOGGER.debug(f'[SignatureManager] fetch signing certificate: {cert_url}')
+            public_key = load_public_key(self.sns_connector.get_signing_certificate(cert_url))
+            cert_cache.set(cert_url, public_key)
+
+        return public_key
+
+    @staticmethod
+    def _raise_invalid_signature(reason):
+        metrics.inc('signature_failures_total')
+        _LOGGER.warning(f'[SignatureManager] {reason}')
+        raise ERROR_INVALID_SNS_SIGNATURE(reason=reason)
+
+
+def _get_cert_cache():
+    global _CERT_CACHE, _VERIFY_CONFIG
+
+    if _CERT_CACHE is None:
+        with _LOCK:
+            if _CERT_CACHE is None:
+                conf = dict(_DEFAULT_CONFIG, **config.get_global('SIGNATURE_VERIFICATION', {}))
+                _VERIFY_CONFIG = {
+                    'allowed_schemes': frozenset(conf['allowed_schemes']),
+                    'host_patterns': compile_host_patterns(conf['allowed_hosts'])
+                }
+                _CERT_CACHE = TTLCache(max_size=conf['cert_cache_size'], ttl=conf['cert_ttl'])
+
+    return _CERT_CACHE, _VERIFY_CONFIG
@@ -0,0 +1,82 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from spaceone.core import config
+from spaceone.core.manager import BaseManager
+from spaceone.monitoring.libs.ttl_cache import TTLCache
+
+_LOGGER = logging.getLogger(__name__)
+
+_DEFAULT_CONFIG = {
+    'max_workers': 4,
+    'max_pending': 100,
+    'dedup_ttl': 3600,
+    'dedup_max_size': 1024
+}
+
+_EXECUTOR = None
+_PENDING = None
+_CONFIRMED = None
+_LOCK = threading.Lock()
+
+
+class SubscriptionManager(BaseManager):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sns_connector = self.locator.get_connector('SNSConnector')
+
+    def confirm_subscription(self, raw_data):
+        """
+        Hand the SubscriptionConfirmation over to the background executor and return immediately.
+        The same TopicArn/Token is confirmed only once while it stays in the dedup cache.
+
+        Returns:
+            True if the confirmation was scheduled
+        """
+
+        subscribe_url = raw_data.get('SubscribeURL')
+        if not subscribe_url:
+            _LOGGER.warning(f'[SubscriptionManager] SubscribeURL is missing (MessageId = {raw_data.get("MessageId")})')
+            return False
+
+        executor, pending, confirmed = _get_executor()
+        confirm_key = f'{raw_data.get("TopicArn", "")}:{raw_data.get("Token", subscribe_url)}'
+
+        if not confirmed.add(confirm_key, True):
+            _LOGGER.debug(f'[SubscriptionManager] skip duplicated confirmation: {confirm_key}')
+            return False
+
+        if not pending.acquire(blocking=False):
+            _LOGGER.warning(f'[SubscriptionManager] confirmation queue is full, drop: {confirm_key}')
+            confirmed.pop(confirm_key)
+            return False
+
+        executor.submit(self._confirm_subscription, confirm_key, subscribe_url, pending, confirmed)
+        return True
+
+    def _confirm_subscription(self, confirm_key, subscribe_url, pending, confirmed):
+        try:
+            self.sns_connector.confirm_subscription(subscribe_url)
+        except Exception as e:
+            _LOGGER.error(f'[SubscriptionManager] failed to confirm subscription ({confirm_key}): {e}')
+            # Let the next SNS retry of the same confirmation go through
+            confirmed.pop(confirm_key)
+        finally:
+            pending.release()
+
+
+def _get_executor():
+    global _EXECUTOR, _PENDING, _CONFIRMED
+
+    if _EXECUTOR is None:
+        with _LOCK:
+            if _EXECUTOR is None:
+                conf = dict(_DEFAULT_CONFIG, **config.get_global('SUBSCRIPTION_CONFIRM', {}))
+                _PENDING = threading.BoundedSemaphore(conf['max_pending'])
+                _CONFIRMED = TTLCache(max_size=conf['dedup_max_size'], ttl=conf['dedup_ttl'])
+                _EXECUTOR = ThreadPoolExecutor(max_workers=conf['max_workers'],
+                                               thread_name_prefix='sns-subscription-confirm')
+
+    return _EXECUTOR, _PENDING, _CONFIRMED
@@ -1 +1,6 @@
-from spaceone.monitoring.model.cloudwatch_event_response_model import *
\ No newline at end of file
+from spaceone.monitoring.libs.lazy_import import lazy_exports
+
+__all__ = ['EventModel']
+__getattr__, __dir__ = lazy_exports(__name__, {
+    'EventModel': 'spaceone.monitoring.model.cloudwatch_event_response_model'
+})
@@ -1,15 +1,37 @@
 from schematics.models import Model
-from schematics.types import StringType, ModelType, DateTimeType
+from schematics.types import StringType, ModelType, DateTimeType, IntType, ListType, FloatType
 
 __all__ = ['EventModel']
 
 
+class AlarmDimensionModel(Model):
+    name = StringType(serialize_when_none=False)
+    value = StringType(serialize_when_none=False)
+
+
+class DatapointModel(Model):
+    value = FloatType(serialize_when_none=False)
+    timestamp = StringType(serialize_when_none=False)
+
+
 class CloudWatchAdditionalInfo(Model):
     AWSAccountId = StringType(required=True)
     AlarmArn = StringType(required=True)
     AlarmName = StringType()
     OldStateValue = StringType()
     Region = StringType()
+    SuppressedCount = IntType(serialize_when_none=False)
+    Dimensions = ListType(ModelType(AlarmDimensionModel), serialize_when_none=False)
+    DimensionCount = IntType(serialize_when_none=False)
+    Datapoints = ListType(ModelType(DatapointModel), serialize_when_none=False)
+    BreachingDatapoints = IntType(serialize_when_none=False)
+    EvaluatedDatapoints = IntType(serialize_when_none=False)
+    Comparison = StringType(serialize_when_none=False)
+    Threshold = FloatType(serialize_when_none=False)
+    LowerThresholds = ListType(FloatType(), serialize_when_none=False)
+    UpperThresholds = ListType(FloatType(), serialize_when_none=False)
+    MissingDatapoints = IntType(serialize_when_none=False)
+    MissingDataTreatedAs = StringType(serialize_when_none=False)
 
 
 class ResourceModel(Model):
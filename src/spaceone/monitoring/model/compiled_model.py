@@ -0,0 +1,83 @@
+from schematics.common import NOT_NONE, NONEMPTY
+from schematics.types import StringType, ModelType, ListType
+from schematics.undefined import Undefined
+
+from spaceone.monitoring.error.event import ERROR_INVALID_EVENT_FIELD
+
+__all__ = ['compile_model']
+
+
+def compile_model(model_cls):
+    """
+    Compile a schematics model into a plain function that converts, validates and exports a dict
+    the same way as Model(data, strict=False).validate() + to_native(), without building model instances.
+
+    Supported rules: required, choices, default, export level (serialize_when_none) and nested ModelType/ListType.
+    Any other field type falls back to the field's own to_native().
+    """
+
+    model_export_level = model_cls._schema.options.export_level
+    specs = tuple(_compile_field(name, field, model_export_level)
+                  for name, field in model_cls._schema.fields.items())
+
+    def build(data):
+        result = {}
+        for name, convert, required, choices, default, omit_none, omit_empty in specs:
+            value = data.get(name, default)
+
+            if value is None:
+                if required:
+                    raise ERROR_INVALID_EVENT_FIELD(key=name, reason='This field is required.')
+                if omit_none:
+                    continue
+            else:
+                value = convert(value)
+                if choices is not None and value not in choices:
+                    raise ERROR_INVALID_EVENT_FIELD(key=name, reason=f'Value must be one of {sorted(choices)}.')
+                if omit_empty and len(value) == 0:
+                    continue
+
+            result[name] = value
+
+        return result
+
+    return build
+
+
+def _compile_field(name, field, model_export_level):
+    # serialize_when_none=False is export level NONEMPTY in schematics 2.x: None and empty compound values are dropped
+    export_level = field.export_level if field.export_level is not None else model_export_level
+    omit_none = export_level <= NOT_NONE
+    omit_empty = field.is_compound and export_level <= NONEMPTY
+
+    choices = frozenset(field.choices) if field.choices else None
+    default = None if field.default is Undefined else field.default
+
+    # Defaults pass through the converter as well, so mutable defaults (e.g. []) are never shared between events
+    return name, _get_converter(field), field.required, choices, default, omit_none, omit_empty
+
+
+def _get_converter(field):
+    if isinstance(field, StringType):
+        return _to_string
+    elif isinstance(field, ModelType):
+        return _compile_nested(field.model_class)
+    elif isinstance(field, ListType):
+        item_converter = _get_converter(field.field)
+        return lambda values: [item_converter(value) for value in values]
+    else:
+        return field.to_native
+
+
+def _compile_nested(model_cls):
+    build = compile_model(model_cls)
+    return lambda value: build(value) if isinstance(value, dict) else value
+
+
+def _to_string(value):
+    if value.__class__ is str:
+        return value
+    elif isinstance(value, bytes):
+        return value.decode('utf-8')
+    return str(value)
+
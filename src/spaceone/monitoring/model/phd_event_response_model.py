@@ -1,5 +1,5 @@
 from schematics.models import Model
-from schematics.types import DictType, StringType, ModelType, DateTimeType, PolyModelType, ListType
+from schematics.types import DictType, StringType, ModelType, DateTimeType, PolyModelType, ListType, IntType
 
 __all__ = ['EventModel']
 
@@ -11,6 +11,8 @@ class HealthAdditionalInfo(Model):
     service = StringType(required=True)
     eventTypeCode = StringType()
     affectedEntities = ListType(StringType, default=[])
+    affectedEntitiesCount = IntType(serialize_when_none=False)
+    affectedEntitiesTruncatedCount = IntType(serialize_when_none=False)
 
 
 class ResourceModel(Model):
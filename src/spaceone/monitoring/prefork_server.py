@@ -0,0 +1,230 @@
+"""
+Pre-fork server that runs N plugin processes on the same gRPC port
+
+    python -m spaceone.monitoring.prefork_server -p 50051 --workers 4 [-c config.yml] [--aio] [-- <worker args>]
+
+Every worker is a complete `spaceone grpc spaceone.monitoring` (or `python -m spaceone.monitoring.aio_server`)
+process. gRPC binds with SO_REUSEPORT by default on Linux, so the kernel spreads new connections
+over the workers and parsing is no longer limited to the one core of a single interpreter.
+The config file of -c is read by the master (PREFORK_SERVER) and passed on to every worker.
+
+The master process only supervises:
+    - a worker that exits is started again, with an exponential delay while it keeps crashing
+    - SIGHUP restarts the workers one by one, the others keep serving meanwhile
+    - SIGTERM / SIGINT stop every worker, killing the ones still alive after shutdown_grace seconds
+"""
+
+import argparse
+import logging
+import os
+import signal
+import subprocess
+import sys
+import time
+
+from spaceone.core import config
+from spaceone.monitoring.libs.service_config import load_service_config
+from spaceone.monitoring.libs.worker import WORKER_ID_ENV
+
+# Named after the module, not __name__, so that LOG of the config also applies under python -m
+_LOGGER = logging.getLogger('spaceone.monitoring.prefork_server')
+
+_DEFAULT_CONFIG = {
+    'workers': 0,
+    'restart_delay': 1,
+    'max_restart_delay': 30,
+    'ready_delay': 5,
+    'shutdown_grace': 15
+}
+
+_POLL_INTERVAL = 0.5
+
+
+class WorkerProcess(object):
+
+    def __init__(self, worker_id, command):
+        self.worker_id = worker_id
+        self.command = command
+        self.process = None
+        self.started_at = 0
+        self.restart_delay = 0
+        self.next_start_at = 0
+
+    @property
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def start(self):
+        env = dict(os.environ, **{WORKER_ID_ENV: str(self.worker_id)})
+        self.process = subprocess.Popen(self.command, env=env)
+        self.started_at = time.monotonic()
+        _LOGGER.info(f'[prefork_server] worker {self.worker_id} started (pid = {self.process.pid})')
+
+    def terminate(self):
+        if self.alive:
+            self.process.terminate()
+
+    def wait(self, timeout):
+        try:
+            return self.process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            _LOGGER.warning(f'[prefork_server] worker {self.worker_id} did not stop in {timeout}s, kill it')
+            self.process.kill()
+            return self.process.wait()
+
+
+class PreforkServer(object):
+
+    def __init__(self, command, workers, restart_delay, max_restart_delay, ready_delay, shutdown_grace):
+        self.workers = [WorkerProcess(worker_id, command) for worker_id in range(workers)]
+        self.restart_delay = restart_delay
+        self.max_restart_delay = max_restart_delay
+        self.ready_delay = ready_delay
+        self.shutdown_grace = shutdown_grace
+        self._stopping = False
+        self._reloading = False
+
+    def run(self):
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        signal.signal(signal.SIGHUP, self._reload)
+
+        for worker in self.workers:
+            worker.start()
+
+        while not self._stopping:
+            if self._reloading:
+                self._reloading = False
+                self._rolling_restart()
+
+            self._supervise()
+            time.sleep(_POLL_INTERVAL)
+
+        self._shutdown()
+
+    def _supervise(self):
+        now = time.monotonic()
+
+        for worker in self.workers:
+            if worker.alive or self._stopping:
+                continue
+
+            if worker.next_start_at == 0:
+                # A worker that dies before it was ready is crash looping, back off before the next start
+                if now - worker.started_at < self.ready_delay:
+                    worker.restart_delay = min(max(worker.restart_delay * 2, self.restart_delay),
+                                               self.max_restart_delay)
+                else:
+                    worker.restart_delay = self.restart_delay
+
+                worker.next_start_at = now + worker.restart_delay
+                _LOGGER.error(f'[prefork_server] worker {worker.worker_id} exited '
+                              f'(code = {worker.process.returncode}), restart in {worker.restart_delay}s')
+
+            if now >= worker.next_start_at:
+                worker.next_start_at = 0
+                worker.start()
+
+    def _rolling_restart(self):
+        """ Replace the workers one at a time, so N-1 of them keep accepting connections """
+
+        _LOGGER.info('[prefork_server] graceful restart')
+
+        for worker in self.workers:
+            if self._stopping:
+                return
+
+            worker.terminate()
+            if worker.process:
+                worker.wait(self.shutdown_grace)
+
+            worker.next_start_at = 0
+            worker.start()
+            self._wait_ready(worker)
+
+    def _wait_ready(self, worker):
+        deadline = time.monotonic() + self.ready_delay
+        while worker.alive and not self._stopping and time.monotonic() < deadline:
+            time.sleep(_POLL_INTERVAL)
+
+    def _shutdown(self):
+        _LOGGER.info(f'[prefork_server] stopping {len(self.workers)} workers (grace = {self.shutdown_grace}s)')
+
+        for worker in self.workers:
+            worker.terminate()
+
+        deadline = time.monotonic() + self.shutdown_grace
+        for worker in self.workers:
+            if worker.process:
+                worker.wait(max(deadline - time.monotonic(), 0))
+
+    def _stop(self, *args):
+        self._stopping = True
+
+    def _reload(self, *args):
+        self._reloading = True
+
+
+def get_worker_command(port, aio=False, worker_args=None, config_file=None):
+    if aio:
+        command = [sys.executable, '-m', 'spaceone.monitoring.aio_server', '-p', str(port)]
+    else:
+        command = ['spaceone', 'grpc', 'spaceone.monitoring', '-p', str(port)]
+
+    if config_file:
+        command += ['-c', config_file]
+
+    return command + list(worker_args or [])
+
+
+def check_worker_args(aio, worker_args):
+    """
+    Raises:
+        ValueError: the asyncio server does not accept worker_args,
+            every worker would exit at start and be restarted forever
+    """
+
+    if not aio:
+        # spaceone grpc checks its own arguments, there is no parser to reuse
+        return
+
+    from spaceone.monitoring.aio_server import get_parser
+
+    _, unknown_args = get_parser().parse_known_args(list(worker_args))
+    if unknown_args:
+        raise ValueError(f'unsupported arguments of the asyncio server: {" ".join(unknown_args)}')
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(description='pre-fork gRPC server of spaceone.monitoring')
+    parser.add_argument('-p', '--port', type=int, default=50051)
+    parser.add_argument('-c', '--config-file', help='config file of the master and of every worker')
+    parser.add_argument('--workers', type=int, help='worker processes, defaults to the number of CPUs')
+    parser.add_argument('--aio', action='store_true', help='run the asyncio server in each worker')
+    parser.add_argument('worker_args', nargs=argparse.REMAINDER, help='arguments after -- go to every worker')
+    return parser
+
+
+def main():
+    parser = get_parser()
+    args = parser.parse_args()
+    worker_args = args.worker_args[1:] if args.worker_args[:1] == ['--'] else args.worker_args
+
+    try:
+        check_worker_args(args.aio, worker_args)
+    except ValueError as e:
+        parser.error(str(e))
+
+    load_service_config(args.config_file, port=args.port)
+
+    conf = dict(_DEFAULT_CONFIG, **config.get_global('PREFORK_SERVER', {}))
+    workers = args.workers or conf['workers'] or os.cpu_count() or 1
+
+    server = PreforkServer(get_worker_command(args.port, args.aio, worker_args, args.config_file), workers,
+                           restart_delay=conf['restart_delay'], max_restart_delay=conf['max_restart_delay'],
+                           ready_delay=conf['ready_delay'], shutdown_grace=conf['shutdown_grace'])
+    server.run()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,12 +1,28 @@
 import logging
-import requests
-import json
+import threading
+from datetime import datetime, timezone
+from spaceone.core import config
 from spaceone.core.service import *
 
-from spaceone.monitoring.error.event import ERROR_PARSE_EVENT, ERROR_NOT_DECISION_MANAGER
+from spaceone.monitoring.error.event import ERROR_PARSE_EVENT, ERROR_NOT_DECISION_MANAGER, ERROR_INVALID_SNS_SIGNATURE, \
+    ERROR_MESSAGE_LIMIT_EXCEEDED
+from spaceone.monitoring.libs import batch_envelope, message_reader, metrics, profiler
+from spaceone.monitoring.manager.event_router import route_message, sniff_route, get_message_fields
+from spaceone.monitoring.manager.event_rules import get_event_rules
+from spaceone.monitoring.libs.ttl_cache import TTLCache
 
 _LOGGER = logging.getLogger(__name__)
 
+_MISSING = object()
+
+_DEFAULT_MESSAGE_LIMITS = {
+    'max_bytes': 1048576,
+    'max_array_length': 10000,
+    'incremental_threshold': 65536
+}
+_MESSAGE_CACHE = None
+_MESSAGE_CACHE_LOCK = threading.Lock()
+
 
 @authentication_handler
 @authorization_handler
@@ -36,49 +52,217 @@ class EventService(BaseService):
         raw_data = params.get('data')
 
         try:
-            if raw_data.get('Type') == 'SubscriptionConfirmation':
-                self._request_subscription_confirm(raw_data.get('SubscribeURL'))
-                return []
+            return self._parse_envelope(options, raw_data, {})
+        except (ERROR_NOT_DECISION_MANAGER, ERROR_INVALID_SNS_SIGNATURE, ERROR_MESSAGE_LIMIT_EXCEEDED) as e:
+            metrics.inc('errors_total', type=e.__class__.__name__)
+            raise
+        except Exception as e:
+            metrics.inc('errors_total', type=e.__class__.__name__)
+            raise ERROR_PARSE_EVENT(field=e)
+
+    @transaction
+    @check_required(['options', 'data'])
+    def parse_batch(self, params):
+        """ Parse every record of a batched envelope (Batch, SQS / SNS / EventBridge Records) in one transaction
+
+        Args:
+            params (dict): {
+                'options': 'dict',
+                'data': {
+                    'Batch' or 'Records': 'list'
+                }
+            }
+
+        Returns:
+            batch_results (generator): {'index': 'int', 'message_id': 'str', 'events': 'list'} of every record,
+                read and parsed one at a time while BatchEventsInfo encodes the response.
+                A record that cannot be parsed gives one ERROR event instead (see make_error_event),
+                so the other records of the batch are still delivered.
+
+        """
+
+        return self._iter_batch_results(params.get('options'), params.get('data'))
+
+    def _iter_batch_results(self, options, data):
+        managers = {}
+
+        for index, message_id, envelope in batch_envelope.iter_envelopes(data):
+            try:
+                if isinstance(envelope, Exception):
+                    raise envelope
+
+                events = self._parse_envelope(options, envelope, managers)
+            except Exception as e:
+                metrics.inc('errors_total', type=e.__class__.__name__)
+                _LOGGER.error(f'[EventService: parse_batch] failed to parse record '
+                              f'(index = {index}, message_id = {message_id}): {e}')
+                yield {'index': index, 'message_id': message_id, 'error': str(e),
+                       'events': [make_error_event(index, message_id, e)]}
             else:
-                message = self.get_message(raw_data)
+                yield {'index': index, 'message_id': message_id, 'events': events}
 
-                execute_manager = self._decision_manager(message)
-                _manager = self.locator.get_manager(execute_manager)
+    def _parse_envelope(self, options, raw_data, managers):
+        if self._is_signature_verification_enabled():
+            with metrics.stage('verify'):
+                self._get_manager('SignatureManager', managers).verify(raw_data)
 
-                if execute_manager == 'EventManager':
-                    message['subject'] = raw_data.get('Subject', '')
+        if raw_data.get('Type') == 'SubscriptionConfirmation':
+            self._get_manager('SubscriptionManager', managers).confirm_subscription(raw_data)
+            return []
+        else:
+            with profiler.sample(raw_data) as request_sample:
+                return self._parse_notification(options, raw_data, managers, request_sample)
 
-                parsed_event = _manager.parse(options, message)
-                _LOGGER.debug(f'[EventService: parse] {parsed_event}')
-                return parsed_event
-        except Exception as e:
-            raise ERROR_PARSE_EVENT(field=e)
+    def _parse_notification(self, options, raw_data, managers, request_sample):
+        event_rules = get_event_rules(options)
 
-    @staticmethod
-    def _request_subscription_confirm(confirm_url):
-        r = requests.get(confirm_url)
-        _LOGGER.debug(f'[Confirm_URL: SubscribeURL] {confirm_url}')
-        _LOGGER.debug(f'[AWS SNS: Status]: {r.status_code}, {r.content}')
-
-    def _decision_manager(self, message):
-        execute_manager = ''
-
-        if "AlarmArn" in message:
-            service = message.get("AlarmArn").split(":")[2]
-            if service == "cloudwatch":
-                execute_manager = "EventManager"
-            return execute_manager
-        elif message.get('source').split(".")[1] == 'health':
-            execute_manager = "PersonalHealthDashboardManager"
-            return execute_manager
+        message_cache, replay = get_message_cache()
+        cache_key = self._get_message_cache_key(event_rules, raw_data) if message_cache else None
+
+        if cache_key:
+            cached_event = message_cache.get(cache_key, _MISSING)
+            if cached_event is not _MISSING:
+                request_sample.manager = 'MessageCache'
+                _LOGGER.debug(f'[EventService: parse] replayed message ({cache_key}): {message_cache.stats()}')
+                return [] if replay == 'empty' else cached_event
+
+        raw_message = raw_data.get('Message')
+
+        with metrics.stage('route'):
+            execute_manager = sniff_route(raw_message) if isinstance(raw_message, str) else None
+
+        with metrics.stage('decode'):
+            message = self.get_message(raw_data)
+
+        execute_manager = execute_manager or route_message(message)
+        _manager = self._get_manager(execute_manager, managers)
+        request_sample.manager = execute_manager
+
+        message['subject'] = raw_data.get('Subject', '')
+
+        if event_rules.filters and event_rules.is_filtered(_manager.get_rule_attributes(message)):
+            # Dropped by the filters of the webhook options before any event is built
+            _LOGGER.debug(f'[EventService: parse] filtered message ({raw_data.get("MessageId")})')
+            metrics.inc('filtered_messages_total', manager=execute_manager)
+            parsed_event = []
         else:
-            raise ERROR_NOT_DECISION_MANAGER()
+            with metrics.stage('manager', manager=execute_manager):
+                parsed_event = _manager.parse(event_rules, message)
+
+        _LOGGER.debug(f'[EventService: parse] {parsed_event}')
+        self._count_events(execute_manager, parsed_event)
+
+        if cache_key:
+            message_cache.set(cache_key, parsed_event)
+
+        return parsed_event
+
+    @staticmethod
+    def _count_events(execute_manager, parsed_event):
+        if not metrics.is_enabled():
+            return
+
+        metrics.observe('events_per_message', len(parsed_event), manager=execute_manager)
+        for event in parsed_event:
+            metrics.inc('events_total', manager=execute_manager, severity=event.get('severity') or 'NONE')
+
+    def _get_manager(self, execute_manager, managers):
+        if execute_manager not in managers:
+            managers[execute_manager] = self.locator.get_manager(execute_manager)
+
+        return managers[execute_manager]
+
+    @staticmethod
+    def _is_signature_verification_enabled():
+        return config.get_global('SIGNATURE_VERIFICATION', {}).get('enabled', False)
+
+    @staticmethod
+    def _get_message_cache_key(event_rules, raw_data):
+        """
+        SNS redelivers the same MessageId on retry.
+        The digest of the compiled options is part of the key so that webhooks with different options
+        never share a result.
+        """
+
+        if message_id := raw_data.get('MessageId'):
+            return f'{message_id}:{event_rules.digest}'
+
+        return None
 
     @staticmethod
     def get_message(raw_data):
+        """
+        Messages over MESSAGE_LIMITS.incremental_threshold are read incrementally, keeping only the fields
+        the managers read.
+
+        Raises:
+            ERROR_MESSAGE_LIMIT_EXCEEDED
+        """
+
         if 'Message' in raw_data:
-            message = json.loads(raw_data.get("Message", "{}"))
+            limits = dict(_DEFAULT_MESSAGE_LIMITS, **config.get_global('MESSAGE_LIMITS', {}))
+
+            try:
+                message = message_reader.read_message(raw_data.get("Message", "{}"), fields=get_message_fields(),
+                                                      **limits)
+            except message_reader.MessageLimitExceeded as e:
+                metrics.inc('message_limit_exceeded_total', limit=e.limit)
+                raise ERROR_MESSAGE_LIMIT_EXCEEDED(reason=str(e))
         else:
             message = raw_data
 
         return message
+
+
+def make_error_event(index, message_id, error):
+    """
+    ERROR event in place of the events of a record that could not be parsed,
+    EventsInfo has no other place for the error of one record.
+    """
+
+    return {
+        'event_key': message_id or f'batch-record-{index}',
+        'event_type': 'ERROR',
+        'severity': 'ERROR',
+        'title': f'Failed to parse record {index} of the batch',
+        'description': str(error),
+        'rule': '',
+        'resource': {},
+        'provider': 'aws',
+        'occurred_at': datetime.now(timezone.utc),
+        'additional_info': {'batch_index': str(index), 'message_id': message_id, 'error_type': type(error).__name__}
+    }
+
+
+def get_message_cache():
+    """
+    Returns:
+        (TTLCache or None, replay mode)
+    """
+
+    global _MESSAGE_CACHE
+
+    conf = config.get_global('MESSAGE_CACHE', {})
+    if not conf.get('enabled', False):
+        return None, None
+
+    if _MESSAGE_CACHE is None:
+        with _MESSAGE_CACHE_LOCK:
+            if _MESSAGE_CACHE is None:
+                _MESSAGE_CACHE = TTLCache(max_size=conf.get('max_size', 10000), ttl=conf.get('ttl', 3600))
+
+    return _MESSAGE_CACHE, conf.get('replay', 'cached')
+
+
+def get_message_cache_stats():
+    """ Hit/miss counters of the MessageId cache, used to size MESSAGE_CACHE.max_size and ttl """
+
+    message_cache, _ = get_message_cache()
+    return message_cache.stats() if message_cache else {}
+
+
+def _collect_message_cache_stats():
+    return {f'message_cache_{key}': value for key, value in get_message_cache_stats().items()}
+
+
+metrics.add_collector(_collect_message_cache_stats)
@@ -2,6 +2,7 @@ import logging
 
 from spaceone.core.service import *
 from spaceone.monitoring.error import *
+from spaceone.monitoring.manager.event_rules import compile_event_rules
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -33,4 +34,7 @@ class WebhookService(BaseService):
         """
         options = params['options']
 
+        # Raises ERROR_INVALID_WEBHOOK_OPTIONS for severity_mapping, title_template or field_overrides in bad shape
+        compile_event_rules(options)
+
         return {}
\ No newline at end of file
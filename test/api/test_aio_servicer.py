@@ -0,0 +1,78 @@
+import asyncio
+import logging
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.api.plugin.aio import _AsyncServicer
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _AbortError(Exception):
+    pass
+
+
+class FakeAioContext(object):
+
+    def __init__(self):
+        self.aborted = None
+
+    def invocation_metadata(self):
+        return (('token', 'test'),)
+
+    async def abort(self, code, details):
+        self.aborted = (code, details)
+        raise _AbortError(details)
+
+
+class FakeServicer(object):
+
+    def parse(self, request, context):
+        return {
+            'request': request,
+            'metadata': context.invocation_metadata(),
+            'thread': threading.current_thread().name
+        }
+
+    def verify(self, request, context):
+        context.abort('INVALID_ARGUMENT', 'ERROR_INVALID_ARGUMENT: invalid options')
+
+
+class TestAsyncServicer(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='test-aio')
+        self.servicer = _AsyncServicer(FakeServicer(), self.executor)
+
+    def tearDown(self):
+        self.executor.shutdown(wait=True)
+
+    def test_run_in_executor(self):
+        response = asyncio.run(self.servicer._run('parse', 'request', FakeAioContext()))
+
+        self.assertEqual(response['request'], 'request')
+        self.assertEqual(response['metadata'], (('token', 'test'),))
+        self.assertTrue(response['thread'].startswith('test-aio'))
+
+    def test_abort_on_event_loop(self):
+        context = FakeAioContext()
+
+        with self.assertRaises(_AbortError):
+            asyncio.run(self.servicer._run('verify', 'request', context))
+
+        self.assertEqual(context.aborted, ('INVALID_ARGUMENT', 'ERROR_INVALID_ARGUMENT: invalid options'))
+
+    def test_concurrent_requests(self):
+        async def run_many():
+            return await asyncio.gather(*[self.servicer._run('parse', index, FakeAioContext())
+                                          for index in range(100)])
+
+        responses = asyncio.run(run_many())
+        self.assertEqual([response['request'] for response in responses], list(range(100)))
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,53 @@
+"""
+Compare the schematics validation path with the compiled event builder.
+
+    $ python test/benchmark/bench_event_model.py --number 20000
+"""
+import argparse
+import copy
+import sys
+import timeit
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'model'))
+
+from test_compiled_model import CLOUDWATCH_EVENT, HEALTH_EVENT
+from spaceone.monitoring.model.compiled_model import compile_model
+from spaceone.monitoring.model.cloudwatch_event_response_model import EventModel as CloudWatchEventModel
+from spaceone.monitoring.model.phd_event_response_model import EventModel as HealthEventModel
+
+
+def _schematics_path(model_cls):
+    def build(event_data):
+        event_model = model_cls(event_data, strict=False)
+        event_model.validate()
+        return event_model.to_native()
+
+    return build
+
+
+def _run(name, model_cls, event_data, number):
+    schematics_build = _schematics_path(model_cls)
+    compiled_build = compile_model(model_cls)
+
+    assert schematics_build(copy.deepcopy(event_data)) == compiled_build(copy.deepcopy(event_data))
+
+    schematics_time = timeit.timeit(lambda: schematics_build(event_data), number=number)
+    compiled_time = timeit.timeit(lambda: compiled_build(event_data), number=number)
+
+    print(f'{name:<12} schematics: {number / schematics_time:>12,.0f} events/s  '
+          f'compiled: {number / compiled_time:>12,.0f} events/s  '
+          f'speedup: x{schematics_time / compiled_time:.1f}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Event model construction benchmark')
+    parser.add_argument('--number', type=int, default=20000, help='events per measurement')
+    args = parser.parse_args()
+
+    _run('cloudwatch', CloudWatchEventModel, CLOUDWATCH_EVENT, args.number)
+    _run('health', HealthEventModel, HEALTH_EVENT, args.number)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""
+Compare stdlib json with the json_codec backend on the Message payloads of the test samples,
+and full decoding with prefix sniffing for routing.
+
+    $ python test/benchmark/bench_json_codec.py --number 20000
+"""
+import argparse
+import json
+import timeit
+
+from payload_samples import load_test_payloads
+from spaceone.monitoring.libs import json_codec
+from spaceone.monitoring.manager.event_router import route_message, sniff_route
+
+
+def main():
+    parser = argparse.ArgumentParser(description='JSON codec benchmark')
+    parser.add_argument('--number', type=int, default=20000, help='decodes per measurement')
+    args = parser.parse_args()
+
+    print(f'json_codec backend: {json_codec.BACKEND}')
+
+    for name, envelope in load_test_payloads():
+        raw_message = envelope['Message']
+        message = json.loads(raw_message)
+
+        assert json_codec.loads(raw_message) == message
+        assert sniff_route(raw_message) == route_message(message)
+
+        stdlib_time = timeit.timeit(lambda: json.loads(raw_message), number=args.number)
+        codec_time = timeit.timeit(lambda: json_codec.loads(raw_message), number=args.number)
+        route_time = timeit.timeit(lambda: route_message(json_codec.loads(raw_message)), number=args.number)
+        sniff_time = timeit.timeit(lambda: sniff_route(raw_message), number=args.number)
+
+        print(f'{name:<42} {len(raw_message):>6}B  '
+              f'json: {args.number / stdlib_time:>10,.0f}/s  '
+              f'codec: {args.number / codec_time:>10,.0f}/s (x{stdlib_time / codec_time:.1f})  '
+              f'decode+route: {args.number / route_time:>10,.0f}/s  '
+              f'sniff: {args.number / sniff_time:>10,.0f}/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+"""
+Offline parse benchmark over the corpus in corpus.py.
+
+Stages measured per payload:
+    decode      - EventService.get_message (envelope -> message dict)
+    route       - sniff_route / route_message
+    manager     - <Manager>.parse (field extraction + model validation)
+    encode      - EventsInfo (events -> protobuf)
+    end_to_end  - EventService.parse through the service decorators
+
+    $ python test/benchmark/bench_parse.py --output bench_v1.json
+    $ python test/benchmark/bench_parse.py --compare bench_v1.json --output bench_v2.json
+"""
+import argparse
+import gc
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from corpus import get_corpus
+from spaceone.core import config
+from spaceone.core.locator import Locator
+from spaceone.monitoring.info.event_info import EventsInfo
+from spaceone.monitoring.libs import json_codec
+from spaceone.monitoring.manager.event_router import route_message, sniff_route
+from spaceone.monitoring.service.event_service import EventService
+
+STAGES = ['decode', 'route', 'manager', 'encode', 'end_to_end']
+
+
+def _init_config(with_caches):
+    config.init_conf(package='spaceone.monitoring')
+    # set_global only overrides keys that are already loaded from global_conf
+    config.set_service_config()
+    config.set_global(MESSAGE_CACHE={'enabled': with_caches}, EVENT_SUPPRESSION={'enabled': with_caches})
+
+
+def _make_stages(locator, event_service, envelope):
+    """
+    Returns:
+        dict of {stage: (callable, returns events)}
+    """
+
+    if envelope.get('Type') == 'SubscriptionConfirmation':
+        # After the first call the same TopicArn/Token only hits the dedup cache
+        return {
+            'end_to_end': (lambda: event_service.parse({'options': {}, 'data': envelope}), True)
+        }
+
+    message = EventService.get_message(envelope)
+    manager_name = route_message(message)
+    manager = locator.get_manager(manager_name)
+    message['subject'] = envelope.get('Subject', '')
+    events = manager.parse({}, message)
+
+    return {
+        'decode': (lambda: EventService.get_message(envelope), False),
+        'route': (lambda: sniff_route(envelope['Message']) or route_message(message), False),
+        'manager': (lambda: manager.parse({}, message), True),
+        'encode': (lambda: EventsInfo(events), False),
+        'end_to_end': (lambda: event_service.parse({'options': {}, 'data': envelope}), True)
+    }
+
+
+def _measure(func, returns_events, min_time, max_rounds):
+    latencies = []
+    event_count = 0
+    started = time.perf_counter()
+
+    while (len(latencies) < max_rounds and (time.perf_counter() - started) < min_time) or len(latencies) < 5:
+        begin = time.perf_counter_ns()
+        result = func()
+        latencies.append(time.perf_counter_ns() - begin)
+
+        if returns_events:
+            event_count += len(result)
+
+    total_seconds = sum(latencies) / 1e9
+    latencies.sort()
+
+    return {
+        'rounds': len(latencies),
+        'ops_per_sec': len(latencies) / total_seconds,
+        'events_per_sec': event_count / total_seconds if returns_events else None,
+        'mean_us': statistics.fmean(latencies) / 1000,
+        'p50_us': latencies[len(latencies) // 2] / 1000,
+        'p99_us': latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] / 1000,
+        'alloc_kb': _measure_allocations(func)
+    }
+
+
+def _measure_allocations(func, rounds=5):
+    """ Tracing is restarted every round to reset the peak, tracemalloc.reset_peak() needs python 3.9 """
+
+    gc.collect()
+    peak = 0
+
+    for _ in range(rounds):
+        tracemalloc.start()
+        try:
+            func()
+            _, round_peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        peak = max(peak, round_peak)
+
+    return peak / 1024
+
+
+def run(args):
+    _init_config(args.with_caches)
+
+    locator = Locator()
+    results = {}
+
+    with locator.get_service('EventService', {}) as event_service:
+        for name, make_envelope in get_corpus().items():
+            if args.payload and not any(pattern in name for pattern in args.payload):
+                continue
+
+            envelope = make_envelope()
+            for stage, (func, returns_events) in _make_stages(locator, event_service, envelope).items():
+                results[f'{name}:{stage}'] = _measure(func, returns_events, args.min_time, args.max_rounds)
+
+    return {
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'json_backend': json_codec.BACKEND,
+        'with_caches': args.with_caches,
+        'results': results
+    }
+
+
+def print_report(report, baseline=None):
+    baseline_results = baseline['results'] if baseline else {}
+
+    print(f'{"payload:stage":<58} {"ops/s":>12} {"events/s":>12} {"p50 us":>10} {"p99 us":>10} '
+          f'{"alloc KB":>10} {"vs base":>8}')
+
+    for key, result in report['results'].items():
+        events_per_sec = f'{result["events_per_sec"]:,.0f}' if result['events_per_sec'] is not None else '-'
+
+        change = ''
+        if base := baseline_results.get(key):
+            change = f'x{result["ops_per_sec"] / base["ops_per_sec"]:.2f}'
+
+        print(f'{key:<58} {result["ops_per_sec"]:>12,.0f} {events_per_sec:>12} {result["p50_us"]:>10,.1f} '
+              f'{result["p99_us"]:>10,.1f} {result["alloc_kb"]:>10,.1f} {change:>8}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline parse benchmark')
+    parser.add_argument('--payload', action='append', help='run only payloads whose name contains this text')
+    parser.add_argument('--min-time', type=float, default=1.0, help='seconds per stage measurement')
+    parser.add_argument('--max-rounds', type=int, default=100000, help='max calls per stage measurement')
+    parser.add_argument('--with-caches', action='store_true', help='keep MESSAGE_CACHE and EVENT_SUPPRESSION on')
+    parser.add_argument('--output', help='save the results as JSON')
+    parser.add_argument('--compare', help='JSON results of a previous run to compare with')
+    args = parser.parse_args()
+
+    report = run(args)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    print_report(report, baseline)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+"""
+Compare datetime.strptime with the time_parser module on SNS, CloudWatch and Health timestamps.
+
+    $ python test/benchmark/bench_time_parser.py --number 100000
+"""
+import argparse
+import timeit
+from datetime import datetime
+
+from spaceone.monitoring.libs.time_parser import parse_iso8601, parse_health_time
+
+SAMPLES = [
+    ('sns', '2021-06-27T13:53:39.389Z', '%Y-%m-%dT%H:%M:%S.%fZ', parse_iso8601),
+    ('cloudwatch', '2021-06-10T04:28:46.868+0000', '%Y-%m-%dT%H:%M:%S.%f+0000', parse_iso8601),
+    ('health', 'Sat, 04 Jun 2016 05:01:10 GMT', '%a, %d %b %Y %H:%M:%S %Z', parse_health_time),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Timestamp parsing benchmark')
+    parser.add_argument('--number', type=int, default=100000, help='parses per measurement')
+    args = parser.parse_args()
+
+    for name, value, strptime_format, parse in SAMPLES:
+        uncached_parse = parse.__wrapped__
+
+        assert uncached_parse(value).replace(tzinfo=None) == datetime.strptime(value, strptime_format)
+
+        strptime_time = timeit.timeit(lambda: datetime.strptime(value, strptime_format), number=args.number)
+        uncached_time = timeit.timeit(lambda: uncached_parse(value), number=args.number)
+        cached_time = timeit.timeit(lambda: parse(value), number=args.number)
+
+        print(f'{name:<12} strptime: {args.number / strptime_time:>12,.0f}/s  '
+              f'time_parser: {args.number / uncached_time:>12,.0f}/s (x{strptime_time / uncached_time:.1f})  '
+              f'memoized: {args.number / cached_time:>12,.0f}/s (x{strptime_time / cached_time:.1f})')
+
+
+if __name__ == '__main__':
+    main()
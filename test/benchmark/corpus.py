@@ -0,0 +1,188 @@
+"""
+Realistic SNS envelopes for the parse benchmarks.
+Every generator returns a new envelope with a unique MessageId, so idempotency caches never hide parse work.
+"""
+import json
+import uuid
+
+from payload_samples import load_test_payloads
+
+ACCOUNT_ID = '123456789012'
+
+
+def cloudwatch_single_dimension():
+    message = _cloudwatch_message('EC2-CPU', {
+        'MetricName': 'CPUUtilization',
+        'Namespace': 'AWS/EC2',
+        'StatisticType': 'Statistic',
+        'Statistic': 'AVERAGE',
+        'Unit': None,
+        'Dimensions': [{'value': 'i-0f672ea50a80cda4b', 'name': 'InstanceId'}],
+        'Period': 300,
+        'EvaluationPeriods': 1,
+        'ComparisonOperator': 'GreaterThanThreshold',
+        'Threshold': 15.0,
+        'TreatMissingData': '- TreatMissingData: missing',
+        'EvaluateLowSampleCountPercentile': ''
+    }, 'Threshold Crossed: 1 out of the last 1 datapoints [17.2564528039004 (23/06/21 08:31:00)] was greater '
+       'than the threshold (15.0) (minimum 1 datapoint for OK -> ALARM transition).')
+
+    return _sns_envelope(message, 'ALARM: "EC2-CPU" in Asia Pacific (Seoul)')
+
+
+def cloudwatch_anomaly_band(metric_count=3):
+    metrics = []
+    for index in range(metric_count):
+        metrics.append({
+            'Id': f'm{index}',
+            'MetricStat': {
+                'Metric': {
+                    'Dimensions': [{'value': f'cluster-{index}', 'name': 'ClusterName'}],
+                    'MetricName': 'pod_cpu_utilization',
+                    'Namespace': 'ContainerInsights'
+                },
+                'Period': 60,
+                'Stat': 'Average'
+            },
+            'ReturnData': True
+        })
+        metrics.append({
+            'Expression': f'ANOMALY_DETECTION_BAND(m{index}, 2)',
+            'Id': f'ad{index}',
+            'Label': 'pod_cpu_utilization (expected)',
+            'ReturnData': True
+        })
+
+    message = _cloudwatch_message('ContainerInsight-pod_cpu_utilization', {
+        'Period': 60,
+        'EvaluationPeriods': 1,
+        'ComparisonOperator': 'LessThanLowerOrGreaterThanUpperThreshold',
+        'ThresholdMetricId': 'ad0',
+        'TreatMissingData': '- TreatMissingData:                    missing',
+        'EvaluateLowSampleCountPercentile': '',
+        'Metrics': metrics
+    }, 'Thresholds Crossed: 1 out of the last 1 datapoints [0.3647359623208398 (25/08/21 13:28:00)] was less than '
+       'the lower thresholds [0.3745361004392295] or greater than the upper thresholds [0.42329814009957095] '
+       '(minimum 1 datapoint for OK -> ALARM transition).')
+
+    return _sns_envelope(message, 'ALARM: "ContainerInsight-pod_cpu_utilization" in Asia Pacific (Seoul)')
+
+
+def cloudwatch_many_dimensions(dimension_count=60):
+    message = _cloudwatch_message('EBS-BurstBalance', {
+        'MetricName': 'BurstBalance',
+        'Namespace': 'AWS/EBS',
+        'StatisticType': 'Statistic',
+        'Statistic': 'MINIMUM',
+        'Unit': None,
+        'Dimensions': [{'value': f'vol-{index:017x}', 'name': 'VolumeId'} for index in range(dimension_count)],
+        'Period': 300,
+        'EvaluationPeriods': 1,
+        'ComparisonOperator': 'LessThanThreshold',
+        'Threshold': 20.0,
+        'TreatMissingData': '- TreatMissingData: missing',
+        'EvaluateLowSampleCountPercentile': ''
+    }, 'Threshold Crossed: 1 out of the last 1 datapoints [10.0 (23/06/21 08:31:00)] was less than the '
+       'threshold (20.0) (minimum 1 datapoint for OK -> ALARM transition).')
+
+    return _sns_envelope(message, 'ALARM: "EBS-BurstBalance" in Asia Pacific (Seoul)')
+
+
+def health_many_entities(entity_count=2000):
+    entities = [f'arn:aws:ec2:us-east-1:{ACCOUNT_ID}:instance/i-{index:017x}' for index in range(entity_count)]
+    message = {
+        'version': '0',
+        'id': str(uuid.uuid4()),
+        'detail-type': 'AWS Health Event',
+        'source': 'aws.health',
+        'account': ACCOUNT_ID,
+        'time': '2018-08-01T06:27:57Z',
+        'region': 'us-east-1',
+        'resources': entities,
+        'detail': {
+            'eventArn': 'arn:aws:health:us-east-1::event/EC2/AWS_EC2_OPERATIONAL_ISSUE/AWS_EC2_OPERATIONAL_ISSUE_1',
+            'service': 'EC2',
+            'eventTypeCode': 'AWS_EC2_OPERATIONAL_ISSUE',
+            'eventTypeCategory': 'issue',
+            'startTime': 'Wed, 01 Aug 2018 06:27:57 GMT',
+            'eventDescription': [{
+                'language': 'en_US',
+                'latestDescription': 'We are investigating increased API error rates in the US-EAST-1 Region.'
+            }],
+            'affectedEntities': [{'entityValue': entity} for entity in entities]
+        }
+    }
+
+    return _sns_envelope(message)
+
+
+def subscription_confirmation():
+    topic_arn = f'arn:aws:sns:ap-northeast-2:{ACCOUNT_ID}:spaceone-notification'
+    token = uuid.uuid4().hex
+
+    return {
+        'Type': 'SubscriptionConfirmation',
+        'MessageId': str(uuid.uuid4()),
+        'Token': token,
+        'TopicArn': topic_arn,
+        'Message': f'You have chosen to subscribe to the topic {topic_arn}.',
+        # Discard port on localhost, the background confirmation fails fast without leaving the host
+        'SubscribeURL': f'http://127.0.0.1:9/?Action=ConfirmSubscription&TopicArn={topic_arn}&Token={token}',
+        'Timestamp': '2022-03-16T11:06:53.295Z',
+        'SignatureVersion': '1'
+    }
+
+
+def test_sample(envelope):
+    return lambda: dict(envelope, MessageId=str(uuid.uuid4()))
+
+
+def get_corpus():
+    """
+    Returns:
+        dict of {name: envelope generator}
+    """
+
+    corpus = {
+        'cloudwatch_single_dimension': cloudwatch_single_dimension,
+        'cloudwatch_anomaly_band': cloudwatch_anomaly_band,
+        'cloudwatch_60_dimensions': cloudwatch_many_dimensions,
+        'health_2000_entities': health_many_entities,
+        'subscription_confirmation': subscription_confirmation,
+    }
+
+    for name, envelope in load_test_payloads():
+        corpus[f'sample.{name}'] = test_sample(envelope)
+
+    return corpus
+
+
+def _cloudwatch_message(alarm_name, trigger, reason):
+    return {
+        'AlarmName': alarm_name,
+        'AlarmDescription': None,
+        'AWSAccountId': ACCOUNT_ID,
+        'NewStateValue': 'ALARM',
+        'NewStateReason': reason,
+        'StateChangeTime': '2021-06-23T08:41:06.622+0000',
+        'Region': 'Asia Pacific (Seoul)',
+        'AlarmArn': f'arn:aws:cloudwatch:ap-northeast-2:{ACCOUNT_ID}:alarm:{alarm_name}',
+        'OldStateValue': 'OK',
+        'Trigger': trigger
+    }
+
+
+def _sns_envelope(message, subject=None):
+    envelope = {
+        'Type': 'Notification',
+        'MessageId': str(uuid.uuid4()),
+        'TopicArn': f'arn:aws:sns:ap-northeast-2:{ACCOUNT_ID}:spaceone-notification',
+        'Message': json.dumps(message),
+        'Timestamp': '2021-06-23T08:41:06.656Z',
+        'SignatureVersion': '1'
+    }
+
+    if subject:
+        envelope['Subject'] = subject
+
+    return envelope
@@ -0,0 +1,36 @@
+"""
+SNS envelopes used by the tests under test/api and test/service, collected without running them.
+"""
+import ast
+import glob
+import os
+
+_TEST_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+def load_test_payloads():
+    """
+    Returns:
+        list of (name, envelope) for every {'options': ..., 'data': ...} literal found in the tests
+    """
+
+    payloads = []
+    for path in sorted(glob.glob(os.path.join(_TEST_DIR, 'api', 'test_*.py')) +
+                       glob.glob(os.path.join(_TEST_DIR, 'service', 'test_*.py'))):
+        with open(path) as f:
+            tree = ast.parse(f.read())
+
+        for node in ast.walk(tree):
+            if not (isinstance(node, ast.Assign) and isinstance(node.value, ast.Dict)):
+                continue
+
+            try:
+                value = ast.literal_eval(node.value)
+            except ValueError:
+                continue
+
+            if isinstance(value.get('data'), dict) and value['data'].get('Type') == 'Notification':
+                name = f'{os.path.basename(path)[:-3]}.{node.targets[0].id}'
+                payloads.append((name, value['data']))
+
+    return payloads
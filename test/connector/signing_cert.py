@@ -0,0 +1,45 @@
+import base64
+import datetime
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+from cryptography.x509.oid import NameOID
+
+from spaceone.monitoring.libs.sns_signature import build_string_to_sign
+
+_HASH_ALGORITHMS = {
+    '1': hashes.SHA1,
+    '2': hashes.SHA256
+}
+
+
+class SigningCert(object):
+    """
+    Locally generated key and self-signed certificate that signs SNS envelopes like AWS does.
+    pem: certificate to serve as SigningCertURL
+    """
+
+    def __init__(self, common_name='sns.ap-northeast-2.amazonaws.com'):
+        self._private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+        subject = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, common_name)])
+        now = datetime.datetime.utcnow()
+        certificate = x509.CertificateBuilder() \
+            .subject_name(subject) \
+            .issuer_name(subject) \
+            .public_key(self._private_key.public_key()) \
+            .serial_number(x509.random_serial_number()) \
+            .not_valid_before(now) \
+            .not_valid_after(now + datetime.timedelta(days=1)) \
+            .sign(self._private_key, hashes.SHA256())
+
+        self.pem = certificate.public_bytes(serialization.Encoding.PEM)
+
+    def sign(self, raw_data, signature_version='1'):
+        """ Return a copy of raw_data with Signature and SignatureVersion set """
+
+        signature = self._private_key.sign(build_string_to_sign(raw_data), padding.PKCS1v15(),
+                                           _HASH_ALGORITHMS[signature_version]())
+
+        return dict(raw_data, SignatureVersion=signature_version, Signature=base64.b64encode(signature).decode())
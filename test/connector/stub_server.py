@@ -0,0 +1,63 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubServer(object):
+    """
+    Local HTTP server for connector tests.
+    responses: list of (status_code, delay_seconds) served in order, the last one is repeated.
+    body: bytes returned with every response
+    """
+
+    def __init__(self, responses=None, body=b'<ConfirmSubscriptionResponse/>'):
+        self.responses = responses or [(200, 0)]
+        self.body = body
+        self.requests = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return f'http://127.0.0.1:{self._server.server_port}'
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def wait_requests(self, count, timeout=5):
+        deadline = time.monotonic() + timeout
+        while len(self.requests) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return len(self.requests)
+
+    def _next_response(self, path):
+        with self._lock:
+            index = min(len(self.requests), len(self.responses) - 1)
+            self.requests.append(path)
+            return self.responses[index]
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                status_code, delay = stub._next_response(self.path)
+                if delay:
+                    time.sleep(delay)
+
+                body = stub.body
+                self.send_response(status_code)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
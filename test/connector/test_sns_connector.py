@@ -0,0 +1,74 @@
+import copy
+import logging
+import unittest
+
+import requests
+from spaceone.core import config
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.connector.sns_connector import SNSConnector
+from spaceone.monitoring.error.event import ERROR_SUBSCRIPTION_CONFIRM
+from stub_server import StubServer
+
+_LOGGER = logging.getLogger(__name__)
+
+STUB_CONFIG = {
+    'connect_timeout': 1,
+    'read_timeout': 0.5,
+    'retries': 2,
+    'backoff_factor': 0,
+    'pool_maxsize': 2
+}
+
+
+class TestSNSConnector(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.monitoring')
+        config.set_service_config()
+        cls.connectors = copy.deepcopy(config.get_global('CONNECTORS'))
+        # BaseConnector reads its options from CONNECTORS only
+        config.set_global(CONNECTORS={'SNSConnector': STUB_CONFIG})
+
+    @classmethod
+    def tearDownClass(cls):
+        config.set_global(CONNECTORS=cls.connectors)
+
+    def test_confirm_subscription(self):
+        stub = StubServer().start()
+        try:
+            status_code = SNSConnector().confirm_subscription(f'{stub.url}/?Action=ConfirmSubscription')
+            self.assertEqual(status_code, 200)
+            self.assertEqual(len(stub.requests), 1)
+        finally:
+            stub.stop()
+
+    def test_retry_with_backoff(self):
+        stub = StubServer(responses=[(503, 0), (503, 0), (200, 0)]).start()
+        try:
+            status_code = SNSConnector().confirm_subscription(f'{stub.url}/?Action=ConfirmSubscription')
+            self.assertEqual(status_code, 200)
+            self.assertEqual(len(stub.requests), 3)
+        finally:
+            stub.stop()
+
+    def test_error_status(self):
+        stub = StubServer(responses=[(403, 0)]).start()
+        try:
+            with self.assertRaises(ERROR_SUBSCRIPTION_CONFIRM):
+                SNSConnector().confirm_subscription(f'{stub.url}/?Action=ConfirmSubscription')
+        finally:
+            stub.stop()
+
+    def test_timeout(self):
+        stub = StubServer(responses=[(200, 2)]).start()
+        try:
+            with self.assertRaises(requests.exceptions.RequestException):
+                SNSConnector().confirm_subscription(f'{stub.url}/?Action=ConfirmSubscription')
+        finally:
+            stub.stop()
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,88 @@
+import json
+import logging
+import unittest
+
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.libs.batch_envelope import is_batch, iter_envelopes
+
+_LOGGER = logging.getLogger(__name__)
+
+MESSAGE = json.dumps({'AlarmName': 'EC2-CPU', 'NewStateValue': 'ALARM'})
+
+SNS_ENVELOPE = {
+    'Type': 'Notification',
+    'MessageId': 'e7c82e01-7cd8-5569-9ac1-774d893afc01',
+    'Subject': 'ALARM: "EC2-CPU" in Asia Pacific (Seoul)',
+    'Message': MESSAGE
+}
+
+EVENTBRIDGE_EVENT = {
+    'version': '0',
+    'id': '7bf73129-1428-4cd3-a780-95db273d1602',
+    'detail-type': 'AWS Health Event',
+    'source': 'aws.health',
+    'detail': {}
+}
+
+
+class TestBatchEnvelope(unittest.TestCase):
+
+    def test_is_batch(self):
+        self.assertTrue(is_batch({'Batch': []}))
+        self.assertTrue(is_batch({'Records': [{'body': '{}'}]}))
+        self.assertTrue(is_batch({'Records': [EVENTBRIDGE_EVENT]}))
+        self.assertFalse(is_batch(SNS_ENVELOPE))
+        self.assertFalse(is_batch({'Records': 'not a list'}))
+
+    def test_sqs_records(self):
+        records = [
+            {'eventSource': 'aws:sqs', 'messageId': 'sqs-1', 'body': json.dumps(SNS_ENVELOPE)},
+            {'eventSource': 'aws:sqs', 'messageId': 'sqs-2', 'body': MESSAGE}
+        ]
+
+        envelopes = list(iter_envelopes({'Records': records}))
+
+        self.assertEqual(envelopes[0], (0, SNS_ENVELOPE['MessageId'], SNS_ENVELOPE))
+        self.assertEqual(envelopes[1], (1, 'sqs-2', {'Type': 'Notification', 'MessageId': 'sqs-2',
+                                                     'Message': MESSAGE}))
+
+    def test_sns_records(self):
+        sns = dict(SNS_ENVELOPE, SigningCertUrl='https://sns.ap-northeast-2.amazonaws.com/cert.pem')
+
+        [(index, message_id, envelope)] = iter_envelopes({'Records': [{'EventSource': 'aws:sns', 'Sns': sns}]})
+
+        self.assertEqual(message_id, SNS_ENVELOPE['MessageId'])
+        self.assertEqual(envelope['SigningCertURL'], sns['SigningCertUrl'])
+        self.assertNotIn('SigningCertUrl', envelope)
+
+    def test_eventbridge_records(self):
+        [(index, message_id, envelope)] = iter_envelopes({'Records': [EVENTBRIDGE_EVENT]})
+
+        self.assertEqual(message_id, EVENTBRIDGE_EVENT['id'])
+        self.assertIs(envelope, EVENTBRIDGE_EVENT)
+
+    def test_invalid_records(self):
+        records = [
+            'not an object',
+            {'eventSource': 'aws:sqs', 'messageId': 'sqs-1', 'body': '{invalid'},
+            {'eventSource': 'aws:sqs', 'messageId': 'sqs-2', 'body': '[]'},
+            SNS_ENVELOPE
+        ]
+
+        envelopes = list(iter_envelopes({'Records': records}))
+
+        self.assertEqual([message_id for _, message_id, _ in envelopes], ['', 'sqs-1', 'sqs-2',
+                                                                          SNS_ENVELOPE['MessageId']])
+        self.assertTrue(all(isinstance(envelope, Exception) for _, _, envelope in envelopes[:3]))
+        self.assertIs(envelopes[3][2], SNS_ENVELOPE)
+
+    def test_one_record_at_a_time(self):
+        envelopes = iter_envelopes({'Batch': [SNS_ENVELOPE, 'not an object']})
+
+        self.assertEqual(next(envelopes), (0, SNS_ENVELOPE['MessageId'], SNS_ENVELOPE))
+        self.assertIsInstance(next(envelopes)[2], ValueError)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
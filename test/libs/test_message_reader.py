@@ -0,0 +1,117 @@
+import json
+import logging
+import unittest
+from unittest import mock
+
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.libs import message_reader
+from spaceone.monitoring.libs.message_reader import MessageLimitExceeded, read_message, get_size
+
+_LOGGER = logging.getLogger(__name__)
+
+HEALTH_FIELDS = frozenset(['id', 'detail-type', 'source', 'account', 'time', 'region', 'detail'])
+
+
+def _make_health_message(resource_count, entity_count):
+    return json.dumps({
+        'id': '7bf73129-1428-4cd3-a780-95db273d1602',
+        'detail-type': 'AWS Health Event',
+        'source': 'aws.health',
+        'account': '123456789012',
+        'region': 'ap-southeast-2',
+        'resources': [f'i-{index:017x}' for index in range(resource_count)],
+        'detail': {
+            'service': 'EC2',
+            'eventTypeCategory': 'scheduledChange',
+            'affectedEntities': [{'entityValue': f'i-{index:017x}', 'tags': {'index': index}}
+                                 for index in range(entity_count)],
+            'eventDescription': [{'language': 'en_US', 'latestDescription': 'ü' * 10}]
+        }
+    })
+
+
+class TestMessageReader(unittest.TestCase):
+
+    def test_small_message(self):
+        raw_message = _make_health_message(10, 10)
+
+        self.assertEqual(read_message(raw_message, fields=HEALTH_FIELDS, incremental_threshold=len(raw_message)),
+                         json.loads(raw_message))
+
+    @unittest.skipUnless(message_reader.INCREMENTAL, 'ijson is not installed')
+    def test_incremental_message(self):
+        raw_message = _make_health_message(1000, 100)
+        expected = json.loads(raw_message)
+        del expected['resources']
+
+        message = read_message(raw_message, fields=HEALTH_FIELDS, max_array_length=100, incremental_threshold=1024)
+
+        self.assertEqual(message, expected)
+        self.assertIsInstance(message['detail']['affectedEntities'][0]['tags']['index'], int)
+
+    @unittest.skipUnless(message_reader.INCREMENTAL, 'ijson is not installed')
+    def test_incremental_skipped_field_not_limited(self):
+        raw_message = _make_health_message(1000, 10)
+
+        message = read_message(raw_message, fields=HEALTH_FIELDS, max_array_length=100, incremental_threshold=1024)
+
+        self.assertNotIn('resources', message)
+
+    def test_all_fields_without_ijson(self):
+        raw_message = _make_health_message(1000, 10)
+
+        with mock.patch.object(message_reader, 'INCREMENTAL', False):
+            with self.assertRaises(MessageLimitExceeded):
+                read_message(raw_message, fields=HEALTH_FIELDS, max_array_length=100, incremental_threshold=1024)
+
+            message = read_message(raw_message, fields=HEALTH_FIELDS, incremental_threshold=1024)
+
+        self.assertEqual(set(message), HEALTH_FIELDS - {'time'})
+
+    def test_max_array_length(self):
+        raw_message = _make_health_message(0, 101)
+
+        with self.assertRaises(MessageLimitExceeded) as cm:
+            read_message(raw_message, fields=HEALTH_FIELDS, max_array_length=100, incremental_threshold=1024)
+
+        self.assertEqual(cm.exception.limit, 'max_array_length')
+        if message_reader.INCREMENTAL:
+            self.assertIn('detail.affectedEntities', str(cm.exception))
+
+    def test_max_array_length_of_small_message(self):
+        raw_message = _make_health_message(0, 50)
+
+        with self.assertRaises(MessageLimitExceeded) as cm:
+            read_message(raw_message, fields=HEALTH_FIELDS, max_array_length=10, incremental_threshold=len(raw_message))
+
+        self.assertEqual(cm.exception.limit, 'max_array_length')
+
+    def test_skip_array_walk_of_small_message(self):
+        raw_message = _make_health_message(0, 10)
+
+        with mock.patch.object(message_reader, '_check_array_lengths') as check_array_lengths:
+            read_message(raw_message, max_array_length=1000, incremental_threshold=len(raw_message))
+            read_message(raw_message.encode('utf-8'), max_array_length=10, incremental_threshold=len(raw_message) * 2)
+
+        check_array_lengths.assert_called_once()
+
+    def test_max_bytes(self):
+        raw_message = _make_health_message(0, 0)
+
+        with self.assertRaises(MessageLimitExceeded) as cm:
+            read_message(raw_message, max_bytes=get_size(raw_message) - 1)
+
+        self.assertEqual(cm.exception.limit, 'max_bytes')
+        self.assertEqual(get_size(raw_message), len(raw_message.encode('utf-8')))
+
+    def test_not_an_object(self):
+        self.assertEqual(read_message('[1, 2, 3]' + ' ' * 100, incremental_threshold=10), [1, 2, 3])
+
+    def test_invalid_json(self):
+        with self.assertRaises(ValueError):
+            read_message('{"AlarmName": ' + ' ' * 100, incremental_threshold=10)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
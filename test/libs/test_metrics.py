@@ -0,0 +1,91 @@
+import logging
+import threading
+import unittest
+from unittest import mock
+
+from spaceone.core import config
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.libs import metrics
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TestMetrics(unittest.TestCase):
+
+    def tearDown(self):
+        metrics.configure(enabled=False)
+
+    def test_disabled(self):
+        metrics.configure(enabled=False)
+
+        with metrics.stage('test_disabled'):
+            pass
+        metrics.inc('test_disabled_total')
+
+        self.assertNotIn('test_disabled', metrics.render())
+
+    def test_stage_histogram(self):
+        metrics.configure(enabled=True)
+
+        with metrics.stage('test_stage_histogram', manager='EventManager'):
+            pass
+
+        text = metrics.render()
+        self.assertIn('# TYPE aws_sns_webhook_parse_stage_seconds histogram', text)
+        self.assertIn('aws_sns_webhook_parse_stage_seconds_count{manager="EventManager",stage="test_stage_histogram"} 1',
+                      text)
+
+    def test_counter(self):
+        metrics.configure(enabled=True)
+
+        metrics.inc('test_counter_total', type='KeyError')
+        metrics.inc('test_counter_total', type='KeyError')
+
+        self.assertIn('aws_sns_webhook_test_counter_total{type="KeyError"} 2', metrics.render())
+
+    def test_count_histogram_buckets(self):
+        metrics.configure(enabled=True)
+
+        metrics.observe('test_count_histogram_buckets', 3)
+
+        text = metrics.render()
+        self.assertIn('aws_sns_webhook_test_count_histogram_buckets_bucket{le="2"} 0', text)
+        self.assertIn('aws_sns_webhook_test_count_histogram_buckets_bucket{le="5"} 1', text)
+        self.assertIn('aws_sns_webhook_test_count_histogram_buckets_bucket{le="+Inf"} 1', text)
+
+
+    def test_escape_label_values(self):
+        metrics.configure(enabled=True)
+
+        metrics.inc('test_escape_label_values_total', type='a\\b "c"\nd')
+
+        self.assertIn('aws_sns_webhook_test_escape_label_values_total{type="a\\\\b \\"c\\"\\nd"} 1', metrics.render())
+
+    def test_configure_once_on_concurrent_first_use(self):
+        config.init_conf(package='spaceone.monitoring')
+        config.set_service_config()
+        metrics_conf = dict(config.get_global('METRICS'))
+        config.set_global(METRICS={'enabled': True, 'port': 9500})
+        metrics._configured = False
+        barrier = threading.Barrier(8)
+
+        def first_use():
+            barrier.wait()
+            metrics.is_enabled()
+
+        try:
+            with mock.patch.object(metrics, '_start_http_server') as start_http_server:
+                threads = [threading.Thread(target=first_use) for _ in range(8)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+        finally:
+            config.set_global(METRICS=metrics_conf)
+
+        start_http_server.assert_called_once_with(9500)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,62 @@
+import logging
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.libs import profiler
+
+_LOGGER = logging.getLogger(__name__)
+
+RAW_DATA = {'MessageId': 'message-1', 'Message': '{}'}
+
+
+class TestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        profiler.configure(enabled=False)
+
+    def test_zero_sample_rate_disables(self):
+        profiler.configure(enabled=True, sample_rate=0, output_dir=self.output_dir)
+
+        for _ in range(3):
+            with profiler.sample(RAW_DATA):
+                pass
+
+        self.assertEqual(os.listdir(self.output_dir), [])
+
+    def test_invalid_sample_rate_from_environment(self):
+        with mock.patch.dict(os.environ, {'AWS_SNS_WEBHOOK_PROFILE_RATE': 'every'}):
+            with self.assertLogs(profiler.__name__, 'WARNING'):
+                profiler.configure(output_dir=self.output_dir)
+
+        with profiler.sample(RAW_DATA):
+            pass
+
+        self.assertEqual(os.listdir(self.output_dir), [])
+
+    def test_zero_sample_rate_from_environment(self):
+        with mock.patch.dict(os.environ, {'AWS_SNS_WEBHOOK_PROFILE_RATE': '0'}):
+            profiler.configure(enabled=True, output_dir=self.output_dir)
+
+        with profiler.sample(RAW_DATA):
+            pass
+
+        self.assertEqual(os.listdir(self.output_dir), [])
+
+    def test_profile_every_request(self):
+        profiler.configure(enabled=True, sample_rate=1, output_dir=self.output_dir)
+
+        with profiler.sample(RAW_DATA) as request_sample:
+            request_sample.manager = 'EventManager'
+
+        self.assertEqual(len([name for name in os.listdir(self.output_dir) if name.endswith('.prof')]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
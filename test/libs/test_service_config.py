@@ -0,0 +1,34 @@
+import logging
+import os
+import tempfile
+import unittest
+
+from spaceone.core import config
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.libs.service_config import load_service_config
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TestServiceConfig(unittest.TestCase):
+
+    def test_load_service_config(self):
+        load_service_config()
+
+        self.assertEqual(config.get_global('AIO_SERVER')['max_workers'], 10)
+
+    def test_config_file_overrides_global_conf(self):
+        with tempfile.TemporaryDirectory() as config_dir:
+            config_file = os.path.join(config_dir, 'config.yml')
+            with open(config_file, 'w') as f:
+                f.write('GLOBAL:\n  AIO_SERVER:\n    max_workers: 3\n')
+
+            load_service_config(config_file)
+
+        self.assertEqual(config.get_global('AIO_SERVER')['max_workers'], 3)
+        self.assertEqual(config.get_global('AIO_SERVER')['max_concurrent_rpcs'], 1000)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
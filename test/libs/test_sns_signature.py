@@ -0,0 +1,86 @@
+import logging
+import os
+import sys
+import unittest
+
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.libs.sns_signature import build_string_to_sign, compile_host_patterns, \
+    is_allowed_cert_url, load_public_key, verify_signature
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'connector'))
+
+from signing_cert import SigningCert
+
+_LOGGER = logging.getLogger(__name__)
+
+NOTIFICATION = {
+    'Type': 'Notification',
+    'MessageId': '22b80b92-fdea-4c2c-8f9d-bdfb0c7bf324',
+    'TopicArn': 'arn:aws:sns:us-west-2:123456789012:MyTopic',
+    'Subject': 'ALARM: "EC2-CPU" in Asia Pacific (Seoul)',
+    'Message': '{"AlarmName": "EC2-CPU"}',
+    'Timestamp': '2021-06-23T08:41:06.683Z',
+    'SigningCertURL': 'https://sns.us-west-2.amazonaws.com/SimpleNotificationService-f3ecfb7224c7233fe7bb5f59f96de52f.pem'
+}
+
+HOST_PATTERNS = compile_host_patterns([r'^sns\.[a-z0-9-]+\.amazonaws\.com(\.cn)?$'])
+
+
+class TestSNSSignature(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.signing_cert = SigningCert()
+        cls.public_key = load_public_key(cls.signing_cert.pem)
+
+    def test_build_string_to_sign(self):
+        notification = dict(NOTIFICATION)
+        del notification['Subject']
+
+        self.assertEqual(build_string_to_sign(notification),
+                         b'Message\n{"AlarmName": "EC2-CPU"}\n'
+                         b'MessageId\n22b80b92-fdea-4c2c-8f9d-bdfb0c7bf324\n'
+                         b'Timestamp\n2021-06-23T08:41:06.683Z\n'
+                         b'TopicArn\narn:aws:sns:us-west-2:123456789012:MyTopic\n'
+                         b'Type\nNotification\n')
+
+    def test_build_string_to_sign_missing_key(self):
+        confirmation = dict(NOTIFICATION, Type='SubscriptionConfirmation')
+
+        with self.assertRaises(ValueError):
+            build_string_to_sign(confirmation)
+
+    def test_verify_signature(self):
+        for signature_version in ['1', '2']:
+            raw_data = self.signing_cert.sign(NOTIFICATION, signature_version)
+            self.assertTrue(verify_signature(self.public_key, raw_data['Signature'], build_string_to_sign(raw_data),
+                                             raw_data['SignatureVersion']))
+
+    def test_verify_tampered_message(self):
+        raw_data = dict(self.signing_cert.sign(NOTIFICATION, '2'), Message='{"AlarmName": "Injected"}')
+
+        self.assertFalse(verify_signature(self.public_key, raw_data['Signature'], build_string_to_sign(raw_data),
+                                          raw_data['SignatureVersion']))
+
+    def test_verify_invalid_signature(self):
+        string_to_sign = build_string_to_sign(NOTIFICATION)
+
+        self.assertFalse(verify_signature(self.public_key, 'not base64 !', string_to_sign, '2'))
+        with self.assertRaises(ValueError):
+            verify_signature(self.public_key, '', string_to_sign, '3')
+
+    def test_is_allowed_cert_url(self):
+        self.assertTrue(is_allowed_cert_url(NOTIFICATION['SigningCertURL'], ['https'], HOST_PATTERNS))
+        self.assertTrue(is_allowed_cert_url('https://sns.cn-north-1.amazonaws.com.cn/cert.pem', ['https'],
+                                            HOST_PATTERNS))
+        self.assertFalse(is_allowed_cert_url('http://sns.us-west-2.amazonaws.com/cert.pem', ['https'], HOST_PATTERNS))
+        self.assertFalse(is_allowed_cert_url('https://sns.us-west-2.amazonaws.com.evil.com/cert.pem', ['https'],
+                                             HOST_PATTERNS))
+        self.assertFalse(is_allowed_cert_url('https://sns.us-west-2.amazonaws.com/cert.txt', ['https'],
+                                             HOST_PATTERNS))
+        self.assertFalse(is_allowed_cert_url('', ['https'], HOST_PATTERNS))
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
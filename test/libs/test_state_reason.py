@@ -0,0 +1,71 @@
+import logging
+import unittest
+
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.libs.state_reason import parse_state_reason
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TestStateReason(unittest.TestCase):
+
+    def test_static_threshold(self):
+        state_reason = parse_state_reason(
+            'Threshold Crossed: 1 out of the last 1 datapoints [17.2564528039004 (23/06/21 08:31:00)] was greater '
+            'than the threshold (15.0) (minimum 1 datapoint for OK -> ALARM transition).')
+
+        self.assertEqual(state_reason, {
+            'Datapoints': [{'value': 17.2564528039004, 'timestamp': '2021-06-23T08:31:00Z'}],
+            'BreachingDatapoints': 1,
+            'EvaluatedDatapoints': 1,
+            'Comparison': 'greater than',
+            'Threshold': 15.0
+        })
+
+    def test_many_datapoints(self):
+        state_reason = parse_state_reason(
+            'Threshold Crossed: 2 out of the last 3 datapoints [17.2 (23/06/21 08:31:00), 1.0E-4 (23/06/21 08:26:00)] '
+            'were not greater than or equal to the threshold (15.0) (minimum 2 datapoints for ALARM -> OK transition).')
+
+        self.assertEqual([datapoint['value'] for datapoint in state_reason['Datapoints']], [17.2, 0.0001])
+        self.assertEqual(state_reason['BreachingDatapoints'], 2)
+        self.assertEqual(state_reason['EvaluatedDatapoints'], 3)
+        self.assertEqual(state_reason['Comparison'], 'not greater than or equal to')
+
+    def test_anomaly_band(self):
+        state_reason = parse_state_reason(
+            'Thresholds Crossed: 1 out of the last 1 datapoints [0.46522264287069004 (27/06/21 13:52:00)] was not less '
+            'than the lower thresholds [0.4129373661576242] or not greater than the upper thresholds '
+            '[0.4700330400585261] (minimum 1 datapoint for ALARM -> OK transition).')
+
+        self.assertEqual(state_reason['LowerThresholds'], [0.4129373661576242])
+        self.assertEqual(state_reason['UpperThresholds'], [0.4700330400585261])
+        self.assertEqual(state_reason['Comparison'], 'not less than the lower or not greater than the upper thresholds')
+        self.assertNotIn('Threshold', state_reason)
+
+    def test_missing_data(self):
+        state_reason = parse_state_reason('Threshold Crossed: no datapoints were received for 1 period and '
+                                          '1 missing datapoint was treated as [Breaching].')
+
+        self.assertEqual(state_reason, {'MissingDatapoints': 1, 'MissingDataTreatedAs': 'Breaching'})
+
+    def test_unknown_format(self):
+        self.assertEqual(parse_state_reason('Alarm updated manually'), {})
+        self.assertEqual(parse_state_reason(''), {})
+        self.assertEqual(parse_state_reason(None), {})
+
+    def test_partial_format(self):
+        state_reason = parse_state_reason('Threshold Crossed: 1 out of the last 1 datapoints [unknown] was above 15')
+
+        self.assertEqual(state_reason, {'Datapoints': [], 'BreachingDatapoints': 1, 'EvaluatedDatapoints': 1})
+
+    def test_memoized(self):
+        reason = 'Threshold Crossed: 1 out of the last 1 datapoints [1.0 (23/06/21 08:31:00)] was less than ' \
+                 'the threshold (2.0) (minimum 1 datapoint for OK -> ALARM transition).'
+
+        self.assertIs(parse_state_reason(reason), parse_state_reason(''.join(reason)))
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
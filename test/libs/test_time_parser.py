@@ -0,0 +1,51 @@
+import logging
+import unittest
+from datetime import datetime, timezone, timedelta
+
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.libs.time_parser import parse_iso8601, parse_health_time
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TestTimeParser(unittest.TestCase):
+
+    def test_sns_timestamp(self):
+        self.assertEqual(parse_iso8601('2021-06-27T13:53:39.389Z'),
+                         datetime(2021, 6, 27, 13, 53, 39, 389000, tzinfo=timezone.utc))
+
+    def test_eventbridge_time(self):
+        self.assertEqual(parse_iso8601('2016-06-05T06:27:57Z'),
+                         datetime(2016, 6, 5, 6, 27, 57, tzinfo=timezone.utc))
+
+    def test_cloudwatch_state_change_time(self):
+        self.assertEqual(parse_iso8601('2021-06-10T04:28:46.868+0000'),
+                         datetime(2021, 6, 10, 4, 28, 46, 868000, tzinfo=timezone.utc))
+
+    def test_offset_is_normalized_to_utc(self):
+        parsed = parse_iso8601('2021-06-10T13:28:46.8+0900')
+
+        self.assertEqual(parsed, datetime(2021, 6, 10, 4, 28, 46, 800000, tzinfo=timezone.utc))
+        self.assertEqual(parsed.utcoffset(), timedelta(0))
+
+    def test_health_time(self):
+        self.assertEqual(parse_health_time('Sat, 04 Jun 2016 05:01:10 GMT'),
+                         datetime(2016, 6, 4, 5, 1, 10, tzinfo=timezone.utc))
+        self.assertEqual(parse_health_time('Thu, 2 Aug 2018 05:30:00 UTC'),
+                         datetime(2018, 8, 2, 5, 30, tzinfo=timezone.utc))
+
+    def test_health_time_with_offset(self):
+        self.assertEqual(parse_health_time('Sat, 04 Jun 2016 14:01:10 +0900'),
+                         datetime(2016, 6, 4, 5, 1, 10, tzinfo=timezone.utc))
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            parse_iso8601('10/06/21 04:23:00')
+
+        with self.assertRaises(ValueError):
+            parse_health_time('10/06/21 04:23:00')
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
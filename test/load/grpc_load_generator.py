@@ -0,0 +1,314 @@
+"""
+Load generator for Event.parse against a locally started plugin.
+
+    # start the plugin with 10 gRPC worker threads and run one load level
+    $ python test/load/grpc_load_generator.py --max-workers 10 --concurrency 16 --duration 30
+
+    # find the saturation point
+    $ python test/load/grpc_load_generator.py --max-workers 10 --sweep 1,2,4,8,16,32,64
+
+    # same load against the asyncio server (python -m spaceone.monitoring.aio_server)
+    $ python test/load/grpc_load_generator.py --aio --max-workers 10 --sweep 1,2,4,8,16,32,64,128
+
+    # 4 pre-forked worker processes sharing the port (python -m spaceone.monitoring.prefork_server),
+    # every client stream opens its own connection and the CPU time of each worker is printed per level
+    $ python test/load/grpc_load_generator.py --workers 4 --sweep 1,2,4,8,16,32,64
+
+    # use a plugin that is already running
+    $ python test/load/grpc_load_generator.py --endpoint localhost:50051 --concurrency 8
+"""
+import argparse
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import grpc
+from google.protobuf import symbol_database
+from spaceone.api.monitoring.plugin import event_pb2, event_pb2_grpc
+from spaceone.core import config
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'benchmark'))
+
+from corpus import get_corpus
+
+CHANNEL_OPTIONS = [
+    ('grpc.max_receive_message_length', 64 * 1024 * 1024),
+    ('grpc.max_send_message_length', 64 * 1024 * 1024),
+    # A channel of its own connection per client, SO_REUSEPORT spreads connections over the workers, not requests
+    ('grpc.use_local_subchannel_pool', 1)
+]
+DEFAULT_MIX = 'cloudwatch_single_dimension=6,cloudwatch_anomaly_band=2,cloudwatch_60_dimensions=1,' \
+              'health_2000_entities=1'
+SATURATION_GAIN = 0.05
+
+
+class PluginProcess(object):
+    """
+    spaceone grpc spaceone.monitoring on a free local port,
+    the asyncio server with aio=True and the pre-fork server with workers=N
+    """
+
+    def __init__(self, max_workers=None, aio=False, workers=None):
+        self.port = _get_free_port()
+        self.endpoint = f'localhost:{self.port}'
+        self.max_workers = max_workers
+        self.aio = aio
+        self.workers = workers
+        self.pool_size = max_workers or self._get_default_pool_size(aio)
+        self._process = None
+        self._conf_file = None
+
+    @staticmethod
+    def _get_default_pool_size(aio):
+        """ Thread pool size the plugin runs with when --max-workers is not given """
+
+        config.init_conf(package='spaceone.monitoring')
+        config.set_service_config()
+
+        if aio:
+            return config.get_global('AIO_SERVER', {}).get('max_workers')
+
+        return config.get_global('MAX_WORKERS')
+
+    def __enter__(self):
+        worker_args = []
+
+        if self.max_workers and self.aio:
+            worker_args += ['--max-workers', str(self.max_workers)]
+        elif self.max_workers:
+            self._conf_file = tempfile.NamedTemporaryFile('w', suffix='.yml', delete=False)
+            # spaceone reads only the GLOBAL section of a config file
+            self._conf_file.write(f'GLOBAL:\n  MAX_WORKERS: {self.max_workers}\n')
+            self._conf_file.close()
+            worker_args += ['-c', self._conf_file.name]
+
+        if self.workers:
+            command = [sys.executable, '-m', 'spaceone.monitoring.prefork_server', '-p', str(self.port),
+                       '--workers', str(self.workers)] + (['--aio'] if self.aio else []) + ['--'] + worker_args
+        elif self.aio:
+            command = [sys.executable, '-m', 'spaceone.monitoring.aio_server', '-p', str(self.port)] + worker_args
+        else:
+            command = ['spaceone', 'grpc', 'spaceone.monitoring', '-p', str(self.port)] + worker_args
+
+        self._process = subprocess.Popen(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return self
+
+    def get_worker_pids(self):
+        """ Processes that serve the requests: the pre-forked workers or the plugin itself """
+
+        if not self.workers:
+            return [self._process.pid]
+
+        try:
+            with open(f'/proc/{self._process.pid}/task/{self._process.pid}/children') as f:
+                return [int(pid) for pid in f.read().split()]
+        except OSError:
+            return []
+
+    def __exit__(self, *args):
+        self._process.terminate()
+        try:
+            self._process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+
+        if self._conf_file:
+            os.unlink(self._conf_file.name)
+
+
+class RequestMix(object):
+    """ Weighted choice of pre-encoded requests, every request gets a new MessageId """
+
+    def __init__(self, mix):
+        corpus = get_corpus()
+        method = event_pb2.DESCRIPTOR.services_by_name['Event'].methods_by_name['parse']
+        request_cls = symbol_database.Default().GetSymbol(method.input_type.full_name)
+
+        self.names = []
+        self.weights = []
+        self.requests = {}
+
+        for name, weight in mix.items():
+            request = request_cls()
+            request.options.update({})
+            request.data.update(corpus[name]())
+
+            self.names.append(name)
+            self.weights.append(weight)
+            self.requests[name] = request
+
+    def next(self):
+        name = random.choices(self.names, self.weights)[0]
+        request = type(self.requests[name])()
+        request.CopyFrom(self.requests[name])
+        request.data['MessageId'] = str(uuid.uuid4())
+        return name, request
+
+
+def run_level(endpoint, request_mix, concurrency, duration):
+    latencies = []
+    errors = {}
+    lock = threading.Lock()
+
+    channels = [grpc.insecure_channel(endpoint, options=CHANNEL_OPTIONS) for _ in range(concurrency)]
+    for channel in channels:
+        grpc.channel_ready_future(channel).result(timeout=60)
+
+    deadline = time.monotonic() + duration
+
+    def worker(channel):
+        stub = event_pb2_grpc.EventStub(channel)
+        local_latencies = []
+        local_errors = {}
+
+        while time.monotonic() < deadline:
+            name, request = request_mix.next()
+            begin = time.perf_counter()
+            try:
+                stub.parse(request, timeout=30)
+                local_latencies.append(time.perf_counter() - begin)
+            except grpc.RpcError as e:
+                code = e.code().name
+                local_errors[code] = local_errors.get(code, 0) + 1
+
+        with lock:
+            latencies.extend(local_latencies)
+            for code, count in local_errors.items():
+                errors[code] = errors.get(code, 0) + count
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for channel in channels:
+            executor.submit(worker, channel)
+    elapsed = time.monotonic() - started
+
+    for channel in channels:
+        channel.close()
+
+    latencies.sort()
+    return {
+        'concurrency': concurrency,
+        'requests': len(latencies),
+        'errors': errors,
+        'throughput': len(latencies) / elapsed,
+        'p50_ms': _percentile(latencies, 50) * 1000,
+        'p95_ms': _percentile(latencies, 95) * 1000,
+        'p99_ms': _percentile(latencies, 99) * 1000
+    }
+
+
+def print_result(result):
+    errors = ','.join(f'{code}={count}' for code, count in result['errors'].items()) or '-'
+    print(f'{result["concurrency"]:>11} {result["requests"]:>9} {result["throughput"]:>10,.1f} '
+          f'{result["p50_ms"]:>9,.1f} {result["p95_ms"]:>9,.1f} {result["p99_ms"]:>9,.1f}  {errors}')
+
+    if worker_cpu := result.get('worker_cpu'):
+        total = sum(worker_cpu.values()) or 1
+        spread = ', '.join(f'{pid}={cpu_seconds:.1f}s ({cpu_seconds / total:.0%})'
+                           for pid, cpu_seconds in worker_cpu.items())
+        print(f'{"":>11} worker cpu: {spread}')
+
+
+def get_cpu_seconds(pids):
+    """ User + system CPU seconds of each process, from /proc (Linux, like SO_REUSEPORT) """
+
+    clock_ticks = os.sysconf('SC_CLK_TCK')
+    cpu_seconds = {}
+
+    for pid in pids:
+        try:
+            with open(f'/proc/{pid}/stat') as f:
+                # The fields after the command name, utime and stime are the 12th and 13th of them
+                fields = f.read().rsplit(')', 1)[1].split()
+        except OSError:
+            continue
+        cpu_seconds[pid] = (int(fields[11]) + int(fields[12])) / clock_ticks
+
+    return cpu_seconds
+
+
+def find_saturation(results):
+    """ The first level whose throughput gain over the previous level is below SATURATION_GAIN """
+
+    for previous, current in zip(results, results[1:]):
+        if current['errors'] or current['throughput'] < previous['throughput'] * (1 + SATURATION_GAIN):
+            return previous
+
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Event.parse load generator')
+    parser.add_argument('--endpoint', help='use a running plugin instead of starting one')
+    parser.add_argument('--max-workers', type=int, help='MAX_WORKERS (gRPC thread pool size) of the started plugin')
+    parser.add_argument('--aio', action='store_true', help='start the asyncio server instead of spaceone grpc')
+    parser.add_argument('--workers', type=int, help='start the pre-fork server with this many worker processes')
+    parser.add_argument('--concurrency', type=int, default=8, help='concurrent client streams')
+    parser.add_argument('--sweep', help='comma separated concurrency levels to find the saturation point')
+    parser.add_argument('--duration', type=float, default=10, help='seconds per load level')
+    parser.add_argument('--warmup', type=float, default=2, help='seconds of warmup before measuring')
+    parser.add_argument('--mix', default=DEFAULT_MIX, help='payload=weight list, payload names from corpus.py')
+    args = parser.parse_args()
+
+    mix = {name: float(weight) for name, weight in (item.split('=') for item in args.mix.split(','))}
+    levels = [int(level) for level in args.sweep.split(',')] if args.sweep else [args.concurrency]
+
+    if args.endpoint:
+        _run(args.endpoint, mix, levels, args, pool_size='unknown (external plugin)')
+    else:
+        with PluginProcess(max_workers=args.max_workers, aio=args.aio, workers=args.workers) as plugin:
+            _run(plugin.endpoint, mix, levels, args, pool_size=plugin.pool_size, plugin=plugin)
+
+
+def _run(endpoint, mix, levels, args, pool_size, plugin=None):
+    request_mix = RequestMix(mix)
+
+    run_level(endpoint, request_mix, levels[0], args.warmup)
+
+    print(f'endpoint: {endpoint}, thread pool per worker: {pool_size}, '
+          f'workers: {getattr(args, "workers", None) or 1}, mix: {mix}')
+    print(f'{"concurrency":>11} {"requests":>9} {"req/s":>10} {"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9}  errors')
+
+    results = []
+    for concurrency in levels:
+        # CPU time of each worker shows how the connections were spread, only for a plugin started here
+        worker_pids = plugin.get_worker_pids() if plugin else []
+        cpu_before = get_cpu_seconds(worker_pids)
+
+        result = run_level(endpoint, request_mix, concurrency, args.duration)
+
+        cpu_after = get_cpu_seconds(worker_pids)
+        result['worker_cpu'] = {pid: cpu_after[pid] - cpu_before[pid] for pid in cpu_after if pid in cpu_before}
+
+        results.append(result)
+        print_result(result)
+
+    if len(results) > 1:
+        saturation = find_saturation(results)
+        if saturation:
+            print(f'saturation: concurrency {saturation["concurrency"]}, {saturation["throughput"]:,.1f} req/s')
+        else:
+            print('saturation: not reached, extend --sweep')
+
+
+def _percentile(sorted_values, percent):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * percent / 100))]
+
+
+def _get_free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+import copy
+import logging
+import unittest
+
+from spaceone.core import config
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.manager.cloudwatch_event_manager import EventManager
+
+_LOGGER = logging.getLogger(__name__)
+
+CLOUDWATCH_MESSAGE = {
+    "AlarmName": "EC2-CPU",
+    "AlarmDescription": None,
+    "AWSAccountId": "1234567890",
+    "NewStateValue": "ALARM",
+    "NewStateReason": "Threshold Crossed: 1 out of the last 1 datapoints [17.2564528039004 (23/06/21 08:31:00)] was greater than the threshold (15.0) (minimum 1 datapoint for OK -> ALARM transition).",
+    "StateChangeTime": "2021-06-23T08:41:06.622+0000",
+    "Region": "Asia Pacific (Seoul)",
+    "AlarmArn": "arn:aws:cloudwatch:ap-northeast-2:1234567890:alarm:EC2-CPU",
+    "OldStateValue": "INSUFFICIENT_DATA",
+    "Trigger": {
+        "MetricName": "CPUUtilization",
+        "Namespace": "AWS/EC2",
+        "StatisticType": "Statistic",
+        "Statistic": "AVERAGE",
+        "Unit": None,
+        "Dimensions": [{"value": "i-0f672ea50a80cda4b", "name": "InstanceId"}],
+        "Period": 300,
+        "EvaluationPeriods": 1,
+        "ComparisonOperator": "GreaterThanThreshold",
+        "Threshold": 15.0,
+        "TreatMissingData": "- TreatMissingData: missing",
+        "EvaluateLowSampleCountPercentile": ""
+    }
+}
+
+
+class TestEventManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.monitoring')
+        config.set_service_config()
+        config.set_global(EVENT_SUPPRESSION={'enabled': True, 'window': 300, 'max_size': 100})
+
+    def setUp(self):
+        self.event_mgr = EventManager()
+
+    def test_parse(self):
+        events = self.event_mgr.parse({}, self._make_message('test_parse'))
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]['event_type'], 'ALERT')
+        self.assertEqual(events[0]['severity'], 'ERROR')
+        self.assertEqual(events[0]['resource']['resource_id'], 'i-0f672ea50a80cda4b')
+
+    def test_state_reason(self):
+        events = self.event_mgr.parse({}, self._make_message('test_state_reason'))
+        additional_info = events[0]['additional_info']
+
+        self.assertEqual(additional_info['Datapoints'], [{'value': 17.2564528039004,
+                                                          'timestamp': '2021-06-23T08:31:00Z'}])
+        self.assertEqual(additional_info['Comparison'], 'greater than')
+        self.assertEqual(additional_info['Threshold'], 15.0)
+
+    def test_unknown_state_reason(self):
+        message = dict(self._make_message('test_unknown_state_reason'), NewStateReason='Alarm updated manually')
+        events = self.event_mgr.parse({}, message)
+
+        self.assertEqual(events[0]['description'], 'Alarm updated manually')
+        self.assertNotIn('Datapoints', events[0]['additional_info'])
+        self.assertNotIn('Threshold', events[0]['additional_info'])
+
+    def test_suppress_duplicated_event(self):
+        message = self._make_message('test_suppress_duplicated_event')
+
+        self.assertEqual(len(self.event_mgr.parse({}, message)), 1)
+        self.assertEqual(self.event_mgr.parse({}, message), [])
+
+    def test_not_suppress_other_state(self):
+        message = self._make_message('test_not_suppress_other_state')
+        recovery_message = dict(message, NewStateValue='OK')
+
+        self.assertEqual(len(self.event_mgr.parse({}, message)), 1)
+        self.assertEqual(len(self.event_mgr.parse({}, recovery_message)), 1)
+
+    def test_deduplicate_dimensions(self):
+        message = self._make_message('test_deduplicate_dimensions')
+        message['Trigger']['Dimensions'].append({'value': 'i-0a1b2c3d4e5f67890', 'name': 'InstanceId'})
+        message['Trigger']['Metrics'] = [
+            {'Id': f'm{index}', 'MetricStat': {'Metric': {'Dimensions': copy.deepcopy(message['Trigger']['Dimensions'])}}}
+            for index in range(3)
+        ]
+
+        events = self.event_mgr.parse({}, message)
+
+        self.assertEqual([event['resource']['resource_id'] for event in events],
+                         ['i-0f672ea50a80cda4b', 'i-0a1b2c3d4e5f67890'])
+        self.assertEqual(events[0]['title'], events[1]['title'])
+        self.assertEqual(events[0]['additional_info'], events[1]['additional_info'])
+
+    def test_aggregate_dimensions(self):
+        message = self._make_message('test_aggregate_dimensions')
+        message['Trigger']['Dimensions'] = [{'value': f'i-{index}', 'name': 'InstanceId'} for index in range(10)]
+
+        events = self.event_mgr.parse({'aggregate_dimensions': True}, message)
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]['resource']['resource_id'], message['AlarmArn'])
+        self.assertEqual(events[0]['additional_info']['DimensionCount'], 10)
+        self.assertEqual(events[0]['additional_info']['Dimensions'][9], {'name': 'InstanceId', 'value': 'i-9'})
+
+    @staticmethod
+    def _make_message(alarm_name):
+        message = copy.deepcopy(CLOUDWATCH_MESSAGE)
+        message['AlarmName'] = alarm_name
+        return message
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,54 @@
+import logging
+import unittest
+
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.error.event import ERROR_NOT_DECISION_MANAGER
+from spaceone.monitoring import manager
+from spaceone.monitoring.manager import EventManager, PersonalHealthDashboardManager
+from spaceone.monitoring.manager import event_router
+from spaceone.monitoring.manager.event_router import route_message, get_message_fields
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TestEventRouter(unittest.TestCase):
+
+    def test_route_cloudwatch(self):
+        message = {'AlarmArn': 'arn:aws:cloudwatch:ap-northeast-2:1234567890:alarm:EC2-CPU'}
+        self.assertEqual(route_message(message), EventManager.__name__)
+
+    def test_route_health(self):
+        message = {'source': 'aws.health', 'detail-type': 'AWS Health Event'}
+        self.assertEqual(route_message(message), PersonalHealthDashboardManager.__name__)
+
+    def test_unknown_arn_service(self):
+        with self.assertRaises(ERROR_NOT_DECISION_MANAGER):
+            route_message({'AlarmArn': 'arn:aws:autoscaling:ap-northeast-2:1234567890:alarm'})
+
+    def test_missing_source(self):
+        with self.assertRaises(ERROR_NOT_DECISION_MANAGER):
+            route_message({'detail-type': 'EC2 Instance State-change Notification'})
+
+    def test_not_dict_message(self):
+        with self.assertRaises(ERROR_NOT_DECISION_MANAGER):
+            route_message(['aws.health'])
+
+    def test_message_fields(self):
+        message_fields = get_message_fields()
+
+        self.assertTrue(EventManager.MESSAGE_FIELDS <= message_fields)
+        self.assertTrue(PersonalHealthDashboardManager.MESSAGE_FIELDS <= message_fields)
+        self.assertNotIn('resources', message_fields)
+
+    def test_route_modules(self):
+        # Importing every manager registers all the routes, each must come from a module in _ROUTE_MODULES
+        managers = {manager_name: getattr(manager, manager_name) for manager_name in manager.__all__}
+
+        for manager_name in set(event_router._ROUTES.values()):
+            self.assertIn(managers[manager_name].__module__, event_router._ROUTE_MODULES,
+                          f'{manager_name} is routed but its module is not in _ROUTE_MODULES')
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,144 @@
+import copy
+import hashlib
+import logging
+import os
+import sys
+import unittest
+from unittest import mock
+
+from spaceone.core import config
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.error.webhook import ERROR_INVALID_WEBHOOK_OPTIONS
+from spaceone.monitoring.manager.cloudwatch_event_manager import EventManager
+from spaceone.monitoring.manager.event_rules import compile_event_rules, get_event_rules
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from test_cloudwatch_event_manager import CLOUDWATCH_MESSAGE
+
+_LOGGER = logging.getLogger(__name__)
+
+WEBHOOK_OPTIONS = {
+    'severity_mapping': {
+        'namespace': {'AWS/RDS': 'CRITICAL'},
+        'alarm_name': {'EC2-CPU-TEST': 'WARNING'},
+        'state': {'INSUFFICIENT_DATA': 'NOT_AVAILABLE'}
+    },
+    'title_template': '[{namespace}] {alarm_name} is {state}{unknown}',
+    'field_overrides': {'rule': 'production'}
+}
+
+
+class TestEventRules(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.monitoring')
+        config.set_service_config()
+        config.set_global(EVENT_SUPPRESSION={'enabled': False})
+
+    def test_get_severity(self):
+        event_rules = compile_event_rules(WEBHOOK_OPTIONS)
+
+        self.assertEqual(event_rules.get_severity({'namespace': 'AWS/RDS', 'state': 'ALARM'}, 'ERROR'), 'CRITICAL')
+        self.assertEqual(event_rules.get_severity({'namespace': 'AWS/RDS', 'alarm_name': 'EC2-CPU-TEST'}, 'ERROR'),
+                         'WARNING')
+        self.assertEqual(event_rules.get_severity({'namespace': 'AWS/EC2', 'state': 'ALARM'}, 'ERROR'), 'ERROR')
+
+    def test_render_title(self):
+        event_rules = compile_event_rules(WEBHOOK_OPTIONS)
+
+        self.assertEqual(event_rules.render_title({'namespace': 'AWS/EC2', 'alarm_name': 'EC2-CPU', 'state': 'OK'},
+                                                  'default'), '[AWS/EC2] EC2-CPU is OK')
+        self.assertEqual(compile_event_rules({}).render_title({}, 'default'), 'default')
+
+    def test_cache_by_content(self):
+        options = copy.deepcopy(WEBHOOK_OPTIONS)
+
+        self.assertIs(get_event_rules(WEBHOOK_OPTIONS), get_event_rules(options))
+        self.assertIsNot(get_event_rules(WEBHOOK_OPTIONS), get_event_rules({}))
+
+    def test_digest_on_cache_miss_only(self):
+        options = dict(WEBHOOK_OPTIONS, title_template='{alarm_name} digest')
+
+        with mock.patch.object(hashlib, 'sha1', wraps=hashlib.sha1) as sha1:
+            event_rules = get_event_rules(options)
+            self.assertIs(get_event_rules(copy.deepcopy(options)), event_rules)
+
+        self.assertEqual(sha1.call_count, 1)
+        self.assertEqual(len(event_rules.digest), 40)
+
+    def test_immutable(self):
+        event_rules = compile_event_rules(WEBHOOK_OPTIONS)
+
+        with self.assertRaises(AttributeError):
+            event_rules.title_template = ''
+        with self.assertRaises(TypeError):
+            event_rules.field_overrides['rule'] = ''
+
+    def test_invalid_options(self):
+        invalid_options = [
+            {'severity_mapping': {'namespace': {'AWS/RDS': 'FATAL'}}},
+            {'severity_mapping': {'unknown': {'value': 'ERROR'}}},
+            {'title_template': '{Trigger.MetricName}'},
+            {'title_template': '{alarm_name'},
+            {'field_overrides': {'event_key': 'fixed'}},
+            {'affected_entities_limit': 'many'},
+            {'filters': [{}]},
+            {'filters': [{'AlarmName': 'test-*'}]},
+            {'filters': [{'state': [1]}]}
+        ]
+
+        for options in invalid_options:
+            with self.assertRaises(ERROR_INVALID_WEBHOOK_OPTIONS):
+                compile_event_rules(options)
+
+    def test_is_filtered(self):
+        event_rules = compile_event_rules({'filters': [
+            {'state': 'INSUFFICIENT_DATA'},
+            {'alarm_name': ['test-*', 'dev-?'], 'state': 'OK'},
+            {'event_type_category': 'accountNotification'}
+        ]})
+
+        self.assertTrue(event_rules.is_filtered({'state': 'INSUFFICIENT_DATA', 'alarm_name': 'prod-cpu'}))
+        self.assertTrue(event_rules.is_filtered({'state': 'OK', 'alarm_name': 'test-cpu'}))
+        self.assertTrue(event_rules.is_filtered({'state': 'OK', 'alarm_name': 'dev-1'}))
+        self.assertFalse(event_rules.is_filtered({'state': 'ALARM', 'alarm_name': 'test-cpu'}))
+        self.assertFalse(event_rules.is_filtered({'state': 'OK', 'alarm_name': 'prod-cpu'}))
+        self.assertTrue(event_rules.is_filtered({'event_type_category': 'accountNotification'}))
+        self.assertFalse(compile_event_rules({}).is_filtered({'state': 'INSUFFICIENT_DATA'}))
+
+    def test_is_filtered_with_missing_values(self):
+        event_rules = compile_event_rules({'filters': [{'alarm_name': 'test-*'}, {'account': '123456789012'}]})
+
+        self.assertFalse(event_rules.is_filtered({'alarm_name': None}))
+        self.assertFalse(event_rules.is_filtered({}))
+        self.assertTrue(event_rules.is_filtered({'alarm_name': None, 'account': 123456789012}))
+
+    def test_filter_cloudwatch_message(self):
+        event_rules = compile_event_rules({'filters': [{'namespace': 'AWS/EC2', 'alarm_name': 'EC2-*'}]})
+
+        self.assertTrue(event_rules.is_filtered(EventManager().get_rule_attributes(CLOUDWATCH_MESSAGE)))
+
+    def test_parse_with_options(self):
+        message = copy.deepcopy(CLOUDWATCH_MESSAGE)
+        message['Trigger']['Namespace'] = 'AWS/RDS'
+
+        events = EventManager().parse(WEBHOOK_OPTIONS, message)
+
+        self.assertEqual(events[0]['severity'], 'CRITICAL')
+        self.assertEqual(events[0]['title'], '[AWS/RDS] EC2-CPU is ALARM')
+        self.assertEqual(events[0]['rule'], 'production')
+
+    def test_recovery_keeps_info_severity(self):
+        message = dict(copy.deepcopy(CLOUDWATCH_MESSAGE), NewStateValue='OK')
+        message['Trigger']['Namespace'] = 'AWS/RDS'
+
+        events = EventManager().parse(WEBHOOK_OPTIONS, message)
+
+        self.assertEqual(events[0]['severity'], 'INFO')
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,100 @@
+import copy
+import logging
+import unittest
+
+from spaceone.core import config
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.manager.phd_event_manager import PersonalHealthDashboardManager
+
+_LOGGER = logging.getLogger(__name__)
+
+HEALTH_MESSAGE = {
+    "version": "0",
+    "id": "7bf73129-1428-4cd3-a780-95db273d1602",
+    "detail-type": "AWS Health Event",
+    "source": "aws.health",
+    "account": "123456789012",
+    "time": "2016-06-05T06:27:57Z",
+    "region": "us-west-2",
+    "resources": [],
+    "detail": {
+        "eventArn": "arn:aws:health:us-west-2::event/AWS_EC2_INSTANCE_STORE_DRIVE_PERFORMANCE_DEGRADED_90353408594353980",
+        "service": "EC2",
+        "eventTypeCode": "AWS_EC2_INSTANCE_STORE_DRIVE_PERFORMANCE_DEGRADED",
+        "eventTypeCategory": "issue",
+        "startTime": "Sat, 05 Jun 2016 15:10:09 GMT",
+        "eventDescription": [{
+            "language": "en_US",
+            "latestDescription": "A description of the event will be provided here"
+        }],
+        "affectedEntities": []
+    }
+}
+
+
+class TestPersonalHealthDashboardManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.monitoring')
+        config.set_service_config()
+        config.set_global(HEALTH_EVENT={'affected_entities_limit': 3, 'split_affected_entities': False})
+
+    def setUp(self):
+        self.phd_mgr = PersonalHealthDashboardManager()
+
+    def test_parse(self):
+        events = self.phd_mgr.parse({}, self._make_message(2))
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]['severity'], 'ERROR')
+        self.assertEqual(events[0]['additional_info']['affectedEntities'], ['i-0', 'i-1'])
+        self.assertEqual(events[0]['additional_info']['affectedEntitiesCount'], 2)
+        self.assertNotIn('affectedEntitiesTruncatedCount', events[0]['additional_info'])
+        self.assertNotIn('more', events[0]['description'])
+        self.assertEqual(events[0]['resource']['resource_id'], HEALTH_MESSAGE['detail']['eventArn'])
+
+    def test_parse_without_affected_entities(self):
+        events = self.phd_mgr.parse({}, self._make_message(0))
+
+        self.assertEqual(len(events), 1)
+        self.assertTrue(events[0]['description'].endswith('Affected Entities: None'))
+
+    def test_limit_affected_entities(self):
+        events = self.phd_mgr.parse({}, self._make_message(2000))
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]['additional_info']['affectedEntities'], ['i-0', 'i-1', 'i-2'])
+        self.assertEqual(events[0]['additional_info']['affectedEntitiesCount'], 2000)
+        self.assertEqual(events[0]['additional_info']['affectedEntitiesTruncatedCount'], 1997)
+        self.assertTrue(events[0]['description'].endswith(' - ... and 1997 more'))
+
+    def test_limit_affected_entities_by_options(self):
+        events = self.phd_mgr.parse({'affected_entities_limit': 1.0}, self._make_message(5))
+
+        self.assertEqual(events[0]['additional_info']['affectedEntities'], ['i-0'])
+        self.assertTrue(events[0]['description'].endswith(' - ... and 4 more'))
+
+    def test_split_affected_entities(self):
+        events = self.phd_mgr.parse({'split_affected_entities': True}, self._make_message(5))
+
+        self.assertEqual(len(events), 3)
+        self.assertEqual(len({event['event_key'] for event in events}), 3)
+        for index, event in enumerate(events):
+            self.assertEqual(event['resource']['resource_id'], f'i-{index}')
+            self.assertEqual(event['additional_info']['affectedEntities'], [f'i-{index}'])
+            self.assertEqual(event['additional_info']['affectedEntitiesCount'], 5)
+            self.assertEqual(event['additional_info']['affectedEntitiesTruncatedCount'], 2)
+            self.assertEqual(event['title'], events[0]['title'])
+            self.assertTrue(event['description'].endswith(f'Affected Entity: i-{index}'))
+
+    @staticmethod
+    def _make_message(entity_count):
+        message = copy.deepcopy(HEALTH_MESSAGE)
+        message['detail']['affectedEntities'] = [{'entityValue': f'i-{index}'} for index in range(entity_count)]
+        return message
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,96 @@
+import copy
+import logging
+import os
+import sys
+import unittest
+
+from spaceone.core import config
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.error.event import ERROR_INVALID_SNS_SIGNATURE
+from spaceone.monitoring.manager import signature_manager
+from spaceone.monitoring.manager.signature_manager import SignatureManager
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'connector'))
+
+from signing_cert import SigningCert
+from stub_server import StubServer
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TestSignatureManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.monitoring')
+        config.set_service_config()
+        config.set_global(SIGNATURE_VERIFICATION={
+            'enabled': True,
+            'allowed_schemes': ['http'],
+            'allowed_hosts': [r'^127\.0\.0\.1$'],
+            'cert_cache_size': 4,
+            'cert_ttl': 3600
+        })
+        cls.connectors = copy.deepcopy(config.get_global('CONNECTORS'))
+        # The manager gets its SNSConnector from the locator, which reads CONNECTORS
+        config.set_global(CONNECTORS={'SNSConnector': {'read_timeout': 1, 'retries': 0}})
+        cls.signing_cert = SigningCert()
+
+    @classmethod
+    def tearDownClass(cls):
+        config.set_global(CONNECTORS=cls.connectors)
+
+    def setUp(self):
+        signature_manager._CERT_CACHE = None
+        self.stub = StubServer(body=self.signing_cert.pem).start()
+        self.signature_mgr = SignatureManager()
+
+    def tearDown(self):
+        self.stub.stop()
+
+    def test_verify(self):
+        for signature_version in ['1', '2']:
+            self.signature_mgr.verify(self._make_notification(signature_version))
+
+    def test_cache_signing_certificate(self):
+        for _ in range(10):
+            self.signature_mgr.verify(self._make_notification())
+
+        self.assertEqual(len(self.stub.requests), 1)
+
+    def test_verify_tampered_message(self):
+        raw_data = dict(self._make_notification(), Message='{"AlarmName": "Injected"}')
+
+        with self.assertRaises(ERROR_INVALID_SNS_SIGNATURE):
+            self.signature_mgr.verify(raw_data)
+
+    def test_verify_other_signing_certificate(self):
+        raw_data = SigningCert().sign(self._make_notification(), '2')
+
+        with self.assertRaises(ERROR_INVALID_SNS_SIGNATURE):
+            self.signature_mgr.verify(raw_data)
+
+    def test_not_allowed_signing_cert_url(self):
+        raw_data = dict(self._make_notification(), SigningCertURL='http://sns.evil.example.com/cert.pem')
+
+        with self.assertRaises(ERROR_INVALID_SNS_SIGNATURE):
+            self.signature_mgr.verify(raw_data)
+
+        self.assertEqual(len(self.stub.requests), 0)
+
+    def _make_notification(self, signature_version='2'):
+        notification = {
+            'Type': 'Notification',
+            'MessageId': '22b80b92-fdea-4c2c-8f9d-bdfb0c7bf324',
+            'TopicArn': 'arn:aws:sns:us-west-2:123456789012:MyTopic',
+            'Message': '{"AlarmName": "EC2-CPU"}',
+            'Timestamp': '2021-06-23T08:41:06.683Z',
+            'SigningCertURL': f'{self.stub.url}/SimpleNotificationService-test.pem'
+        }
+
+        return self.signing_cert.sign(notification, signature_version)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,71 @@
+import copy
+import logging
+import os
+import sys
+import unittest
+
+from spaceone.core import config
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.manager.subscription_manager import SubscriptionManager
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'connector'))
+
+from stub_server import StubServer
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TestSubscriptionManager(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.monitoring')
+        config.set_service_config()
+        cls.connectors = copy.deepcopy(config.get_global('CONNECTORS'))
+        # The manager gets its SNSConnector from the locator, which reads CONNECTORS
+        config.set_global(CONNECTORS={'SNSConnector': {'read_timeout': 1, 'retries': 0}})
+
+    @classmethod
+    def tearDownClass(cls):
+        config.set_global(CONNECTORS=cls.connectors)
+
+    def setUp(self):
+        self.stub = StubServer().start()
+        self.subscription_mgr = SubscriptionManager()
+
+    def tearDown(self):
+        self.stub.stop()
+
+    def test_confirm_subscription_returns_immediately(self):
+        raw_data = self._make_confirmation('token-returns-immediately')
+
+        self.assertTrue(self.subscription_mgr.confirm_subscription(raw_data))
+        self.assertEqual(self.stub.wait_requests(1), 1)
+
+    def test_duplicated_confirmation(self):
+        raw_data = self._make_confirmation('token-duplicated')
+
+        self.assertTrue(self.subscription_mgr.confirm_subscription(raw_data))
+        self.assertFalse(self.subscription_mgr.confirm_subscription(raw_data))
+        self.assertEqual(self.stub.wait_requests(2, timeout=1), 1)
+
+    def test_missing_subscribe_url(self):
+        raw_data = self._make_confirmation('token-missing-url')
+        del raw_data['SubscribeURL']
+
+        self.assertFalse(self.subscription_mgr.confirm_subscription(raw_data))
+
+    def _make_confirmation(self, token):
+        topic_arn = 'arn:aws:sns:ap-northeast-2:1234567890:spaceone-notification'
+        return {
+            'Type': 'SubscriptionConfirmation',
+            'MessageId': 'aeaae1f1-cfe3-452d-be2d-8fc315894c7d',
+            'TopicArn': topic_arn,
+            'Token': token,
+            'SubscribeURL': f'{self.stub.url}/?Action=ConfirmSubscription&TopicArn={topic_arn}&Token={token}'
+        }
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
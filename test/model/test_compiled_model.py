@@ -0,0 +1,135 @@
+import logging
+import unittest
+from datetime import datetime
+
+from schematics.common import NOT_NONE
+from schematics.models import Model
+from schematics.types import StringType, ModelType, ListType
+from spaceone.core.unittest.runner import RichTestRunner
+from spaceone.monitoring.error.event import ERROR_INVALID_EVENT_FIELD
+from spaceone.monitoring.model.compiled_model import compile_model
+from spaceone.monitoring.model.cloudwatch_event_response_model import EventModel as CloudWatchEventModel
+from spaceone.monitoring.model.phd_event_response_model import EventModel as HealthEventModel
+
+_LOGGER = logging.getLogger(__name__)
+
+CLOUDWATCH_EVENT = {
+    'event_key': 'b2d5e2c1c6f0e4c2d1b7a3b1c6f0e4c2',
+    'event_type': 'ALERT',
+    'severity': 'ERROR',
+    'resource': {
+        'resource_id': 'i-0f672ea50a80cda4b',
+        'resource_type': 'AWS/EC2',
+        'name': '[AWS/EC2] InstanceId=i-0f672ea50a80cda4b (Asia Pacific (Seoul))'
+    },
+    'description': 'Threshold Crossed: 1 out of the last 1 datapoints [17.2564528039004 (23/06/21 08:31:00)]',
+    'title': '"EC2-CPU" in Asia Pacific (Seoul)',
+    'rule': '',
+    'occurred_at': datetime(2021, 6, 23, 8, 41, 6, 622000),
+    'account': '1234567890',
+    'additional_info': {
+        'AWSAccountId': '1234567890',
+        'AlarmArn': 'arn:aws:cloudwatch:ap-northeast-2:1234567890:alarm:EC2-CPU',
+        'AlarmName': 'EC2-CPU',
+        'AlarmDescription': 'dropped by the model',
+        'Region': 'Asia Pacific (Seoul)'
+    }
+}
+
+HEALTH_EVENT = {
+    'event_key': 'arn:aws:health:global::event/AWS_ABUSE_DOS_REPORT_92387492375_4498_2018_08_01_02_33_00',
+    'event_type': 'ALERT',
+    'severity': 'ERROR',
+    'resource': {
+        'resouce_id': 'arn:aws:health:global::event/AWS_ABUSE_DOS_REPORT_92387492375_4498_2018_08_01_02_33_00',
+        'resource_type': 'aws.health'
+    },
+    'description': 'A description of the event will be provided here (Account:123456789012)',
+    'title': 'Aws Abuse Dos Report',
+    'rule': 'issue',
+    'occurred_at': datetime(2018, 8, 1, 6, 27, 57),
+    'account': '123456789012',
+    'additional_info': {
+        'id': '7bf73129-1428-4cd3-a780-95db273d1602',
+        'account': '123456789012',
+        'region': 'global',
+        'service': 'ABUSE',
+        'eventTypeCode': 'AWS_ABUSE_DOS_REPORT',
+        'affectedEntities': ['arn:aws:ec2:us-east-1:123456789012:instance/i-abcd1111']
+    }
+}
+
+
+class NestedModel(Model):
+    value = StringType(serialize_when_none=False)
+
+
+class ExportLevelModel(Model):
+    class Options:
+        export_level = NOT_NONE
+
+    name = StringType()
+    items = ListType(StringType())
+    omitted_items = ListType(StringType(), serialize_when_none=False)
+    nested = ModelType(NestedModel, serialize_when_none=False)
+    kept = StringType(serialize_when_none=True)
+
+
+class TestCompiledModel(unittest.TestCase):
+
+    def test_cloudwatch_event_matches_schematics(self):
+        self._assert_same_output(CloudWatchEventModel, CLOUDWATCH_EVENT)
+
+    def test_health_event_matches_schematics(self):
+        self._assert_same_output(HealthEventModel, HEALTH_EVENT)
+
+    def test_defaults_matches_schematics(self):
+        event_data = {'event_key': 'key', 'title': 'title', 'additional_info': {'id': 'id', 'account': 'account',
+                                                                                'service': 'EC2'}}
+        self._assert_same_output(HealthEventModel, event_data)
+
+    def test_export_levels_match_schematics(self):
+        for event_data in [{}, {'items': [], 'omitted_items': [], 'nested': {}},
+                           {'name': 'name', 'items': ['a'], 'omitted_items': ['b'], 'nested': {'value': 'c'}}]:
+            self._assert_same_output(ExportLevelModel, event_data)
+
+    def test_mutable_default_is_not_shared(self):
+        build = compile_model(HealthEventModel)
+        event_data = {'event_key': 'key', 'title': 'title', 'additional_info': {'id': 'id', 'account': 'account',
+                                                                                'service': 'EC2'}}
+
+        first_event = build(event_data)
+        first_event['additional_info']['affectedEntities'].append('i-abcd1111')
+
+        self.assertEqual(build(event_data)['additional_info']['affectedEntities'], [])
+
+    def test_required_field(self):
+        build = compile_model(CloudWatchEventModel)
+        event_data = dict(CLOUDWATCH_EVENT, title=None)
+
+        with self.assertRaises(ERROR_INVALID_EVENT_FIELD):
+            build(event_data)
+
+    def test_nested_required_field(self):
+        build = compile_model(CloudWatchEventModel)
+        event_data = dict(CLOUDWATCH_EVENT, additional_info={'AWSAccountId': '1234567890'})
+
+        with self.assertRaises(ERROR_INVALID_EVENT_FIELD):
+            build(event_data)
+
+    def test_choices(self):
+        build = compile_model(CloudWatchEventModel)
+        event_data = dict(CLOUDWATCH_EVENT, severity='FATAL')
+
+        with self.assertRaises(ERROR_INVALID_EVENT_FIELD):
+            build(event_data)
+
+    def _assert_same_output(self, model_cls, event_data):
+        event_model = model_cls(event_data, strict=False)
+        event_model.validate()
+
+        self.assertEqual(compile_model(model_cls)(event_data), event_model.to_native())
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,94 @@
+import logging
+import sys
+import time
+import unittest
+
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.prefork_server import PreforkServer, check_worker_args, get_worker_command
+
+_LOGGER = logging.getLogger(__name__)
+
+# Stands in for a plugin process: serves until SIGTERM
+SLEEP_COMMAND = [sys.executable, '-c', 'import time; time.sleep(60)']
+CRASH_COMMAND = [sys.executable, '-c', 'raise SystemExit(1)']
+
+
+class TestPreforkServer(unittest.TestCase):
+
+    def setUp(self):
+        self.server = None
+
+    def tearDown(self):
+        if self.server:
+            self.server._shutdown()
+
+    def test_restart_exited_worker(self):
+        self.server = self._make_server(SLEEP_COMMAND, ready_delay=0)
+        first_pid = self.server.workers[0].process.pid
+
+        self.server.workers[0].process.kill()
+        self.server.workers[0].process.wait()
+        self._supervise(lambda: self.server.workers[0].alive)
+
+        self.assertNotEqual(self.server.workers[0].process.pid, first_pid)
+        self.assertTrue(self.server.workers[1].alive)
+
+    def test_back_off_crash_loop(self):
+        self.server = self._make_server(CRASH_COMMAND, workers=1, ready_delay=10, max_restart_delay=0.4)
+        self._supervise(lambda: False, timeout=2)
+
+        self.assertEqual(self.server.workers[0].restart_delay, 0.4)
+
+    def test_rolling_restart(self):
+        self.server = self._make_server(SLEEP_COMMAND, ready_delay=0.1)
+        old_pids = [worker.process.pid for worker in self.server.workers]
+
+        self.server._rolling_restart()
+
+        for worker, old_pid in zip(self.server.workers, old_pids):
+            self.assertTrue(worker.alive)
+            self.assertNotEqual(worker.process.pid, old_pid)
+
+    def test_shutdown(self):
+        self.server = self._make_server(SLEEP_COMMAND)
+        self.server._shutdown()
+
+        self.assertFalse(any(worker.alive for worker in self.server.workers))
+
+    def test_get_worker_command(self):
+        self.assertEqual(get_worker_command(50051, worker_args=['-c', 'local.yml']),
+                         ['spaceone', 'grpc', 'spaceone.monitoring', '-p', '50051', '-c', 'local.yml'])
+        self.assertEqual(get_worker_command(50051, aio=True)[1:],
+                         ['-m', 'spaceone.monitoring.aio_server', '-p', '50051'])
+        self.assertEqual(get_worker_command(50051, aio=True, worker_args=['--max-workers', '4'],
+                                            config_file='local.yml')[1:],
+                         ['-m', 'spaceone.monitoring.aio_server', '-p', '50051', '-c', 'local.yml',
+                          '--max-workers', '4'])
+
+    def test_check_worker_args(self):
+        check_worker_args(True, ['-c', 'local.yml', '--max-workers', '4'])
+        check_worker_args(False, ['--log-level', 'DEBUG'])
+
+        with self.assertRaises(ValueError) as cm:
+            check_worker_args(True, ['--max-workers', '4', '--log-level', 'DEBUG'])
+
+        self.assertIn('--log-level', str(cm.exception))
+
+    @staticmethod
+    def _make_server(command, workers=2, ready_delay=5, max_restart_delay=30):
+        server = PreforkServer(command, workers, restart_delay=0.1, max_restart_delay=max_restart_delay,
+                               ready_delay=ready_delay, shutdown_grace=5)
+        for worker in server.workers:
+            worker.start()
+        return server
+
+    def _supervise(self, done, timeout=5):
+        deadline = time.monotonic() + timeout
+        while not done() and time.monotonic() < deadline:
+            self.server._supervise()
+            time.sleep(0.05)
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
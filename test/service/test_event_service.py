@@ -1,3 +1,4 @@
+import json
 import logging
 import unittest
 
@@ -62,6 +63,79 @@ class TestEventService(TestCase):
         print_json(health_parsed_data)
         print()
 
+    def test_parse_batch(self):
+        cloudwatch_data = {
+            "Subject": "ALARM: \"EC2-CPU\" in Asia Pacific (Seoul)",
+            "TopicArn": "arn:aws:sns:ap-northeast-2:1234567890:spaceone-notification",
+            "Message": "{\"AlarmName\":\"EC2-CPU\",\"AlarmDescription\":null,\"AWSAccountId\":\"1234567890\",\"NewStateValue\":\"ALARM\",\"NewStateReason\":\"Threshold Crossed: 1 out of the last 1 datapoints [17.2564528039004 (23/06/21 08:31:00)] was greater than the threshold (15.0) (minimum 1 datapoint for OK -> ALARM transition).\",\"StateChangeTime\":\"2021-06-23T08:41:06.622+0000\",\"Region\":\"Asia Pacific (Seoul)\",\"AlarmArn\":\"arn:aws:cloudwatch:ap-northeast-2:1234567890:alarm:EC2-CPU\",\"OldStateValue\":\"INSUFFICIENT_DATA\",\"Trigger\":{\"MetricName\":\"CPUUtilization\",\"Namespace\":\"AWS/EC2\",\"StatisticType\":\"Statistic\",\"Statistic\":\"AVERAGE\",\"Unit\":null,\"Dimensions\":[{\"value\":\"i-0f672ea50a80cda4b\",\"name\":\"InstanceId\"}],\"Period\":300,\"EvaluationPeriods\":1,\"ComparisonOperator\":\"GreaterThanThreshold\",\"Threshold\":15.0,\"TreatMissingData\":\"- TreatMissingData: missing\",\"EvaluateLowSampleCountPercentile\":\"\"}}",
+            "MessageId": "e7c82e01-7cd8-5569-9ac1-774d893afc01",
+            "Type": "Notification",
+            "Timestamp": "2021-06-23T08:41:06.656Z"
+        }
+
+        health_data = {
+            "TopicArn": "arn:aws:sns:ap-southeast-2:1234567890:phd-info-dev",
+            "Message": "{\"version\": \"0\", \"id\": \"7bf73129-1428-4cd3-a780-95db273d1602\", \"detail-type\": \"AWS Health Event\", \"source\": \"aws.health\", \"account\": \"123456789012\", \"time\": \"2016-06-05T06:27:57Z\", \"region\": \"ap-southeast-2\", \"resources\": [], \"detail\": {\"eventArn\": \"arn:aws:health:ap-southeast-2::event/AWS_ELASTICLOADBALANCING_API_ISSUE_90353408594353980\", \"service\": \"ELASTICLOADBALANCING\", \"eventTypeCode\": \"AWS_ELASTICLOADBALANCING_API_ISSUE\", \"eventTypeCategory\": \"issue\", \"startTime\": \"Sat, 04 Jun 2016 05:01:10 GMT\", \"eventDescription\": [{\"language\": \"en_US\", \"latestDescription\": \"A description of the event will be provided here\"}]}}",
+            "MessageId": "3f78eee9-6691-51be-b77e-b4603c34d486",
+            "Type": "Notification",
+            "Timestamp": "2022-02-18T08:27:17.407Z"
+        }
+
+        unsupported_data = {
+            "Message": "{\"unknown\": \"payload\"}",
+            "MessageId": "00000000-0000-0000-0000-000000000000",
+            "Type": "Notification"
+        }
+
+        batch_parsed_data = self.monitoring.Event.parse({
+            'options': {},
+            'data': {'Batch': [cloudwatch_data, health_data]}
+        })
+        print_json(batch_parsed_data)
+        print()
+
+        # A failed record gives an ERROR event, the other records of the batch are still parsed
+        batch_parsed_data = self.monitoring.Event.parse({
+            'options': {},
+            'data': {'Batch': [cloudwatch_data, unsupported_data]}
+        })
+        print_json(batch_parsed_data)
+        self.assertEqual(batch_parsed_data['results'][-1]['event_type'], 'ERROR')
+
+    def test_parse_sqs_records(self):
+        health_data = {
+            "TopicArn": "arn:aws:sns:ap-southeast-2:1234567890:phd-info-dev",
+            "Message": "{\"version\": \"0\", \"id\": \"7bf73129-1428-4cd3-a780-95db273d1602\", \"detail-type\": \"AWS Health Event\", \"source\": \"aws.health\", \"account\": \"123456789012\", \"time\": \"2016-06-05T06:27:57Z\", \"region\": \"ap-southeast-2\", \"resources\": [], \"detail\": {\"eventArn\": \"arn:aws:health:ap-southeast-2::event/AWS_ELASTICLOADBALANCING_API_ISSUE_90353408594353980\", \"service\": \"ELASTICLOADBALANCING\", \"eventTypeCode\": \"AWS_ELASTICLOADBALANCING_API_ISSUE\", \"eventTypeCategory\": \"issue\", \"startTime\": \"Sat, 04 Jun 2016 05:01:10 GMT\", \"eventDescription\": [{\"language\": \"en_US\", \"latestDescription\": \"A description of the event will be provided here\"}]}}",
+            "MessageId": "9c3f1b7e-2f6a-4d0e-9b5c-0a8e4f6d2c11",
+            "Type": "Notification",
+            "Timestamp": "2022-02-18T08:27:17.407Z"
+        }
+
+        records = [
+            {'eventSource': 'aws:sqs', 'messageId': 'sqs-1', 'body': json.dumps(health_data)},
+            {'eventSource': 'aws:sqs', 'messageId': 'sqs-2', 'body': health_data['Message']}
+        ]
+
+        records_parsed_data = self.monitoring.Event.parse({'options': {}, 'data': {'Records': records}})
+        print_json(records_parsed_data)
+        print()
+
+    def test_parse_replayed_message(self):
+        health_data = {
+            "TopicArn": "arn:aws:sns:ap-southeast-2:1234567890:phd-info-dev",
+            "Message": "{\"version\": \"0\", \"id\": \"7bf73129-1428-4cd3-a780-95db273d1602\", \"detail-type\": \"AWS Health Event\", \"source\": \"aws.health\", \"account\": \"123456789012\", \"time\": \"2016-06-05T06:27:57Z\", \"region\": \"ap-southeast-2\", \"resources\": [], \"detail\": {\"eventArn\": \"arn:aws:health:ap-southeast-2::event/AWS_ELASTICLOADBALANCING_API_ISSUE_90353408594353980\", \"service\": \"ELASTICLOADBALANCING\", \"eventTypeCode\": \"AWS_ELASTICLOADBALANCING_API_ISSUE\", \"eventTypeCategory\": \"issue\", \"startTime\": \"Sat, 04 Jun 2016 05:01:10 GMT\", \"eventDescription\": [{\"language\": \"en_US\", \"latestDescription\": \"A description of the event will be provided here\"}]}}",
+            "MessageId": "5a0d6b3c-6d41-4bb4-a2a4-4a3e1f0e4f10",
+            "Type": "Notification",
+            "Timestamp": "2022-02-18T08:27:17.407Z"
+        }
+
+        parsed_data = self.monitoring.Event.parse({'options': {}, 'data': health_data})
+        replayed_data = self.monitoring.Event.parse({'options': {}, 'data': health_data})
+        print_json(replayed_data)
+        print()
+
+        self.assertEqual(parsed_data, replayed_data)
+
 
 if __name__ == "__main__":
     unittest.main(testRunner=RichTestRunner)
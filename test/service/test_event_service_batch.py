@@ -0,0 +1,88 @@
+import json
+import logging
+import os
+import sys
+import types
+import unittest
+
+from spaceone.core import config
+from spaceone.core.unittest.runner import RichTestRunner
+
+from spaceone.monitoring.info.event_info import BatchEventsInfo
+from spaceone.monitoring.service.event_service import EventService
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'manager'))
+
+from test_cloudwatch_event_manager import CLOUDWATCH_MESSAGE
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _make_envelope(message_id, message):
+    return {'Type': 'Notification', 'MessageId': message_id, 'Message': json.dumps(message)}
+
+
+class TestEventServiceBatch(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        config.init_conf(package='spaceone.monitoring')
+        config.set_service_config()
+        config.set_global(MESSAGE_CACHE={'enabled': False}, EVENT_SUPPRESSION={'enabled': False})
+
+    def setUp(self):
+        self.event_service = EventService()
+
+    def test_parse_batch(self):
+        batch_results = list(self.event_service.parse_batch({'options': {}, 'data': {'Batch': [
+            _make_envelope('message-1', CLOUDWATCH_MESSAGE),
+            _make_envelope('message-2', dict(CLOUDWATCH_MESSAGE, NewStateValue='OK'))
+        ]}}))
+
+        self.assertEqual([batch_result['message_id'] for batch_result in batch_results], ['message-1', 'message-2'])
+        self.assertEqual([batch_result['events'][0]['event_type'] for batch_result in batch_results],
+                         ['ALERT', 'RECOVERY'])
+
+    def test_stream_records(self):
+        batch_results = self.event_service.parse_batch({'options': {}, 'data': {'Batch': [
+            _make_envelope('message-1', CLOUDWATCH_MESSAGE),
+            {'Type': 'Notification', 'MessageId': 'message-2', 'Message': '{invalid'}
+        ]}})
+
+        self.assertIsInstance(batch_results, types.GeneratorType)
+        self.assertEqual(next(batch_results)['message_id'], 'message-1')
+        self.assertIn('error', next(batch_results))
+
+    def test_report_failed_records(self):
+        batch_results = list(self.event_service.parse_batch({'options': {}, 'data': {'Records': [
+            {'eventSource': 'aws:sqs', 'messageId': 'sqs-1',
+             'body': json.dumps(_make_envelope('message-1', CLOUDWATCH_MESSAGE))},
+            {'eventSource': 'aws:sqs', 'messageId': 'sqs-2', 'body': '{"unknown": "payload"}'},
+            {'eventSource': 'aws:sqs', 'messageId': 'sqs-3', 'body': '{invalid'}
+        ]}}))
+
+        self.assertEqual([batch_result['message_id'] for batch_result in batch_results],
+                         ['message-1', 'sqs-2', 'sqs-3'])
+        self.assertNotIn('error', batch_results[0])
+        self.assertEqual(batch_results[0]['events'][0]['event_type'], 'ALERT')
+
+        for index, batch_result in enumerate(batch_results[1:], 1):
+            [error_event] = batch_result['events']
+            self.assertIn('error', batch_result)
+            self.assertEqual(error_event['event_type'], 'ERROR')
+            self.assertEqual(error_event['additional_info']['batch_index'], str(index))
+
+    def test_encode_failed_records(self):
+        batch_results = self.event_service.parse_batch({'options': {}, 'data': {'Batch': [
+            _make_envelope('message-1', CLOUDWATCH_MESSAGE),
+            _make_envelope('message-2', {'unknown': 'payload'})
+        ]}})
+
+        events_info = BatchEventsInfo(batch_results)
+
+        self.assertEqual([event_info.event_type for event_info in events_info.results], ['ALERT', 'ERROR'])
+        self.assertEqual(events_info.results[1].event_key, 'message-2')
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)
@@ -0,0 +1,122 @@
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import unittest
+
+from spaceone.core.unittest.runner import RichTestRunner
+
+_LOGGER = logging.getLogger(__name__)
+
+# What `spaceone grpc spaceone.monitoring` imports before the first request
+STARTUP_MODULES = [
+    'spaceone.monitoring.conf.global_conf',
+    'spaceone.monitoring.conf.proto_conf',
+    'spaceone.monitoring.api.plugin.event',
+    'spaceone.monitoring.api.plugin.webhook',
+    'spaceone.monitoring.service',
+    'spaceone.monitoring.manager',
+    'spaceone.monitoring.connector',
+    'spaceone.monitoring.info',
+    'spaceone.monitoring.model'
+]
+
+# Loaded on first use only (schematics and requests may still come with spaceone-core itself)
+LAZY_MODULES = [
+    'cryptography',
+    'ijson',
+    'spaceone.monitoring.manager.cloudwatch_event_manager',
+    'spaceone.monitoring.manager.phd_event_manager',
+    'spaceone.monitoring.manager.signature_manager',
+    'spaceone.monitoring.manager.subscription_manager',
+    'spaceone.monitoring.connector.sns_connector',
+    'spaceone.monitoring.model.cloudwatch_event_response_model',
+    'spaceone.monitoring.model.phd_event_response_model'
+]
+
+# Imported before the clock starts, so that the budget only covers this package
+DEPENDENCIES = [
+    'schematics',
+    'spaceone.core.service',
+    'spaceone.core.pygrpc',
+    'spaceone.core.manager',
+    'spaceone.core.connector',
+    'spaceone.api.monitoring.plugin.event_pb2_grpc',
+    'spaceone.api.monitoring.plugin.webhook_pb2_grpc'
+]
+
+# Import time of STARTUP_MODULES once DEPENDENCIES are loaded
+STARTUP_BUDGET_MS = float(os.environ.get('AWS_SNS_WEBHOOK_STARTUP_BUDGET_MS', 30))
+RUNS = 3
+
+# Runs in a fresh interpreter, the lazy imports go through importlib.import_module and
+# only show up in sys.modules
+_STARTUP_SCRIPT = '''
+import importlib
+import json
+import sys
+import time
+
+for module_name in {dependencies!r}:
+    importlib.import_module(module_name)
+
+started = time.perf_counter()
+for module_name in {startup_modules!r}:
+    importlib.import_module(module_name)
+import_time = (time.perf_counter() - started) * 1000
+
+startup_modules = sorted(sys.modules)
+
+from spaceone.monitoring.manager.event_router import route_message
+route_message({{"source": "aws.health"}})
+
+json.dump({{"import_time": import_time, "startup_modules": startup_modules,
+           "routed_modules": sorted(sys.modules)}}, sys.stdout)
+'''
+
+
+def run_startup():
+    """
+    Import STARTUP_MODULES in a fresh interpreter, then route one message
+
+    Returns:
+        {
+            'import_time': milliseconds to import STARTUP_MODULES,
+            'startup_modules': sys.modules after the imports,
+            'routed_modules': sys.modules after the first routing
+        }
+    """
+
+    script = _STARTUP_SCRIPT.format(dependencies=DEPENDENCIES, startup_modules=STARTUP_MODULES)
+    completed = subprocess.run([sys.executable, '-c', script], stdout=subprocess.PIPE, universal_newlines=True,
+                               check=True)
+
+    return json.loads(completed.stdout)
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_lazy_modules_not_imported_at_startup(self):
+        startup_modules = set(run_startup()['startup_modules'])
+
+        for module_name in LAZY_MODULES:
+            self.assertNotIn(module_name, startup_modules, f'{module_name} is imported at startup')
+
+    def test_startup_import_time_budget(self):
+        import_time = statistics.median(run_startup()['import_time'] for _ in range(RUNS))
+
+        _LOGGER.info(f'[test_startup_import_time_budget] {import_time:.2f}ms (budget = {STARTUP_BUDGET_MS}ms)')
+        self.assertLessEqual(import_time, STARTUP_BUDGET_MS)
+
+    def test_first_routing_imports_managers(self):
+        startup = run_startup()
+
+        self.assertNotIn('spaceone.monitoring.manager.phd_event_manager', startup['startup_modules'])
+        self.assertIn('spaceone.monitoring.manager.phd_event_manager', startup['routed_modules'])
+        self.assertNotIn('spaceone.monitoring.manager.signature_manager', startup['routed_modules'])
+
+
+if __name__ == "__main__":
+    unittest.main(testRunner=RichTestRunner)